@@ -2,5 +2,6 @@
 from __future__ import annotations
 
 from .eph.base_core import build_base_core
+from .eph.batch import build_base_core_batch, chart_fingerprint
 
-__all__ = ["build_base_core"]
+__all__ = ["build_base_core", "build_base_core_batch", "chart_fingerprint"]
@@ -0,0 +1,208 @@
+"""Capture of ``build_base_core`` and ``compute_houses`` inputs for replay.
+
+While a :class:`Capture` is active, every ``build_base_core`` payload and every
+top-level ``compute_houses`` request is appended to a JSON Lines file, one
+``{"kind": ..., "input": ...}`` record per call, for replay by
+:mod:`astrocore.loadtest`.  ``compute_houses`` calls given a precomputed
+``geometry`` come from inside the library and are not recorded.
+
+Records are anonymized by default: the day of month and the clock time of
+payloads are replaced by random values (year and month are kept), a request
+``jd_ut`` is moved by up to :data:`JD_JITTER_DAYS`, coordinates are rounded
+to ``location_decimals`` and the elevation to 100 m.  Anonymization fails
+closed: a date that is not ``YYYY-MM-DD`` and a non-numeric ``jd_ut``,
+coordinate or elevation are dropped rather than written as given.  Fields
+outside the input schema, unknown settings keys included, are dropped in
+either mode.  Settings, zones, house systems and
+options are kept as they shape the load.
+
+When no capture is active :func:`record` is a single global check.
+"""
+from __future__ import annotations
+
+import json
+import random
+import re
+import threading
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+from .settings import CoreSettingsModel
+
+BUILD_BASE_CORE = "build_base_core"
+COMPUTE_HOUSES = "compute_houses"
+KINDS = (BUILD_BASE_CORE, COMPUTE_HOUSES)
+
+JD_JITTER_DAYS = 15.0
+
+PAYLOAD_FIELDS = (
+    "date",
+    "time",
+    "tz_offset_hours",
+    "tz_name",
+    "latitude_deg",
+    "longitude_deg",
+    "elevation_m",
+    "settings",
+)
+REQUEST_FIELDS = (
+    "jd_ut",
+    "latitude_deg",
+    "longitude_deg",
+    "ayanamsa",
+    "house_system",
+    "backend",
+    "options",
+)
+
+_DATE = re.compile(r"^(-?\d{1,4})-(\d{1,2})-\d{1,2}$")
+
+_active: "Capture | None" = None
+_active_lock = threading.Lock()
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _coarsen(out: Dict[str, Any], key: str, decimals: int) -> None:
+    """Round ``out[key]`` to ``decimals``; drop it when it is not a number."""
+    if key in out:
+        if _number(out[key]):
+            out[key] = round(float(out[key]), decimals)
+        else:
+            del out[key]
+
+
+class Capture:
+    """Append anonymized call inputs to a JSON Lines file.
+
+    Use as a context manager (or :meth:`start` and :meth:`stop`); only one
+    capture is active per process.
+
+    Args:
+        path: Output file; records are appended.
+        anonymize: Apply the anonymization of the module docstring.
+        sample_rate: Fraction of calls recorded, chosen at random.
+        location_decimals: Decimals kept of latitude and longitude.
+        seed: Seed of the random generator used for sampling and anonymization.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        anonymize: bool = True,
+        sample_rate: float = 1.0,
+        location_decimals: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.anonymize = anonymize
+        self.sample_rate = sample_rate
+        self.location_decimals = location_decimals
+        self.records = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start(self) -> "Capture":
+        global _active
+        with _active_lock:
+            if _active is not None:
+                raise RuntimeError("a capture is already active")
+            self._file = self.path.open("a", encoding="utf-8")
+            _active = self
+        return self
+
+    def stop(self) -> int:
+        """Stop recording and close the file; returns the number of records."""
+        global _active
+        with _active_lock:
+            if _active is self:
+                _active = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        return self.records
+
+    def __enter__(self) -> "Capture":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _payload(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        out = {k: payload[k] for k in PAYLOAD_FIELDS if k in payload}
+        if "settings" in out:
+            settings = out["settings"]
+            if isinstance(settings, Mapping):
+                out["settings"] = {k: v for k, v in settings.items() if k in CoreSettingsModel.model_fields}
+            else:
+                del out["settings"]
+        if not self.anonymize:
+            return out
+        if "date" in out:
+            match = _DATE.match(str(out["date"]))
+            if match:
+                out["date"] = f"{match[1]}-{int(match[2]):02d}-{self._rng.randint(1, 28):02d}"
+            else:
+                del out["date"]
+        if "time" in out:
+            out["time"] = f"{self._rng.randrange(24):02d}:{self._rng.randrange(60):02d}"
+        for key in ("latitude_deg", "longitude_deg"):
+            _coarsen(out, key, self.location_decimals)
+        _coarsen(out, "elevation_m", -2)
+        return out
+
+    def _request(self, request: Mapping[str, Any]) -> Dict[str, Any]:
+        out = {k: request[k] for k in REQUEST_FIELDS if k in request}
+        if not self.anonymize:
+            return out
+        if "jd_ut" in out:
+            if _number(out["jd_ut"]):
+                out["jd_ut"] = out["jd_ut"] + self._rng.uniform(-JD_JITTER_DAYS, JD_JITTER_DAYS)
+            else:
+                del out["jd_ut"]
+        for key in ("latitude_deg", "longitude_deg"):
+            _coarsen(out, key, self.location_decimals)
+        return out
+
+    def record(self, kind: str, data: Any) -> None:
+        """Write one record of ``kind`` (see :data:`KINDS`)."""
+        if is_dataclass(data):
+            data = asdict(data)
+        with self._lock:
+            if self._file is None:
+                return
+            if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+                return
+            data = self._payload(data) if kind == BUILD_BASE_CORE else self._request(data)
+            self._file.write(json.dumps({"kind": kind, "input": data}, default=str) + "\n")
+            self.records += 1
+
+
+def record(kind: str, data: Any) -> None:
+    """Record a call with the active :class:`Capture`, if any."""
+    capture = _active
+    if capture is not None:
+        capture.record(kind, data)
+
+
+def active() -> "Capture | None":
+    """Return the active :class:`Capture`, or ``None``."""
+    return _active
+
+
+__all__ = [
+    "BUILD_BASE_CORE",
+    "COMPUTE_HOUSES",
+    "KINDS",
+    "JD_JITTER_DAYS",
+    "PAYLOAD_FIELDS",
+    "REQUEST_FIELDS",
+    "Capture",
+    "record",
+    "active",
+]
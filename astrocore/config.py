@@ -14,3 +14,49 @@ AYANAMSA_MAP = {
     "Lahiri": swe.SIDM_LAHIRI,
     "Krishnamurti": swe.SIDM_KRISHNAMURTI,
 }
+
+# Accuracy tiers selectable through ``CoreSettingsModel.accuracy`` and the
+# Swiss Ephemeris source each of them reads from.
+#   swiss        - Swiss Ephemeris files (reference).
+#   moshier      - Moshier analytic theory, no file I/O; within ~3" of the
+#                  file positions for 1900-2100.
+#   interpolated - cached Swiss samples (1 day, 6 h for Moon/true node) with
+#                  Hermite interpolation; longitude within ~0.5", latitude
+#                  within ~30" of the file positions.
+ACCURACY_FLAGS = {
+    "swiss": swe.FLG_SWIEPH,
+    "moshier": swe.FLG_MOSEPH,
+    "interpolated": swe.FLG_SWIEPH,
+}
+
+# Ephemeris bodies selectable through ``CoreSettingsModel.bodies``.  ``Rahu``
+# and ``Ketu`` are derived from the node selected by ``node_type``.
+BODY_CODES = {
+    "Sun": swe.SUN,
+    "Moon": swe.MOON,
+    "Mercury": swe.MERCURY,
+    "Venus": swe.VENUS,
+    "Mars": swe.MARS,
+    "Jupiter": swe.JUPITER,
+    "Saturn": swe.SATURN,
+    "Uranus": swe.URANUS,
+    "Neptune": swe.NEPTUNE,
+    "Pluto": swe.PLUTO,
+    "Chiron": swe.CHIRON,
+    "TrueNode": swe.TRUE_NODE,
+    "MeanNode": swe.MEAN_NODE,
+}
+DERIVED_BODIES = ("Rahu", "Ketu")
+DEFAULT_BODIES = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "TrueNode",
+    "MeanNode",
+    "Rahu",
+    "Ketu",
+)
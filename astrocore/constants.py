@@ -29,6 +29,21 @@ GEOMETRY_KEYS = {
     RAMC_DEG,
 }
 
+# Planet output fields
+LON_TROPICAL_DEG = "lon_tropical_deg"
+LAT_TROPICAL_DEG = "lat_tropical_deg"
+DISTANCE_AU = "distance_au"
+SPEED_LON_DEG_PER_DAY = "speed_lon_deg_per_day"
+LON_SIDEREAL_DEG = "lon_sidereal_deg"
+
+PLANET_FIELDS = (
+    LON_TROPICAL_DEG,
+    LAT_TROPICAL_DEG,
+    DISTANCE_AU,
+    SPEED_LON_DEG_PER_DAY,
+    LON_SIDEREAL_DEG,
+)
+
 __all__ = [
     "ASC_DEG_SID",
     "MC_DEG_SID",
@@ -41,4 +56,10 @@ __all__ = [
     "LST_HOURS",
     "RAMC_DEG",
     "GEOMETRY_KEYS",
+    "LON_TROPICAL_DEG",
+    "LAT_TROPICAL_DEG",
+    "DISTANCE_AU",
+    "SPEED_LON_DEG_PER_DAY",
+    "LON_SIDEREAL_DEG",
+    "PLANET_FIELDS",
 ]
@@ -0,0 +1,142 @@
+"""Astrocartography: where on the globe each planet is angular.
+
+For a moment, the MC and IC lines of a body are the meridians where local
+sidereal time equals its right ascension (or that plus 180°), and the
+Ascendant and Descendant lines are where its hour angle is minus or plus the
+semi-diurnal arc ``H0`` with ``cos H0 = -tan(lat) tan(dec)``.  Right
+ascension and declination come from the ecliptic positions of
+:func:`compute_planets` with the obliquity and Greenwich sidereal time of
+:func:`compute_time_geometry`, so a whole map costs one set of planet
+calculations and a few array operations per latitude sample instead of one
+locked ``swe.houses`` call per grid cell.
+
+With ``zodiacal=True`` ecliptic latitude is ignored, which places each body
+on the Ascendant or MC of :func:`compute_axes` exactly; the default
+(in mundo) uses the true declination.  Refraction is not applied.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from ..constants import AYANAMSA_DEG, EPSILON_DEG, GST_HOURS
+from ..settings import CoreSettingsModel
+from . import swiss
+from .base_core import compute_time_geometry
+from .planets import compute_planets
+
+ANGLES = ("MC", "IC", "ASC", "DSC")
+DEFAULT_LAT_STEP_DEG = 1.0
+DEFAULT_MAX_LAT_DEG = 85.0
+
+
+def equatorial(
+    lon_deg: np.ndarray, lat_deg: np.ndarray, epsilon_deg: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert ecliptic longitude and latitude to right ascension and declination."""
+    lam, beta = np.radians(lon_deg), np.radians(lat_deg)
+    eps = np.radians(epsilon_deg)
+    ra = np.arctan2(np.sin(lam) * np.cos(eps) - np.tan(beta) * np.sin(eps), np.cos(lam))
+    dec = np.arcsin(np.sin(beta) * np.cos(eps) + np.cos(beta) * np.sin(eps) * np.sin(lam))
+    return np.degrees(ra) % 360.0, np.degrees(dec)
+
+
+def _wrap180(values: np.ndarray) -> np.ndarray:
+    return (values + 180.0) % 360.0 - 180.0
+
+
+def _polylines(latitudes: np.ndarray, longitudes: np.ndarray) -> List[List[List[float]]]:
+    """Split one sampled line at gaps (NaN) and at the ±180° meridian."""
+    idx = np.flatnonzero(~np.isnan(longitudes))
+    if idx.size == 0:
+        return []
+    lon = longitudes[idx]
+    breaks = np.flatnonzero((np.diff(idx) != 1) | (np.abs(np.diff(lon)) > 180.0)) + 1
+    points = np.column_stack([latitudes[idx], lon])
+    return [part.tolist() for part in np.split(points, breaks) if len(part) > 1]
+
+
+def angular_lines(
+    planets: Mapping[str, Mapping[str, float]],
+    geometry: Mapping[str, float],
+    lat_step_deg: float = DEFAULT_LAT_STEP_DEG,
+    max_lat_deg: float = DEFAULT_MAX_LAT_DEG,
+    zodiacal: bool = False,
+    angles: Sequence[str] = ANGLES,
+) -> List[Dict[str, Any]]:
+    """Return the angular lines of each body as polylines.
+
+    Args:
+        planets: ``compute_planets`` output.  Bodies without
+            ``lon_tropical_deg`` (Rahu, Ketu) use ``lon_sidereal_deg`` plus
+            the ayanamsa; a missing latitude counts as zero.
+        geometry: ``compute_time_geometry`` (or ``compute_geometry``) output
+            for the same moment.
+        lat_step_deg: Spacing of the latitude samples.
+        max_lat_deg: Samples run from ``-max_lat_deg`` to ``max_lat_deg``.
+        zodiacal: Ignore ecliptic latitude (see the module docstring).
+        angles: Subset of :data:`ANGLES`.
+
+    Returns:
+        One dict per body and angle with ``body``, ``angle`` and
+        ``polylines``: lists of ``[latitude_deg, longitude_deg]`` points, east
+        longitude in ``[-180, 180)``.  Ascendant and Descendant lines stop
+        where the body is circumpolar.
+    """
+    unknown = set(angles) - set(ANGLES)
+    if unknown:
+        raise ValueError(f"unknown angles: {', '.join(sorted(unknown))}")
+    names = list(planets)
+    lon = np.array(
+        [
+            p["lon_tropical_deg"] if "lon_tropical_deg" in p
+            else p["lon_sidereal_deg"] + geometry[AYANAMSA_DEG]
+            for p in planets.values()
+        ]
+    )
+    lat = np.zeros(lon.size) if zodiacal else np.array(
+        [p.get("lat_tropical_deg", 0.0) for p in planets.values()]
+    )
+    ra, dec = equatorial(lon, lat, geometry[EPSILON_DEG])
+    gst_deg = geometry[GST_HOURS] * 15.0
+
+    n = int(round(max_lat_deg / lat_step_deg))
+    latitudes = np.linspace(-n * lat_step_deg, n * lat_step_deg, 2 * n + 1)
+    # bodies x latitudes
+    with np.errstate(invalid="ignore"):
+        cos_h0 = -np.tan(np.radians(latitudes))[None, :] * np.tan(np.radians(dec))[:, None]
+        h0 = np.degrees(np.arccos(np.where(np.abs(cos_h0) <= 1.0, cos_h0, np.nan)))
+    culmination = ra - gst_deg
+    columns = {
+        "MC": np.repeat(_wrap180(culmination)[:, None], latitudes.size, axis=1),
+        "IC": np.repeat(_wrap180(culmination + 180.0)[:, None], latitudes.size, axis=1),
+        "ASC": _wrap180(culmination[:, None] - h0),
+        "DSC": _wrap180(culmination[:, None] + h0),
+    }
+    return [
+        {"body": name, "angle": angle, "polylines": _polylines(latitudes, columns[angle][i])}
+        for i, name in enumerate(names)
+        for angle in angles
+    ]
+
+
+def astrocartography(
+    jd_ut: float,
+    settings: CoreSettingsModel | None = None,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Compute planets and geometry for ``jd_ut`` and return :func:`angular_lines`.
+
+    ``settings`` selects bodies, ayanamsa and accuracy as for
+    ``build_base_core``; the positions are geocentric.
+    """
+    settings = settings or CoreSettingsModel()
+    swiss.init_ephemeris(ayanamsa=settings.ayanamsa, sidereal=settings.sidereal)
+    geometry = compute_time_geometry(jd_ut, settings.ayanamsa)
+    settings = settings.model_copy(update={"topocentric": False})
+    planets = compute_planets(jd_ut, settings, geometry[AYANAMSA_DEG], 0.0, 0.0)
+    return angular_lines(planets, geometry, **kwargs)
+
+
+__all__ = ["ANGLES", "equatorial", "angular_lines", "astrocartography"]
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from time import perf_counter
-from typing import Dict
+from typing import Any, Dict, List
 
 import swisseph as swe
 
+from .. import capture
 from ..settings import CoreSettingsModel
-from ..utils.time import compute_time
+from ..utils.time import payload_time
 from ..types import BaseInput, CoreOutput
 from ..constants import (
     AYANAMSA_DEG,
@@ -17,37 +18,113 @@ from ..constants import (
     RAMC_DEG,
 )
 from . import swiss
-from .planets import compute_planets
+from .manager import get_manager
+from .planets import compute_planets, planet_plan
 from .axes import compute_axes
 
 
-def compute_geometry(
-    jd_ut: float, latitude_deg: float, longitude_deg: float
-) -> Dict[str, float]:
-    """Compute geometric quantities for the moment."""
-    ayanamsa_deg = swiss.get_ayanamsa(jd_ut)
-    epsilon = swiss.ecl_nut(jd_ut)[0]
-    gst_hours = swiss.sidtime(jd_ut)
-    lst_hours = (gst_hours + longitude_deg / 15.0) % 24.0
+def compute_time_geometry(jd_ut: float, ayanamsa: str | None = None) -> Dict[str, float]:
+    """Compute the location-independent part of :func:`compute_geometry`."""
+    return {
+        AYANAMSA_DEG: swiss.get_ayanamsa(jd_ut, ayanamsa),
+        EPSILON_DEG: swiss.ecl_nut(jd_ut)[0],
+        GST_HOURS: swiss.sidtime(jd_ut),
+    }
+
+
+def locate_geometry(time_geometry: Dict[str, float], longitude_deg: float) -> Dict[str, float]:
+    """Complete a :func:`compute_time_geometry` result for a longitude."""
+    lst_hours = (time_geometry[GST_HOURS] + longitude_deg / 15.0) % 24.0
     ramc_deg = (lst_hours * 15.0) % 360.0
     return {
-        AYANAMSA_DEG: ayanamsa_deg,
-        EPSILON_DEG: epsilon,
-        GST_HOURS: gst_hours,
+        AYANAMSA_DEG: time_geometry[AYANAMSA_DEG],
+        EPSILON_DEG: time_geometry[EPSILON_DEG],
+        GST_HOURS: time_geometry[GST_HOURS],
         LST_HOURS: lst_hours,
         RAMC_DEG: ramc_deg,
     }
 
 
+def compute_geometry(
+    jd_ut: float, latitude_deg: float, longitude_deg: float, ayanamsa: str | None = None
+) -> Dict[str, float]:
+    """Compute geometric quantities for the moment.
+
+    ``ayanamsa`` names the sidereal mode; ``None`` uses the current one.
+    """
+    return locate_geometry(compute_time_geometry(jd_ut, ayanamsa), longitude_deg)
+
+
+def ephemeris_meta(jd_ut: float, settings: CoreSettingsModel) -> Dict[str, Any]:
+    """Validate file coverage for ``jd_ut`` and describe the ephemeris used.
+
+    Raises:
+        EphemerisError: If the moment cannot be computed, or would need the
+            Moshier fallback while ``settings.strict_ephemeris`` is set.
+    """
+    plan = planet_plan(settings)
+    sources = get_manager().check(
+        jd_ut,
+        dict(plan.ephemeris),
+        strict=settings.strict_ephemeris,
+        moshier=settings.accuracy == "moshier",
+    )
+    return {
+        "accuracy": settings.accuracy,
+        "flags": plan.flags,
+        "sources": sources,
+    }
+
+
+def assemble_core(
+    payload: BaseInput,
+    settings: CoreSettingsModel,
+    t: Dict[str, Any],
+    geometry: Dict[str, float],
+    axes: Dict[str, float],
+    planets: Dict[str, Dict[str, float]],
+    house_system: str,
+    cusps_deg_sid: List[float],
+    calc_ms: float,
+    ephemeris: Dict[str, Any] | None = None,
+) -> CoreOutput:
+    """Assemble the ``build_base_core`` output contract."""
+    meta: Dict[str, Any] = {
+        "engine": "swisseph",
+        "versions": {"lib": swe.version},
+        "calc_ms": calc_ms,
+    }
+    if ephemeris is not None:
+        meta["ephemeris"] = ephemeris
+    return {
+        "time": t,
+        "location": {
+            "latitude_deg": payload["latitude_deg"],
+            "longitude_deg": payload["longitude_deg"],
+        },
+        "settings": settings.model_dump(),
+        "geometry": geometry,
+        "axes": axes,
+        "planets": planets,
+        "houses": {
+            "house_system": house_system,
+            "cusps_deg_sid": cusps_deg_sid,
+        },
+        "meta": meta,
+    }
+
+
 def build_base_core(payload: BaseInput) -> CoreOutput:
     """Main entry point to build base core data."""
+    capture.record(capture.BUILD_BASE_CORE, payload)
     settings = CoreSettingsModel(**payload.get("settings", {}))
     swiss.init_ephemeris(ayanamsa=settings.ayanamsa, sidereal=settings.sidereal)
 
     start = perf_counter()
-    t = compute_time(payload["date"], payload["time"], payload["tz_offset_hours"])
+    t = payload_time(payload)
+    ephemeris = ephemeris_meta(t["jd_ut"], settings)
     geometry = compute_geometry(
-        t["jd_ut"], payload["latitude_deg"], payload["longitude_deg"]
+        t["jd_ut"], payload["latitude_deg"], payload["longitude_deg"], settings.ayanamsa
     )
     axes = compute_axes(
         t["jd_ut"],
@@ -61,6 +138,7 @@ def build_base_core(payload: BaseInput) -> CoreOutput:
         geometry[AYANAMSA_DEG],
         payload["latitude_deg"],
         payload["longitude_deg"],
+        payload.get("elevation_m", 0.0),
     )
     from ..houses import HouseRequest, compute_houses
 
@@ -70,29 +148,27 @@ def build_base_core(payload: BaseInput) -> CoreOutput:
         longitude_deg=payload["longitude_deg"],
         ayanamsa=settings.ayanamsa,
     )
-    houses_data = compute_houses(houses_req)["houses"]
+    houses_data = compute_houses(houses_req, geometry=geometry)["houses"]
     calc_ms = (perf_counter() - start) * 1000.0
 
-    return {
-        "time": t,
-        "location": {
-            "latitude_deg": payload["latitude_deg"],
-            "longitude_deg": payload["longitude_deg"],
-        },
-        "settings": settings.model_dump(),
-        "geometry": geometry,
-        "axes": axes,
-        "planets": planets,
-        "houses": {
-            "house_system": houses_req.house_system,
-            "cusps_deg_sid": houses_data["cusps_deg_sid"],
-        },
-        "meta": {
-            "engine": "swisseph",
-            "versions": {"lib": swe.version},
-            "calc_ms": calc_ms,
-        },
-    }
+    return assemble_core(
+        payload,
+        settings,
+        t,
+        geometry,
+        axes,
+        planets,
+        houses_req.house_system,
+        houses_data["cusps_deg_sid"],
+        calc_ms,
+        ephemeris,
+    )
 
 
-__all__ = ["build_base_core", "compute_geometry"]
+__all__ = [
+    "build_base_core",
+    "assemble_core",
+    "compute_geometry",
+    "compute_time_geometry",
+    "locate_geometry",
+]
@@ -0,0 +1,112 @@
+"""Chart fingerprints and deduplicated batch computation.
+
+Bulk imports repeat the same birth data with different string formatting or
+time zone representation ("08:30" vs "08:30:00", 08:30 at ``+04:00`` vs 09:30 at
+``+05:00``).  :func:`chart_fingerprint` reduces a payload to what actually
+determines the chart: the moment (JD UT rounded to ``jd_precision_sec``), the
+rounded observer location and the normalised settings.
+:func:`build_base_core_batch` computes each fingerprint once and fans the
+result back out to every payload that shares it.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, MutableMapping
+
+from ..settings import CoreSettingsModel
+from ..types import BaseInput, CoreOutput
+from ..utils.time import payload_time
+from .base_core import build_base_core
+
+DEFAULT_JD_PRECISION_SEC = 1.0
+DEFAULT_COORD_DECIMALS = 6
+
+
+def _round(value: float, decimals: int) -> float:
+    # ``+ 0.0`` folds -0.0 into 0.0
+    return round(float(value), decimals) + 0.0
+
+
+def chart_fingerprint(
+    payload: BaseInput,
+    jd_ut: float | None = None,
+    jd_precision_sec: float = DEFAULT_JD_PRECISION_SEC,
+    coord_decimals: int = DEFAULT_COORD_DECIMALS,
+) -> str:
+    """Return a canonical hex fingerprint of the chart described by ``payload``.
+
+    Args:
+        payload: ``build_base_core`` input.
+        jd_ut: Moment of the chart if already known; computed otherwise.
+        jd_precision_sec: Moments closer than this share a fingerprint.
+        coord_decimals: Decimals kept of latitude, longitude and elevation.
+
+    Returns:
+        32 character hex digest, stable across processes and runs.
+    """
+    if jd_ut is None:
+        jd_ut = payload_time(payload)["jd_ut"]
+    settings = CoreSettingsModel(**payload.get("settings", {}))
+    longitude = (float(payload["longitude_deg"]) + 180.0) % 360.0 - 180.0
+    canonical = {
+        "jd": round(jd_ut * 86400.0 / jd_precision_sec),
+        "lat": _round(payload["latitude_deg"], coord_decimals),
+        "lon": _round(longitude, coord_decimals),
+        "elev": _round(payload.get("elevation_m", 0.0), coord_decimals),
+        "settings": settings.model_dump(),
+    }
+    text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _fan_out(core: CoreOutput, payload: BaseInput, t: Dict[str, Any]) -> CoreOutput:
+    """Copy ``core`` for a duplicate payload, keeping its own time and location."""
+    result = copy.deepcopy(core)
+    result["time"] = t
+    result["location"] = {
+        "latitude_deg": payload["latitude_deg"],
+        "longitude_deg": payload["longitude_deg"],
+    }
+    return result
+
+
+def build_base_core_batch(
+    payloads: Iterable[BaseInput],
+    cache: MutableMapping[str, CoreOutput] | None = None,
+    jd_precision_sec: float = DEFAULT_JD_PRECISION_SEC,
+    coord_decimals: int = DEFAULT_COORD_DECIMALS,
+) -> List[CoreOutput]:
+    """Run :func:`build_base_core` once per distinct chart in ``payloads``.
+
+    Results are returned in input order.  Payloads with equal fingerprints get
+    independent copies of one computation; only ``time`` and ``location`` are
+    taken from each payload itself.  ``cache``, keyed by
+    :func:`chart_fingerprint`, is consulted before and filled after computing.
+    """
+    payloads = list(payloads)
+    times = [payload_time(p) for p in payloads]
+    keys = [
+        chart_fingerprint(p, t["jd_ut"], jd_precision_sec, coord_decimals)
+        for p, t in zip(payloads, times)
+    ]
+    computed: Dict[str, CoreOutput] = {}
+    results: List[CoreOutput] = []
+    for payload, t, key in zip(payloads, times, keys):
+        core = computed.get(key)
+        if core is None and cache is not None:
+            core = cache.get(key)
+        if core is None:
+            core = build_base_core(payload)
+            if cache is not None:
+                cache[key] = copy.deepcopy(core)
+            computed[key] = core
+            results.append(core)
+            continue
+        computed[key] = core
+        results.append(_fan_out(core, payload, t))
+    return results
+
+
+__all__ = ["chart_fingerprint", "build_base_core_batch"]
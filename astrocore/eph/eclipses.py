@@ -0,0 +1,186 @@
+"""Solar and lunar eclipses and lunar occultations over date ranges.
+
+Each function chains one Swiss Ephemeris search routine through
+:func:`swiss.search_chain`.  The routines only examine the lunations near the
+lunar nodes and return the next event directly, so a range costs one call per
+event found, holding the ephemeris lock once per batch of events.
+Times are JD UT; contacts that do not occur are ``None``.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import swisseph as swe
+
+from . import swiss
+
+FLAGS = swe.FLG_SWIEPH
+
+# Checked in order: ECL_ANNULAR_TOTAL is reported together with other bits.
+ECLIPSE_TYPES = (
+    (swe.ECL_ANNULAR_TOTAL, "annular-total"),
+    (swe.ECL_TOTAL, "total"),
+    (swe.ECL_ANNULAR, "annular"),
+    (swe.ECL_PARTIAL, "partial"),
+    (swe.ECL_PENUMBRAL, "penumbral"),
+)
+
+
+def eclipse_type(retflag: int) -> str | None:
+    """Return the type name encoded in Swiss eclipse flags."""
+    for bit, name in ECLIPSE_TYPES:
+        if retflag & bit:
+            return name
+    return None
+
+
+def _jd(value: float) -> float | None:
+    return value if value > 0.0 else None
+
+
+def solar_eclipses(
+    jd_start: float, jd_end: float, ecltype: int = 0, flags: int = FLAGS
+) -> List[Dict[str, Any]]:
+    """Return global solar eclipses with maximum in ``[jd_start, jd_end]``.
+
+    ``ecltype`` restricts the search to Swiss ``ECL_*`` types (0 for all).
+    """
+    swiss.init_ephemeris()
+    found = swiss.search_chain(swe.sol_eclipse_when_glob, jd_start, jd_end, flags, ecltype)
+    return [
+        {
+            "jd_ut": tret[0],
+            "type": eclipse_type(res),
+            "central": bool(res & swe.ECL_CENTRAL),
+            "begin_jd_ut": _jd(tret[2]),
+            "end_jd_ut": _jd(tret[3]),
+            "totality_begin_jd_ut": _jd(tret[4]),
+            "totality_end_jd_ut": _jd(tret[5]),
+        }
+        for res, tret in found
+    ]
+
+
+def lunar_eclipses(
+    jd_start: float, jd_end: float, ecltype: int = 0, flags: int = FLAGS
+) -> List[Dict[str, Any]]:
+    """Return lunar eclipses with maximum in ``[jd_start, jd_end]``."""
+    swiss.init_ephemeris()
+    found = swiss.search_chain(swe.lun_eclipse_when, jd_start, jd_end, flags, ecltype)
+    return [
+        {
+            "jd_ut": tret[0],
+            "type": eclipse_type(res),
+            "penumbral_begin_jd_ut": _jd(tret[6]),
+            "penumbral_end_jd_ut": _jd(tret[7]),
+            "partial_begin_jd_ut": _jd(tret[2]),
+            "partial_end_jd_ut": _jd(tret[3]),
+            "totality_begin_jd_ut": _jd(tret[4]),
+            "totality_end_jd_ut": _jd(tret[5]),
+        }
+        for res, tret in found
+    ]
+
+
+def local_solar_eclipses(
+    jd_start: float,
+    jd_end: float,
+    latitude_deg: float,
+    longitude_deg: float,
+    elevation_m: float = 0.0,
+    flags: int = FLAGS,
+) -> List[Dict[str, Any]]:
+    """Return solar eclipses visible from a location, with local circumstances.
+
+    ``magnitude`` follows NASA, ``obscuration`` is the covered fraction of the
+    solar disc (the disc area ratio, above 1, for total eclipses) and
+    ``sun_altitude_deg`` is the apparent altitude at maximum.
+    """
+    swiss.init_ephemeris()
+    geopos = (longitude_deg, latitude_deg, elevation_m)
+    found = swiss.search_chain(swe.sol_eclipse_when_loc, jd_start, jd_end, geopos, flags)
+    return [
+        {
+            "jd_ut": tret[0],
+            "type": eclipse_type(res),
+            "max_visible": bool(res & swe.ECL_MAX_VISIBLE),
+            "contacts_jd_ut": [_jd(t) for t in tret[1:5]],
+            "magnitude": attr[8],
+            "obscuration": attr[2],
+            "sun_altitude_deg": attr[6],
+        }
+        for res, tret, attr in found
+    ]
+
+
+def local_lunar_eclipses(
+    jd_start: float,
+    jd_end: float,
+    latitude_deg: float,
+    longitude_deg: float,
+    elevation_m: float = 0.0,
+    flags: int = FLAGS,
+) -> List[Dict[str, Any]]:
+    """Return lunar eclipses observable from a location."""
+    swiss.init_ephemeris()
+    geopos = (longitude_deg, latitude_deg, elevation_m)
+    found = swiss.search_chain(swe.lun_eclipse_when_loc, jd_start, jd_end, geopos, flags)
+    return [
+        {
+            "jd_ut": tret[0],
+            "type": eclipse_type(res),
+            "begin_jd_ut": _jd(tret[6]),
+            "end_jd_ut": _jd(tret[7]),
+            "moonrise_jd_ut": _jd(tret[8]),
+            "moonset_jd_ut": _jd(tret[9]),
+            "umbral_magnitude": attr[0],
+            "penumbral_magnitude": attr[1],
+            "moon_altitude_deg": attr[6],
+        }
+        for res, tret, attr in found
+    ]
+
+
+def occultations(
+    body: int | str, jd_start: float, jd_end: float, flags: int = FLAGS
+) -> List[Dict[str, Any]]:
+    """Return occultations of a planet (or fixed star name) by the Moon."""
+    swiss.init_ephemeris()
+    found = swiss.search_chain(swe.lun_occult_when_glob, jd_start, jd_end, body, flags)
+    return [
+        {
+            "jd_ut": tret[0],
+            "type": eclipse_type(res),
+            "central": bool(res & swe.ECL_CENTRAL),
+            "begin_jd_ut": _jd(tret[2]),
+            "end_jd_ut": _jd(tret[3]),
+        }
+        for res, tret in found
+    ]
+
+
+def local_eclipses_many(
+    locations: Sequence[Dict[str, float]],
+    jd_start: float,
+    jd_end: float,
+    kind: str = "solar",
+) -> List[List[Dict[str, Any]]]:
+    """Run the local solar or lunar search for several locations.
+
+    Each location maps ``latitude_deg``, ``longitude_deg`` and optionally
+    ``elevation_m``.
+    """
+    search = {"solar": local_solar_eclipses, "lunar": local_lunar_eclipses}[kind]
+    return [search(jd_start, jd_end, **loc) for loc in locations]
+
+
+__all__ = [
+    "ECLIPSE_TYPES",
+    "eclipse_type",
+    "solar_eclipses",
+    "lunar_eclipses",
+    "local_solar_eclipses",
+    "local_lunar_eclipses",
+    "occultations",
+    "local_eclipses_many",
+]
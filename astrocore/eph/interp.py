@@ -0,0 +1,63 @@
+"""Cached, interpolated ephemeris backend.
+
+Positions are sampled on a fixed grid (with speeds) and cached; a request
+between two grid points is answered with cubic Hermite interpolation of the
+longitude and linear interpolation of latitude and distance.  Neighbouring
+charts reuse the same samples, so most requests do not touch Swiss Ephemeris.
+"""
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import swisseph as swe
+
+from . import swiss
+
+DEFAULT_STEP_DAYS = 1.0
+STEP_DAYS = {swe.MOON: 0.25, swe.TRUE_NODE: 0.25}
+
+
+@lru_cache(maxsize=65536)
+def _sample(body: int, index: int, step: float, flags: int) -> Tuple[float, float, float, float]:
+    data = swiss.calc_ut(index * step, body, flags | swe.FLG_SPEED)
+    return (
+        data["lon_deg"],
+        data["lat_deg"],
+        data["distance_au"],
+        data["speed_lon_deg_per_day"],
+    )
+
+
+def interpolate(jd_ut: float, body: int, flags: int) -> Dict[str, Any]:
+    """Return a :func:`swiss.calc_ut`-shaped position interpolated from samples."""
+    step = STEP_DAYS.get(body, DEFAULT_STEP_DAYS)
+    index = math.floor(jd_ut / step)
+    t = jd_ut / step - index
+    lon0, lat0, dist0, v0 = _sample(body, index, step, flags)
+    lon1, lat1, dist1, v1 = _sample(body, index + 1, step, flags)
+
+    dl = (lon1 - lon0 + 180.0) % 360.0 - 180.0
+    m0, m1 = v0 * step, v1 * step
+    t2, t3 = t * t, t * t * t
+    offset = (-2 * t3 + 3 * t2) * dl + (t3 - 2 * t2 + t) * m0 + (t3 - t2) * m1
+    slope = (-6 * t2 + 6 * t) * dl + (3 * t2 - 4 * t + 1) * m0 + (3 * t2 - 2 * t) * m1
+    return {
+        "lon_deg": (lon0 + offset) % 360.0,
+        "lat_deg": lat0 + (lat1 - lat0) * t,
+        "distance_au": dist0 + (dist1 - dist0) * t,
+        "speed_lon_deg_per_day": slope / step,
+    }
+
+
+def cache_info():
+    """Return ``functools`` cache statistics of the sample cache."""
+    return _sample.cache_info()
+
+
+def cache_clear() -> None:
+    _sample.cache_clear()
+
+
+__all__ = ["interpolate", "cache_info", "cache_clear", "STEP_DAYS", "DEFAULT_STEP_DAYS"]
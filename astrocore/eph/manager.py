@@ -0,0 +1,342 @@
+"""Ephemeris file discovery, coverage checks and preloading.
+
+Swiss Ephemeris files are named ``<kind><era><century>.se1`` where kind is
+``sepl`` (planets), ``semo`` (Moon) or ``seas`` (main asteroids), era is ``_``
+for AD and ``m`` for BC, and each file covers 600 years from the given
+century.  When a file is missing for a date Swiss Ephemeris silently switches
+to the Moshier analytic theory for planets and the Moon and fails outright for
+asteroids, deep inside ``swe.calc_ut``.  :class:`EphemerisManager` makes that
+visible up front.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..config import DEFAULT_EPHE_PATH
+from ..errors import EphemerisError
+from . import swiss
+
+logger = logging.getLogger(__name__)
+
+_FILE_RE = re.compile(r"^(sepl|semo|seas)([_m])(\d{2})\.se1$")
+KIND_BY_PREFIX = {"sepl": "planets", "semo": "moon", "seas": "asteroids"}
+FILE_SPAN_YEARS = 600
+
+# Range of the Moshier fallback theory (years).
+MOSHIER_YEARS = (-3000, 3000)
+CHECK_CACHE_SIZE = 1024
+
+# Bodies computed analytically, without any ephemeris file.
+ANALYTIC_BODIES = frozenset({swe.MEAN_NODE, swe.MEAN_APOG})
+# Bodies derived from the lunar ephemeris.
+MOON_BODIES = frozenset({swe.MOON, swe.TRUE_NODE, swe.OSCU_APOG})
+
+
+@dataclass(frozen=True)
+class EphemerisFile:
+    name: str
+    kind: str
+    start_year: int
+    end_year: int
+    start_jd: float
+    end_jd: float
+    size_bytes: int
+
+
+def body_kind(body: int) -> str | None:
+    """Return the ephemeris file kind needed for ``body`` (``None`` if analytic)."""
+    if body in ANALYTIC_BODIES:
+        return None
+    if body in MOON_BODIES:
+        return "moon"
+    if swe.CHIRON <= body <= swe.VESTA or body > swe.AST_OFFSET:
+        return "asteroids"
+    return "planets"
+
+
+def _year_jd(year: int) -> float:
+    return swe.julday(year, 1, 1, 0.0)
+
+
+class EphemerisManager:
+    """Inventory and coverage of the Swiss Ephemeris files in one directory."""
+
+    def __init__(self, ephe_path: str | Path | None = None) -> None:
+        self.path = Path(ephe_path or DEFAULT_EPHE_PATH)
+        self.files: List[EphemerisFile] = self._scan()
+        self._coverage = self._merge()
+        # Between two edges file coverage and the Moshier range do not change.
+        self._edges = sorted(
+            {float(e) for spans in self._coverage.values() for e in spans.ravel()}
+            | {_year_jd(MOSHIER_YEARS[0]), _year_jd(MOSHIER_YEARS[1])}
+        )
+        self._checks: "OrderedDict[Tuple[Any, ...], Dict[str, str]]" = OrderedDict()
+        self.check_stats = {"hits": 0, "misses": 0}
+        self._maps: List[mmap.mmap] = []
+
+    def _scan(self) -> List[EphemerisFile]:
+        files = []
+        if not self.path.is_dir():
+            return files
+        for entry in sorted(self.path.iterdir()):
+            m = _FILE_RE.match(entry.name)
+            if not m:
+                continue
+            prefix, era, century = m.groups()
+            start = int(century) * 100 * (-1 if era == "m" else 1)
+            end = start + FILE_SPAN_YEARS
+            files.append(
+                EphemerisFile(
+                    name=entry.name,
+                    kind=KIND_BY_PREFIX[prefix],
+                    start_year=start,
+                    end_year=end,
+                    start_jd=_year_jd(start),
+                    end_jd=_year_jd(end),
+                    size_bytes=entry.stat().st_size,
+                )
+            )
+        return files
+
+    def _merge(self) -> Dict[str, np.ndarray]:
+        """Merge file ranges per kind into sorted, disjoint ``(start, end)`` rows."""
+        coverage: Dict[str, np.ndarray] = {}
+        for kind in KIND_BY_PREFIX.values():
+            spans = sorted((f.start_jd, f.end_jd) for f in self.files if f.kind == kind)
+            merged: List[List[float]] = []
+            for start, end in spans:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            coverage[kind] = np.asarray(merged, dtype=float).reshape(-1, 2)
+        return coverage
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def covered(self, kind: str, jd_ut) -> np.ndarray:
+        """Return a boolean array telling which ``jd_ut`` values have files."""
+        jd = np.atleast_1d(np.asarray(jd_ut, dtype=float))
+        spans = self._coverage[kind]
+        if spans.shape[0] == 0:
+            return np.zeros(jd.shape, dtype=bool)
+        idx = np.searchsorted(spans[:, 0], jd, side="right") - 1
+        ok = idx >= 0
+        return ok & (jd < spans[np.maximum(idx, 0), 1])
+
+    def report(self) -> Dict[str, object]:
+        """Describe available files and merged coverage per kind (in years)."""
+        coverage = {
+            kind: [
+                (f.start_year, f.end_year)
+                for f in sorted(self.files, key=lambda f: f.start_year)
+                if f.kind == kind
+            ]
+            for kind in KIND_BY_PREFIX.values()
+        }
+        return {
+            "path": str(self.path),
+            "files": [f.name for f in self.files],
+            "coverage_years": coverage,
+            "preloaded_bytes": sum(len(m) for m in self._maps),
+        }
+
+    def log_report(self) -> None:
+        info = self.report()
+        files = ", ".join(info["files"]) or "no files"
+        logger.info("ephemeris path %s: %s", info["path"], files)
+        for kind, spans in info["coverage_years"].items():
+            if not spans:
+                fallback = "Moshier fallback" if kind != "asteroids" else "unavailable"
+                logger.info("ephemeris %s: no files (%s)", kind, fallback)
+
+    # ------------------------------------------------------------------
+    # Startup helpers
+    # ------------------------------------------------------------------
+
+    def init(
+        self, ayanamsa: str = "Lahiri", sidereal: bool = True, preload: bool = False
+    ) -> None:
+        """Initialise Swiss Ephemeris on this path, log coverage, optionally preload."""
+        swiss.init_ephemeris(str(self.path), ayanamsa=ayanamsa, sidereal=sidereal)
+        if preload:
+            self.preload()
+        self.log_report()
+
+    def preload(self, use_mmap: bool = True) -> int:
+        """Pull all ephemeris files into the OS page cache.
+
+        With ``use_mmap`` the files stay memory-mapped for the lifetime of the
+        manager; otherwise they are read once.  Empty (truncated) files are
+        skipped with a warning.  Returns the number of bytes touched.
+        """
+        total = 0
+        for f in self.files:
+            with open(self.path / f.name, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    logger.warning("ephemeris file %s is empty, not preloaded", f.name)
+                    continue
+                if use_mmap:
+                    mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    for offset in range(0, len(mm), mmap.PAGESIZE):
+                        mm[offset]
+                    self._maps.append(mm)
+                    total += len(mm)
+                else:
+                    while chunk := fh.read(1 << 20):
+                        total += len(chunk)
+        return total
+
+    def close(self) -> None:
+        for mm in self._maps:
+            mm.close()
+        self._maps.clear()
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def sources(
+        self, jd_ut: float, bodies: Mapping[str, int], moshier: bool = False
+    ) -> Dict[str, str]:
+        """Return ``swiss``, ``moshier`` or ``analytic`` for each body at ``jd_ut``.
+
+        With ``moshier`` the Moshier theory is requested instead of files.
+        """
+        result: Dict[str, str] = {}
+        cache: Dict[str, bool] = {}
+        for name, code in bodies.items():
+            kind = body_kind(code)
+            if kind is None:
+                result[name] = "analytic"
+                continue
+            if moshier:
+                result[name] = "moshier"
+                continue
+            if kind not in cache:
+                cache[kind] = bool(self.covered(kind, jd_ut)[0])
+            result[name] = "swiss" if cache[kind] else "moshier"
+        return result
+
+    def validate(
+        self,
+        jd_uts: Iterable[float],
+        bodies: Iterable[int],
+        strict: bool = False,
+        moshier: bool = False,
+    ) -> Dict[str, str]:
+        """Check that a whole batch of moments can be computed.
+
+        Args:
+            jd_uts: Moments (UT) of the batch.
+            bodies: Swiss body codes that will be computed.
+            strict: Also reject moments that would use the Moshier fallback.
+            moshier: The Moshier theory is requested; only its range is checked.
+
+        Returns:
+            Mapping of required file kind to ``swiss`` or ``moshier``.
+
+        Raises:
+            EphemerisError: If any moment is outside the usable range.
+        """
+        jd = np.asarray(list(jd_uts), dtype=float)
+        kinds = {body_kind(b) for b in bodies} - {None}
+        used: Dict[str, str] = {}
+        lo, hi = _year_jd(MOSHIER_YEARS[0]), _year_jd(MOSHIER_YEARS[1])
+        for kind in sorted(kinds):
+            if moshier and kind != "asteroids":
+                missing = jd[(jd < lo) | (jd >= hi)]
+                if missing.size:
+                    raise EphemerisError(f"{_describe(missing)} outside the Moshier range")
+                used[kind] = "moshier"
+                continue
+            missing = jd[~self.covered(kind, jd)] if jd.size else jd
+            if missing.size == 0:
+                used[kind] = "swiss"
+                continue
+            span = _describe(missing)
+            if strict or kind == "asteroids":
+                raise EphemerisError(f"no {kind} ephemeris file in {self.path} for {span}")
+            if missing.min() < lo or missing.max() >= hi:
+                raise EphemerisError(f"{span} outside the Moshier fallback range")
+            used[kind] = "moshier"
+        return used
+
+
+    def check(
+        self,
+        jd_ut: float,
+        bodies: Mapping[str, int],
+        strict: bool = False,
+        moshier: bool = False,
+    ) -> Dict[str, str]:
+        """:meth:`validate` one moment and return its :meth:`sources`.
+
+        Results are cached per body set, options and coverage segment (the
+        span between two file or Moshier range edges) of ``jd_ut``, so
+        repeated charts skip the array work.  Failures are not cached.
+
+        Raises:
+            EphemerisError: As :meth:`validate`.
+        """
+        key = (tuple(bodies.items()), strict, moshier, bisect_right(self._edges, jd_ut))
+        cached = self._checks.get(key)
+        if cached is not None:
+            self.check_stats["hits"] += 1
+            return dict(cached)
+        self.check_stats["misses"] += 1
+        self.validate([jd_ut], bodies.values(), strict=strict, moshier=moshier)
+        sources = self.sources(jd_ut, bodies, moshier=moshier)
+        if math.isfinite(jd_ut):
+            self._checks[key] = sources
+            if len(self._checks) > CHECK_CACHE_SIZE:
+                self._checks.popitem(last=False)
+        return dict(sources)
+
+
+def _describe(jd: np.ndarray) -> str:
+    first = swe.revjul(float(jd.min()))
+    last = swe.revjul(float(jd.max()))
+    return f"{jd.size} moment(s) between years {first[0]} and {last[0]}"
+
+
+_manager: EphemerisManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_manager() -> EphemerisManager:
+    """Return the shared manager for :data:`DEFAULT_EPHE_PATH`.
+
+    The coverage report is logged when the manager is first created.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                manager = EphemerisManager()
+                manager.log_report()
+                _manager = manager
+    return _manager
+
+
+__all__ = [
+    "EphemerisFile",
+    "EphemerisManager",
+    "body_kind",
+    "get_manager",
+]
@@ -0,0 +1,318 @@
+"""Panchanga elements with exact start and end times over date ranges.
+
+Tithi and karana follow the elongation of the Moon from the Sun, nakshatra
+the sidereal Moon and yoga the sum of the sidereal Moon and Sun.  Each element
+is a :class:`_Timeline` of boundary crossings solved with safeguarded Newton
+iteration on that angle; timelines depend only on the moment, so one
+:class:`PanchangaEngine` serves every location.  Sun and Moon evaluations are
+memoised and shared by all elements, and tithi boundaries are every other
+karana boundary.
+
+Days run from sunrise to the next sunrise (:mod:`.riseset`).  A day record
+lists, per element, every span overlapping the day, the one prevailing at
+sunrise first.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+import swisseph as swe
+
+from derived.nakshatras import NAKSHATRAS
+from ..errors import CalculationError
+from . import swiss
+from .returns import wrap180
+from .riseset import rise_set
+
+_TITHI_NAMES = [
+    "Pratipada",
+    "Dwitiya",
+    "Tritiya",
+    "Chaturthi",
+    "Panchami",
+    "Shashthi",
+    "Saptami",
+    "Ashtami",
+    "Navami",
+    "Dashami",
+    "Ekadashi",
+    "Dwadashi",
+    "Trayodashi",
+    "Chaturdashi",
+]
+TITHIS = (
+    [f"Shukla {n}" for n in _TITHI_NAMES]
+    + ["Purnima"]
+    + [f"Krishna {n}" for n in _TITHI_NAMES]
+    + ["Amavasya"]
+)
+_MOVABLE_KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti"]
+KARANAS = ["Kimstughna"] + _MOVABLE_KARANAS * 8 + ["Shakuni", "Chatushpada", "Naga"]
+YOGAS = [
+    "Vishkambha",
+    "Priti",
+    "Ayushman",
+    "Saubhagya",
+    "Shobhana",
+    "Atiganda",
+    "Sukarma",
+    "Dhriti",
+    "Shula",
+    "Ganda",
+    "Vriddhi",
+    "Dhruva",
+    "Vyaghata",
+    "Harshana",
+    "Vajra",
+    "Siddhi",
+    "Vyatipata",
+    "Variyana",
+    "Parigha",
+    "Shiva",
+    "Siddha",
+    "Sadhya",
+    "Shubha",
+    "Shukla",
+    "Brahma",
+    "Indra",
+    "Vaidhriti",
+]
+# Indexed by ``date.weekday()`` (Monday first).
+VARAS = ["Somavara", "Mangalavara", "Budhavara", "Guruvara", "Shukravara", "Shanivara", "Ravivara"]
+
+# name: (Moon coefficient, Sun coefficient, sidereal, names, slowest rate deg/day)
+ELEMENTS: Dict[str, Tuple[int, int, bool, Sequence[str], float]] = {
+    "tithi": (1, -1, False, TITHIS, 10.0),
+    "nakshatra": (1, 0, True, NAKSHATRAS, 11.0),
+    "yoga": (1, 1, True, YOGAS, 12.0),
+    "karana": (1, -1, False, KARANAS, 10.0),
+}
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+TOL_DEG = 1e-6
+MAX_ITER = 50
+EVAL_CACHE_SIZE = 4096
+
+
+class _Timeline:
+    """Lazily extended boundaries of one element, sorted by time."""
+
+    def __init__(self, engine: "PanchangaEngine", name: str) -> None:
+        self.engine = engine
+        self.name = name
+        moon, sun, sidereal, names, min_rate = ELEMENTS[name]
+        self.coef = (moon, sun, sidereal)
+        self.names = names
+        self.span = 360.0 / len(names)
+        self.min_rate = min_rate
+        self.starts: List[float] = []
+        self.numbers: List[int] = []
+
+    def angle(self, jd_ut: float) -> Tuple[float, float]:
+        sun, sun_speed, moon, moon_speed, ayanamsa = self.engine.evaluate(jd_ut)
+        c_moon, c_sun, sidereal = self.coef
+        if sidereal:
+            sun, moon = sun - ayanamsa, moon - ayanamsa
+        return (c_moon * moon + c_sun * sun) % 360.0, c_moon * moon_speed + c_sun * sun_speed
+
+    def _solve(self, target: float, lo: float, hi: float, jd: float) -> float:
+        for _ in range(MAX_ITER):
+            a, rate = self.angle(jd)
+            f = wrap180(a - target)
+            if abs(f) <= TOL_DEG:
+                return jd
+            if f < 0.0:
+                lo = jd
+            else:
+                hi = jd
+            nxt = jd - f / rate if rate > 0.0 else hi + 1.0
+            if not lo < nxt < hi:
+                nxt = 0.5 * (lo + hi)
+            jd = nxt
+        raise CalculationError(f"{self.name} boundary {target} not found")
+
+    def _seed(self, jd_ut: float) -> None:
+        a, rate = self.angle(jd_ut)
+        k = int(a // self.span)
+        behind = a - k * self.span
+        lo = jd_ut - behind / self.min_rate
+        start = self._solve(k * self.span, lo, jd_ut, jd_ut - behind / rate)
+        self.starts, self.numbers = [start], [k]
+
+    def _next(self) -> None:
+        start, k = self.starts[-1], self.numbers[-1]
+        nxt = (k + 1) % len(self.names)
+        hi = start + self.span / self.min_rate
+        guess = start + self.span / self.angle(start)[1]
+        self.starts.append(self._solve(nxt * self.span, start, hi, min(guess, hi)))
+        self.numbers.append(nxt)
+
+    def spans(self, jd_from: float, jd_to: float) -> List[Dict[str, Any]]:
+        """Spans overlapping ``[jd_from, jd_to)``."""
+        if not self.starts or jd_from < self.starts[0]:
+            self._seed(jd_from)
+        while self.starts[-1] < jd_to:
+            self._next()
+        i = bisect_right(self.starts, jd_from) - 1
+        out = []
+        while self.starts[i] < jd_to:
+            k = self.numbers[i]
+            out.append(
+                {
+                    "number": k + 1,
+                    "name": self.names[k],
+                    "start_jd_ut": self.starts[i],
+                    "end_jd_ut": self.starts[i + 1],
+                }
+            )
+            i += 1
+        return out
+
+
+class _TithiTimeline(_Timeline):
+    """Tithi boundaries taken from every other karana boundary."""
+
+    def __init__(self, engine: "PanchangaEngine", karana: _Timeline) -> None:
+        super().__init__(engine, "tithi")
+        self.karana = karana
+
+    def spans(self, jd_from: float, jd_to: float) -> List[Dict[str, Any]]:
+        karana = self.karana
+        karana.spans(jd_from, jd_to)
+        i = bisect_right(karana.starts, jd_from) - 1
+        if i == 0 and karana.numbers[0] % 2:
+            # jd_from lies in the second karana of a tithi starting before the timeline
+            karana._seed(karana.starts[0] - 1e-4)
+            karana.spans(jd_from, jd_to)
+        while karana.numbers[-1] % 2 or karana.starts[-1] < jd_to:
+            karana._next()
+        self.starts = [s for s, n in zip(karana.starts, karana.numbers) if n % 2 == 0]
+        self.numbers = [n // 2 for n in karana.numbers if n % 2 == 0]
+        return super().spans(jd_from, jd_to)
+
+
+class PanchangaEngine:
+    """Shared timelines and Sun/Moon evaluations for one ayanamsa."""
+
+    def __init__(self, ayanamsa: str = "Lahiri") -> None:
+        self.ayanamsa = ayanamsa
+        self.stats = {"evaluations": 0, "hits": 0}
+        self._evals: "OrderedDict[float, Tuple[float, ...]]" = OrderedDict()
+        karana = _Timeline(self, "karana")
+        self.timelines: Dict[str, _Timeline] = {
+            "tithi": _TithiTimeline(self, karana),
+            "nakshatra": _Timeline(self, "nakshatra"),
+            "yoga": _Timeline(self, "yoga"),
+            "karana": karana,
+        }
+
+    def evaluate(self, jd_ut: float) -> Tuple[float, ...]:
+        """Return tropical Sun and Moon longitude and speed plus ayanamsa."""
+        cached = self._evals.get(jd_ut)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+        self.stats["evaluations"] += 1
+        sun = swiss.calc_ut(jd_ut, swe.SUN, FLAGS)
+        moon = swiss.calc_ut(jd_ut, swe.MOON, FLAGS)
+        value = (
+            sun["lon_deg"],
+            sun["speed_lon_deg_per_day"],
+            moon["lon_deg"],
+            moon["speed_lon_deg_per_day"],
+            swiss.get_ayanamsa(jd_ut, self.ayanamsa),
+        )
+        self._evals[jd_ut] = value
+        if len(self._evals) > EVAL_CACHE_SIZE:
+            self._evals.popitem(last=False)
+        return value
+
+    def at(self, jd_ut: float) -> Dict[str, Dict[str, Any]]:
+        """Return the span of every element in effect at ``jd_ut``."""
+        return {name: t.spans(jd_ut, jd_ut + 1e-9)[0] for name, t in self.timelines.items()}
+
+    def days(
+        self,
+        latitude_deg: float,
+        longitude_deg: float,
+        start_date: date | str,
+        end_date: date | str | None = None,
+        tz_offset_hours: float | None = None,
+        tz_name: str | None = None,
+        elevation_m: float = 0.0,
+        hindu: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one panchanga record per local date, sunrise to next sunrise.
+
+        Location and time zone arguments are those of :func:`rise_set`.
+        Dates without a sunrise yield records with ``None`` times and empty
+        element lists.
+        """
+        swiss.init_ephemeris()
+        sunrises = rise_set(
+            latitude_deg,
+            longitude_deg,
+            start_date,
+            end_date,
+            tz_offset_hours=tz_offset_hours,
+            tz_name=tz_name,
+            elevation_m=elevation_m,
+            events=["sunrise"],
+            hindu=hindu,
+        )
+        for day in sunrises:
+            start, end = day["sunrise_jd_ut"], day["next_sunrise_jd_ut"]
+            record: Dict[str, Any] = {
+                "date": day["date"],
+                "vara": VARAS[date.fromisoformat(day["date"]).weekday()],
+                "sunrise_jd_ut": start,
+                "next_sunrise_jd_ut": end,
+            }
+            for name, timeline in self.timelines.items():
+                record[name] = [] if start is None or end is None else timeline.spans(start, end)
+            yield record
+
+
+def panchanga(
+    latitude_deg: float,
+    longitude_deg: float,
+    start_date: date | str,
+    end_date: date | str | None = None,
+    ayanamsa: str = "Lahiri",
+    **kwargs: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Yield panchanga day records for one location (see :meth:`PanchangaEngine.days`)."""
+    engine = PanchangaEngine(ayanamsa)
+    return engine.days(latitude_deg, longitude_deg, start_date, end_date, **kwargs)
+
+
+def panchanga_many(
+    locations: Sequence[Mapping[str, Any]],
+    start_date: date | str,
+    end_date: date | str | None = None,
+    ayanamsa: str = "Lahiri",
+    **kwargs: Any,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(location_index, record)`` for several locations.
+
+    All locations share one engine, so each boundary is solved once.
+    """
+    engine = PanchangaEngine(ayanamsa)
+    for i, location in enumerate(locations):
+        for record in engine.days(start_date=start_date, end_date=end_date, **location, **kwargs):
+            yield i, record
+
+
+__all__ = [
+    "TITHIS",
+    "KARANAS",
+    "YOGAS",
+    "VARAS",
+    "ELEMENTS",
+    "PanchangaEngine",
+    "panchanga",
+    "panchanga_many",
+]
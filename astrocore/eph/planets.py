@@ -3,24 +3,151 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import swisseph as swe
 
+from ..config import ACCURACY_FLAGS, BODY_CODES, DEFAULT_BODIES, DERIVED_BODIES
+from ..constants import (
+    DISTANCE_AU,
+    LON_SIDEREAL_DEG,
+    LON_TROPICAL_DEG,
+    PLANET_FIELDS,
+    SPEED_LON_DEG_PER_DAY,
+)
+from ..errors import InvalidInputError
 from ..settings import CoreSettingsModel
 from ..utils.angles import mod360
-from . import swiss
+from . import interp, stars, swiss
+from .topo import observer_geometry, parallax_correct
+
+NODES = ("TrueNode", "MeanNode")
+NODE_FIELDS = (LON_TROPICAL_DEG, LON_SIDEREAL_DEG)
+DERIVED_FIELDS = (LON_SIDEREAL_DEG,)
+
+
+@dataclass(frozen=True)
+class PlanetPlan:
+    """Compiled body set, Swiss flags and per-body output fields."""
+
+    ephemeris: Tuple[Tuple[str, int], ...]
+    fixed_stars: Tuple[str, ...]
+    output: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    node_key: str
+    flags: int
+    accuracy: str = "swiss"
+
+
+@lru_cache(maxsize=256)
+def compile_plan(
+    bodies: Tuple[str, ...] = DEFAULT_BODIES,
+    node_type: str = "TRUE",
+    speed: bool = True,
+    fields: Tuple[str, ...] = PLANET_FIELDS,
+    fixed_stars: Tuple[str, ...] = (),
+    accuracy: str = "swiss",
+) -> PlanetPlan:
+    """Return the :class:`PlanetPlan` for a body set; cached per argument set.
+
+    Raises:
+        InvalidInputError: If a fixed star is not in :func:`stars.get_catalog`.
+    """
+
+    if fixed_stars:
+        catalog = stars.get_catalog()
+        unknown = [s for s in fixed_stars if s.lower() not in catalog.index]
+        if unknown:
+            raise InvalidInputError(
+                f"unknown fixed stars: {', '.join(unknown)} (catalog: {catalog.source})"
+            )
+    node_key = "TrueNode" if node_type == "TRUE" else "MeanNode"
+    needed = [b for b in bodies if b in BODY_CODES]
+    if any(b in DERIVED_BODIES for b in bodies) and node_key not in needed:
+        needed.append(node_key)
+
+    selected = [f for f in PLANET_FIELDS if f in fields]
+    if not speed:
+        selected = [f for f in selected if f != SPEED_LON_DEG_PER_DAY]
+    planet_fields = tuple(selected)
+    node_fields = tuple(f for f in selected if f in NODE_FIELDS)
+    derived_fields = tuple(f for f in selected if f in DERIVED_FIELDS)
+
+    output = []
+    for name in bodies:
+        if name in DERIVED_BODIES:
+            output.append((name, derived_fields))
+        elif name in NODES:
+            output.append((name, node_fields))
+        else:
+            output.append((name, planet_fields))
+    star_fields = tuple(f for f in planet_fields if f != DISTANCE_AU)
+    output.extend((star, star_fields) for star in fixed_stars)
+
+    flags = ACCURACY_FLAGS[accuracy] | (swe.FLG_SPEED if speed else 0)
+    return PlanetPlan(
+        ephemeris=tuple((name, BODY_CODES[name]) for name in needed),
+        fixed_stars=tuple(fixed_stars),
+        output=tuple(output),
+        node_key=node_key,
+        flags=flags,
+        accuracy=accuracy,
+    )
+
+
+def planet_plan(settings: CoreSettingsModel) -> PlanetPlan:
+    """Return the shared compiled plan for ``settings``."""
+    return compile_plan(
+        DEFAULT_BODIES if settings.bodies is None else tuple(settings.bodies),
+        settings.node_type,
+        settings.speed,
+        PLANET_FIELDS if settings.fields is None else tuple(settings.fields),
+        tuple(settings.fixed_stars),
+        settings.accuracy,
+    )
+
+
+def _star_positions(
+    names: Tuple[str, ...], jd_ut: float, speed: bool
+) -> Dict[str, Dict[str, float]]:
+    """Catalog positions of fixed stars; the speed is the change over one day."""
+    catalog = stars.get_catalog()
+    now = catalog.positions(jd_ut, bucket_days=0)
+    later = catalog.positions(jd_ut + 1.0, bucket_days=0) if speed else now
+    out = {}
+    for name in names:
+        i = catalog.find(name)
+        lon = float(now.lon_deg[i])
+        out[name] = {
+            "lon_deg": lon,
+            "lat_deg": float(now.lat_deg[i]),
+            "speed_lon_deg_per_day": (float(later.lon_deg[i]) - lon + 180.0) % 360.0 - 180.0,
+        }
+    return out
 
-PLANETS = {
-    "Sun": swe.SUN,
-    "Moon": swe.MOON,
-    "Mercury": swe.MERCURY,
-    "Venus": swe.VENUS,
-    "Mars": swe.MARS,
-    "Jupiter": swe.JUPITER,
-    "Saturn": swe.SATURN,
-}
 
+def _apply_parallax(
+    positions: List[Dict[str, float]],
+    jd_ut: float,
+    latitude_deg: float,
+    longitude_deg: float,
+    elevation_m: float,
+) -> List[Dict[str, float]]:
+    lst_deg, epsilon_deg = observer_geometry(jd_ut, longitude_deg)
+    lon, lat, dist = parallax_correct(
+        [p["lon_deg"] for p in positions],
+        [p["lat_deg"] for p in positions],
+        [p["distance_au"] for p in positions],
+        latitude_deg,
+        lst_deg,
+        epsilon_deg,
+        elevation_m,
+    )
+    return [
+        {**p, "lon_deg": float(lo), "lat_deg": float(la), "distance_au": float(d)}
+        for p, lo, la, d in zip(positions, lon, lat, dist)
+    ]
 
 
 def compute_planets(
@@ -29,47 +156,68 @@ def compute_planets(
     ayanamsa_deg: float,
     latitude_deg: float,
     longitude_deg: float,
-
+    elevation_m: float = 0.0,
 ) -> Dict[str, Dict[str, float]]:
-    """Compute planetary positions."""
-    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    """Compute planetary positions.
+
+    Only the bodies, flags and fields selected through ``settings.bodies``,
+    ``settings.speed``, ``settings.fields`` and ``settings.fixed_stars`` are
+    computed (see :func:`compile_plan`); by default the seven classical
+    planets, both nodes and Rahu/Ketu are returned.  ``settings.accuracy``
+    selects Swiss files, the Moshier theory or the interpolated cache
+    (:mod:`.interp`); the Swiss topocentric path always calls Swiss directly.
+
+    With ``settings.topocentric`` the positions are topocentric: either from
+    Swiss Ephemeris with the observer set under the ephemeris lock
+    (``topocentric_method="swiss"``) or by a parallax correction of the
+    geocentric positions (``"parallax"``).  The parallax path keeps the
+    geocentric ``speed_lon_deg_per_day``.
+
+    Fixed stars come from :func:`stars.get_catalog` (``sefstars.txt`` when
+    present, else the built-in bright stars) and carry no ``distance_au``.
+    Chiron needs the asteroid file ``seas_18.se1`` in the ephemeris
+    directory; without it the Swiss call raises :class:`EphemerisError`.
+    """
+    plan = planet_plan(settings)
+    flags = plan.flags
     # if settings.sidereal:
     #     flags |= swe.FLG_SIDEREAL
-    if settings.topocentric:
-
-        swe.set_topo(longitude_deg, latitude_deg, 0)
-
-        flags |= swe.FLG_TOPOCTR
+    names = [name for name, _ in plan.ephemeris]
+    topo_swiss = settings.topocentric and settings.topocentric_method == "swiss"
+    if topo_swiss:
+        items = [(jd_ut, code) for _, code in plan.ephemeris]
+        positions = swiss.calc_ut_topo(items, flags, longitude_deg, latitude_deg, elevation_m)
+    elif plan.accuracy == "interpolated":
+        positions = [interp.interpolate(jd_ut, code, flags) for _, code in plan.ephemeris]
+    else:
+        positions = [swiss.calc_ut(jd_ut, code, flags) for _, code in plan.ephemeris]
+    raw = dict(zip(names, positions))
+    if settings.topocentric and not topo_swiss:
+        bodies = [n for n in names if n not in NODES]
+        corrected = _apply_parallax(
+            [raw[n] for n in bodies], jd_ut, latitude_deg, longitude_deg, elevation_m
+        )
+        raw.update(zip(bodies, corrected))
+    if plan.fixed_stars:
+        raw.update(_star_positions(plan.fixed_stars, jd_ut, bool(flags & swe.FLG_SPEED)))
 
     result: Dict[str, Dict[str, float]] = {}
-    for name, code in PLANETS.items():
-        data = swiss.calc_ut(jd_ut, code, flags)
-        result[name] = {
-
-            "lon_tropical_deg": data["lon_deg"],
-            "lat_tropical_deg": data["lat_deg"],
-            "distance_au": data["distance_au"],
-            "speed_lon_deg_per_day": data["speed_lon_deg_per_day"],
-            "lon_sidereal_deg": mod360(data["lon_deg"] - ayanamsa_deg),
-
-        }
-
-    for node_name, node_code in ("TrueNode", swe.TRUE_NODE), ("MeanNode", swe.MEAN_NODE):
-        data = swiss.calc_ut(jd_ut, node_code, flags)
-        result[node_name] = {
-
-            "lon_tropical_deg": data["lon_deg"],
-            "lon_sidereal_deg": mod360(data["lon_deg"] - ayanamsa_deg),
-
-        }
-
-    node_key = "TrueNode" if settings.node_type == "TRUE" else "MeanNode"
-    rahu_lon = result[node_key]["lon_sidereal_deg"]
-    result["Rahu"] = {"lon_sidereal_deg": rahu_lon}
-    result["Ketu"] = {"lon_sidereal_deg": mod360(rahu_lon + 180.0)}
+    for name, fields in plan.output:
+        if name in DERIVED_BODIES:
+            rahu_lon = mod360(raw[plan.node_key]["lon_deg"] - ayanamsa_deg)
+            lon = rahu_lon if name == "Rahu" else mod360(rahu_lon + 180.0)
+            record = {LON_SIDEREAL_DEG: lon}
+        else:
+            data = raw[name]
+            record = {
+                "lon_tropical_deg": data["lon_deg"],
+                "lat_tropical_deg": data["lat_deg"],
+                "distance_au": data.get("distance_au"),
+                "speed_lon_deg_per_day": data["speed_lon_deg_per_day"],
+                "lon_sidereal_deg": mod360(data["lon_deg"] - ayanamsa_deg),
+            }
+        result[name] = {f: record[f] for f in fields}
     return result
 
 
-
-__all__ = ["compute_planets"]
-
+__all__ = ["compute_planets", "compile_plan", "planet_plan", "PlanetPlan"]
@@ -0,0 +1,255 @@
+"""Solar/lunar returns and secondary progressions via root finding.
+
+The moment a body reaches a target longitude is found with Newton iteration on
+``speed_lon_deg_per_day`` from :func:`swiss.calc_ut`, safeguarded by bisection
+inside a window around the initial guess.  The window must contain a single
+direct-motion crossing, which always holds for the Sun and the Moon.  Batches
+reuse the previous solution to seed the next guess, so a return typically
+costs two or three ephemeris calls.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import swisseph as swe
+
+from ..config import AYANAMSA_MAP
+from ..errors import CalculationError
+from . import swiss
+
+TROPICAL_YEAR_DAYS = 365.24219
+SIDEREAL_YEAR_DAYS = 365.25636
+TROPICAL_MONTH_DAYS = 27.321582
+SIDEREAL_MONTH_DAYS = 27.321662
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+def wrap180(value: float) -> float:
+    """Normalize value to -180..180 degrees."""
+    return (value + 180.0) % 360.0 - 180.0
+
+
+def body_longitude(
+    jd_ut: float, body: int, ayanamsa: str | None = None, flags: int = DEFAULT_FLAGS
+) -> Dict[str, float]:
+    """Return longitude and speed of ``body``, sidereal when ``ayanamsa`` is set."""
+    data = swiss.calc_ut(jd_ut, body, flags)
+    lon = data["lon_deg"]
+    if ayanamsa is not None:
+        lon = (lon - swiss.get_ayanamsa(jd_ut, ayanamsa)) % 360.0
+    return {"lon_deg": lon, "speed_lon_deg_per_day": data["speed_lon_deg_per_day"]}
+
+
+def _prepare(ayanamsa: str | None) -> None:
+    swiss.init_ephemeris()
+    if ayanamsa is not None and ayanamsa not in AYANAMSA_MAP:
+        raise ValueError(f"unknown ayanamsa {ayanamsa}")
+
+
+def find_longitude(
+    body: int,
+    target_deg: float,
+    jd_guess: float,
+    *,
+    ayanamsa: str | None = None,
+    window_days: float = 5.0,
+    tol_deg: float = 1e-6,
+    max_iter: int = 40,
+    flags: int = DEFAULT_FLAGS,
+) -> Dict[str, Any]:
+    """Find when ``body`` reaches ``target_deg`` near ``jd_guess``.
+
+    Args:
+        body: Swiss Ephemeris body code.
+        target_deg: Target longitude (sidereal when ``ayanamsa`` is set).
+        jd_guess: Initial guess (UT).
+        ayanamsa: Ayanamsa name for sidereal targets, ``None`` for tropical.
+        window_days: Half width of the bisection window around the guess.
+        tol_deg: Convergence tolerance on longitude.
+        max_iter: Maximum number of ephemeris evaluations.
+        flags: Swiss Ephemeris flags; must include ``FLG_SPEED``.
+
+    Returns:
+        Dictionary with ``jd_ut``, ``lon_deg``, ``iterations`` and ``method``
+        (``"newton"`` or ``"bisection"`` when a fallback step was taken).
+    """
+
+    _prepare(ayanamsa)
+    return _solve(body, target_deg, jd_guess, ayanamsa, window_days, tol_deg, max_iter, flags)
+
+
+def _solve(
+    body: int,
+    target_deg: float,
+    jd: float,
+    ayanamsa: str | None,
+    window_days: float,
+    tol_deg: float,
+    max_iter: int,
+    flags: int,
+) -> Dict[str, Any]:
+    lo, hi = jd - window_days, jd + window_days
+    method = "newton"
+    for iteration in range(1, max_iter + 1):
+        data = body_longitude(jd, body, ayanamsa, flags)
+        f = wrap180(data["lon_deg"] - target_deg)
+        if abs(f) <= tol_deg:
+            return {
+                "jd_ut": jd,
+                "lon_deg": data["lon_deg"],
+                "iterations": iteration,
+                "method": method,
+            }
+        # Direct motion: a negative residual means the crossing lies later.
+        if f < 0.0:
+            lo = max(lo, jd)
+        else:
+            hi = min(hi, jd)
+        speed = data["speed_lon_deg_per_day"]
+        nxt = jd - f / speed if speed > 0.0 else hi + 1.0
+        if not lo < nxt < hi:
+            nxt = 0.5 * (lo + hi)
+            method = "bisection"
+        jd = nxt
+    raise CalculationError(
+        f"longitude {target_deg} of body {body} not reached within {max_iter} iterations"
+    )
+
+
+def find_longitudes(
+    body: int,
+    targets_deg: Sequence[float],
+    jd_guesses: Sequence[float],
+    *,
+    ayanamsa: str | None = None,
+    window_days: float = 5.0,
+    tol_deg: float = 1e-6,
+    flags: int = DEFAULT_FLAGS,
+) -> List[Dict[str, Any]]:
+    """Batch version of :func:`find_longitude` for many charts."""
+    if len(targets_deg) != len(jd_guesses):
+        raise ValueError("targets_deg and jd_guesses differ in length")
+    _prepare(ayanamsa)
+    return [
+        _solve(body, target, guess, ayanamsa, window_days, tol_deg, 40, flags)
+        for target, guess in zip(targets_deg, jd_guesses)
+    ]
+
+
+def _extrapolate(
+    start_jd: float, now: Dict[str, float], target_deg: float
+) -> Tuple[float, float]:
+    """Guess the next crossing from the current speed and size its window.
+
+    The window grows with the extrapolated interval because the true speed of
+    the Sun and the Moon deviates from the current one by up to ~15 %.
+    """
+    speed = now["speed_lon_deg_per_day"]
+    if speed <= 0.0:
+        raise CalculationError("crossing search requires direct motion")
+    dt = ((target_deg - now["lon_deg"]) % 360.0) / speed
+    return start_jd + dt, 1.0 + 0.2 * dt
+
+
+def solar_returns(
+    natal_jd_ut: float,
+    years: Iterable[int],
+    *,
+    ayanamsa: str | None = None,
+    tol_deg: float = 1e-6,
+    flags: int = DEFAULT_FLAGS,
+) -> List[Dict[str, Any]]:
+    """Return solar returns for the given year offsets from birth.
+
+    Each result carries ``year_offset`` in addition to the fields of
+    :func:`find_longitude`.
+    """
+
+    _prepare(ayanamsa)
+    period = TROPICAL_YEAR_DAYS if ayanamsa is None else SIDEREAL_YEAR_DAYS
+    target = body_longitude(natal_jd_ut, swe.SUN, ayanamsa, flags)["lon_deg"]
+
+    results: List[Dict[str, Any]] = []
+    prev: Dict[str, Any] | None = None
+    for year in sorted(years):
+        if prev is None:
+            guess = natal_jd_ut + year * period
+        else:
+            guess = prev["jd_ut"] + (year - prev["year_offset"]) * period
+        res = _solve(swe.SUN, target, guess, ayanamsa, 5.0, tol_deg, 40, flags)
+        res["year_offset"] = year
+        results.append(res)
+        prev = res
+    return results
+
+
+def lunar_returns(
+    natal_jd_ut: float,
+    start_jd_ut: float,
+    count: int,
+    *,
+    ayanamsa: str | None = None,
+    tol_deg: float = 1e-6,
+    flags: int = DEFAULT_FLAGS,
+) -> List[Dict[str, Any]]:
+    """Return ``count`` successive lunar returns after ``start_jd_ut``."""
+
+    _prepare(ayanamsa)
+    period = TROPICAL_MONTH_DAYS if ayanamsa is None else SIDEREAL_MONTH_DAYS
+    target = body_longitude(natal_jd_ut, swe.MOON, ayanamsa, flags)["lon_deg"]
+    now = body_longitude(start_jd_ut, swe.MOON, ayanamsa, flags)
+    guess, window = _extrapolate(start_jd_ut, now, target)
+
+    results: List[Dict[str, Any]] = []
+    for _ in range(count):
+        res = _solve(swe.MOON, target, guess, ayanamsa, window, tol_deg, 40, flags)
+        results.append(res)
+        guess, window = res["jd_ut"] + period, 4.0
+    return results
+
+
+def progressed_jd(natal_jd_ut: float, jd_ut: float) -> float:
+    """Return the secondary-progressed moment (a day for a year) for ``jd_ut``."""
+    return natal_jd_ut + (jd_ut - natal_jd_ut) / TROPICAL_YEAR_DAYS
+
+
+def progressed_crossing(
+    body: int,
+    target_deg: float,
+    natal_jd_ut: float,
+    after_jd_ut: float,
+    *,
+    ayanamsa: str | None = None,
+    tol_deg: float = 1e-6,
+    flags: int = DEFAULT_FLAGS,
+) -> Dict[str, Any]:
+    """Find when the progressed ``body`` next reaches ``target_deg``.
+
+    The result holds the progressed ``jd_ut`` from :func:`find_longitude` plus
+    ``event_jd_ut``, the real-world moment it corresponds to.
+    """
+
+    _prepare(ayanamsa)
+    start = progressed_jd(natal_jd_ut, after_jd_ut)
+    now = body_longitude(start, body, ayanamsa, flags)
+    guess, window = _extrapolate(start, now, target_deg)
+    res = _solve(body, target_deg, guess, ayanamsa, window, tol_deg, 40, flags)
+    res["event_jd_ut"] = natal_jd_ut + (res["jd_ut"] - natal_jd_ut) * TROPICAL_YEAR_DAYS
+    return res
+
+
+__all__ = [
+    "TROPICAL_YEAR_DAYS",
+    "SIDEREAL_YEAR_DAYS",
+    "TROPICAL_MONTH_DAYS",
+    "SIDEREAL_MONTH_DAYS",
+    "wrap180",
+    "body_longitude",
+    "find_longitude",
+    "find_longitudes",
+    "solar_returns",
+    "lunar_returns",
+    "progressed_jd",
+    "progressed_crossing",
+]
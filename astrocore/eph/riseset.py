@@ -0,0 +1,189 @@
+"""Sunrise, sunset, moonrise and moonset over date ranges.
+
+Days are local civil dates: each event is the first one after local midnight
+and before the next local midnight, or ``None`` when it does not happen that
+day (or the body is circumpolar).  ``next_sunrise_jd_ut`` closes the Vedic day
+that starts at ``sunrise_jd_ut``.
+
+Results are cached per event, rounded location and date, so overlapping
+ranges and repeated cities only search the missing days.  The searches of one
+call run as a single batch under the Swiss Ephemeris lock;
+:func:`rise_set_many` spreads cities over worker processes.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import swisseph as swe
+
+from ..utils.time import JD_UNIX_EPOCH
+from ..utils.tz import resolve_offset
+from . import swiss
+
+EVENTS: Dict[str, Tuple[int, int]] = {
+    "sunrise": (swe.SUN, swe.CALC_RISE),
+    "sunset": (swe.SUN, swe.CALC_SET),
+    "moonrise": (swe.MOON, swe.CALC_RISE),
+    "moonset": (swe.MOON, swe.CALC_SET),
+}
+LOCATION_DECIMALS = 4
+CACHE_SIZE = 1 << 18
+
+_cache: "OrderedDict[Tuple[Any, ...], float | None]" = OrderedDict()
+_cache_lock = threading.Lock()
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def _as_date(value: date | str) -> date:
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _midnight_offsets(
+    days: List[date],
+    longitude_deg: float,
+    tz_offset_hours: float | None,
+    tz_name: str | None,
+) -> List[int]:
+    """UTC offset (seconds) in effect at each local midnight."""
+    if tz_name is not None:
+        epoch = date(1970, 1, 1)
+        return [resolve_offset(tz_name, (d - epoch).days * 86400)[0] for d in days]
+    if tz_offset_hours is None:
+        tz_offset_hours = longitude_deg / 15.0  # local mean time
+    return [round(tz_offset_hours * 3600.0)] * len(days)
+
+
+def rise_set(
+    latitude_deg: float,
+    longitude_deg: float,
+    start_date: date | str,
+    end_date: date | str | None = None,
+    tz_offset_hours: float | None = None,
+    tz_name: str | None = None,
+    elevation_m: float = 0.0,
+    events: Sequence[str] = tuple(EVENTS),
+    hindu: bool = False,
+) -> List[Dict[str, Any]]:
+    """Return rise and set times (JD UT) for each date of a range.
+
+    Args:
+        latitude_deg: Observer latitude; rounded to :data:`LOCATION_DECIMALS`.
+        longitude_deg: Observer longitude; rounded likewise.
+        start_date: First local date.
+        end_date: Last local date (inclusive); defaults to ``start_date``.
+        tz_offset_hours: Fixed UTC offset defining local midnight.
+        tz_name: IANA zone defining local midnight, instead of the offset.
+            Without either, local mean time of ``longitude_deg`` is used.
+        elevation_m: Observer height above sea level.
+        events: Subset of :data:`EVENTS`.
+        hindu: Use the centre of the disc without refraction
+            (``BIT_HINDU_RISING``) instead of the refracted upper limb.
+
+    Returns:
+        One dict per date with ``date`` and ``<event>_jd_ut`` keys, plus
+        ``next_sunrise_jd_ut`` when sunrise is requested.
+    """
+    unknown = set(events) - set(EVENTS)
+    if unknown:
+        raise ValueError(f"unknown events: {', '.join(sorted(unknown))}")
+    lat = round(latitude_deg, LOCATION_DECIMALS)
+    lon = round(longitude_deg, LOCATION_DECIMALS)
+    elev = round(elevation_m)
+    first = _as_date(start_date)
+    last = _as_date(end_date) if end_date is not None else first
+    # one extra day for next_sunrise, one more midnight to close it
+    days = [first + timedelta(days=i) for i in range((last - first).days + 3)]
+    offsets = _midnight_offsets(days, lon, tz_offset_hours, tz_name)
+    epoch = date(1970, 1, 1)
+    midnights = [
+        JD_UNIX_EPOCH + ((d - epoch).days * 86400 - off) / 86400.0
+        for d, off in zip(days, offsets)
+    ]
+    days = days[:-1]
+    rsmi_extra = swe.BIT_HINDU_RISING if hindu else 0
+
+    wanted: List[Tuple[str, int]] = [(e, i) for e in events for i in range(len(days) - 1)]
+    if "sunrise" in events:
+        wanted.append(("sunrise", len(days) - 1))
+
+    def key(event: str, i: int) -> Tuple[Any, ...]:
+        return (lat, lon, elev, days[i].toordinal(), offsets[i], offsets[i + 1], hindu, event)
+
+    found: Dict[Tuple[str, int], float | None] = {}
+    missing: List[Tuple[str, int]] = []
+    with _cache_lock:
+        for event, i in wanted:
+            k = key(event, i)
+            if k in _cache:
+                _cache.move_to_end(k)
+                found[event, i] = _cache[k]
+            else:
+                missing.append((event, i))
+        cache_stats["hits"] += len(found)
+        cache_stats["misses"] += len(missing)
+
+    if missing:
+        items = [
+            (midnights[i], EVENTS[event][0], EVENTS[event][1] | rsmi_extra)
+            for event, i in missing
+        ]
+        swiss.init_ephemeris()
+        results = swiss.rise_trans(items, lon, lat, elev)
+        with _cache_lock:
+            for (event, i), jd in zip(missing, results):
+                if jd is not None and jd >= midnights[i + 1]:
+                    jd = None  # first event falls on a later day
+                found[event, i] = jd
+                _cache[key(event, i)] = jd
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    records = []
+    for i, day in enumerate(days[:-1]):
+        record: Dict[str, Any] = {"date": day.isoformat()}
+        for event in events:
+            record[f"{event}_jd_ut"] = found[event, i]
+        if "sunrise" in events:
+            record["next_sunrise_jd_ut"] = found["sunrise", i + 1]
+        records.append(record)
+    return records
+
+
+def _rise_set_job(args: Tuple[Mapping[str, Any], Dict[str, Any]]) -> List[Dict[str, Any]]:
+    location, kwargs = args
+    return rise_set(**location, **kwargs)
+
+
+def rise_set_many(
+    locations: Sequence[Mapping[str, Any]],
+    start_date: date | str,
+    end_date: date | str | None = None,
+    workers: int = 1,
+    **kwargs: Any,
+) -> List[List[Dict[str, Any]]]:
+    """Run :func:`rise_set` for several locations.
+
+    Each location maps ``latitude_deg``, ``longitude_deg`` and optionally
+    ``elevation_m``, ``tz_offset_hours`` or ``tz_name``.  With ``workers > 1``
+    locations are spread over processes, each with its own Swiss Ephemeris
+    state (and cache).
+    """
+    shared = {"start_date": start_date, "end_date": end_date, **kwargs}
+    jobs = [(dict(loc), shared) for loc in locations]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_rise_set_job, jobs))
+    return [_rise_set_job(job) for job in jobs]
+
+
+def cache_clear() -> None:
+    with _cache_lock:
+        _cache.clear()
+        cache_stats.update(hits=0, misses=0)
+
+
+__all__ = ["EVENTS", "rise_set", "rise_set_many", "cache_clear", "cache_stats"]
@@ -0,0 +1,132 @@
+"""Incremental chart recomputation for interactive editing.
+
+A :class:`ChartSession` keeps the parts of a ``build_base_core`` result that
+depend only on the moment (time, ayanamsa, obliquity, sidereal time and, for
+geocentric charts, the planets) in a small LRU keyed by the time input.  Moving
+the location pin therefore only recomputes RAMC, axes and houses; moving the
+time slider back to a moment seen before reuses the cached state.  The output
+is identical to :func:`build_base_core` apart from ``meta.calc_ms``.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import perf_counter
+from typing import Any, Dict, Tuple
+
+from ..constants import AYANAMSA_DEG
+from ..settings import CoreSettingsModel
+from ..types import BaseInput, CoreOutput
+from ..utils.time import payload_time
+from . import swiss
+from .axes import compute_axes
+from .base_core import (
+    assemble_core,
+    compute_time_geometry,
+    ephemeris_meta,
+    locate_geometry,
+)
+from .planets import compute_planets
+
+TIME_FIELDS = ("date", "time", "tz_offset_hours", "tz_name")
+LOCATION_FIELDS = ("latitude_deg", "longitude_deg", "elevation_m")
+
+
+class ChartSession:
+    """Chart that recomputes only what an edit invalidates."""
+
+    def __init__(self, payload: BaseInput, cache_size: int = 64) -> None:
+        self.payload: Dict[str, Any] = dict(payload)
+        self.settings = CoreSettingsModel(**payload.get("settings", {}))
+        self.cache_size = cache_size
+        self.stats = {"time_hits": 0, "time_misses": 0}
+        self._time_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        swiss.init_ephemeris(ayanamsa=self.settings.ayanamsa, sidereal=self.settings.sidereal)
+
+    def _time_state(self) -> Dict[str, Any]:
+        key = tuple(self.payload.get(f) for f in TIME_FIELDS)
+        state = self._time_cache.get(key)
+        if state is not None:
+            self._time_cache.move_to_end(key)
+            self.stats["time_hits"] += 1
+            return state
+
+        self.stats["time_misses"] += 1
+        t = payload_time(self.payload)
+        state = {
+            "time": t,
+            "ephemeris": ephemeris_meta(t["jd_ut"], self.settings),
+            "geometry": compute_time_geometry(t["jd_ut"], self.settings.ayanamsa),
+        }
+        if not self.settings.topocentric:
+            state["planets"] = compute_planets(
+                t["jd_ut"], self.settings, state["geometry"][AYANAMSA_DEG], 0.0, 0.0
+            )
+        self._time_cache[key] = state
+        if len(self._time_cache) > self.cache_size:
+            self._time_cache.popitem(last=False)
+        return state
+
+    def compute(self) -> CoreOutput:
+        """Return the chart for the current payload."""
+        from ..houses import HouseRequest, compute_houses
+
+        start = perf_counter()
+        payload = self.payload
+        state = self._time_state()
+        t = dict(state["time"])
+        jd_ut = t["jd_ut"]
+        geometry = locate_geometry(state["geometry"], payload["longitude_deg"])
+        ayanamsa_deg = geometry[AYANAMSA_DEG]
+
+        axes = compute_axes(
+            jd_ut, ayanamsa_deg, payload["latitude_deg"], payload["longitude_deg"]
+        )
+        if "planets" in state:
+            # copies keep the cached state safe from callers mutating results
+            planets = {name: dict(data) for name, data in state["planets"].items()}
+        else:
+            planets = compute_planets(
+                jd_ut,
+                self.settings,
+                ayanamsa_deg,
+                payload["latitude_deg"],
+                payload["longitude_deg"],
+                payload.get("elevation_m", 0.0),
+            )
+        houses_req = HouseRequest(
+            jd_ut=jd_ut,
+            latitude_deg=payload["latitude_deg"],
+            longitude_deg=payload["longitude_deg"],
+            ayanamsa=self.settings.ayanamsa,
+        )
+        houses_data = compute_houses(houses_req, geometry=geometry)["houses"]
+        calc_ms = (perf_counter() - start) * 1000.0
+
+        return assemble_core(
+            payload,
+            self.settings,
+            t,
+            geometry,
+            axes,
+            planets,
+            houses_req.house_system,
+            houses_data["cusps_deg_sid"],
+            calc_ms,
+            state["ephemeris"],
+        )
+
+    def update(self, **changes: Any) -> CoreOutput:
+        """Apply time and/or location changes and return the new chart.
+
+        Accepted keys are ``date``, ``time``, ``tz_offset_hours``, ``tz_name``,
+        ``latitude_deg``, ``longitude_deg`` and ``elevation_m``; set the unused
+        one of ``tz_offset_hours`` and ``tz_name`` to ``None``.
+        """
+        unknown = set(changes) - set(TIME_FIELDS) - set(LOCATION_FIELDS)
+        if unknown:
+            raise ValueError(f"cannot update {', '.join(sorted(unknown))}")
+        self.payload.update(changes)
+        return self.compute()
+
+
+__all__ = ["ChartSession"]
@@ -0,0 +1,332 @@
+"""Fixed-star catalog with vectorised precession and conjunction lookup.
+
+The catalog is read once into arrays: from ``sefstars.txt`` in the ephemeris
+directory when present (ICRS/J2000 rows), otherwise from the bright stars in
+:data:`BUILTIN_STARS`.  :meth:`StarCatalog.positions` moves every star to a
+moment in one step (proper motion, IAU 1976 precession, nutation in
+longitude and annual aberration) and caches the result per JD bucket;
+positions agree with ``swe.fixstar2_ut`` within two arcseconds.
+:meth:`StarCatalog.conjunctions` matches planet and axis longitudes against
+the sorted star longitudes.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..config import DEFAULT_EPHE_PATH
+from ..constants import ASC_DEG_SID, AYANAMSA_DEG, MC_DEG_SID
+from . import swiss
+
+CATALOG_FILE = "sefstars.txt"
+J2000 = 2451545.0
+ABERRATION_DEG = 20.49552 / 3600.0
+DEFAULT_BUCKET_DAYS = 1.0
+POSITION_CACHE_SIZE = 256
+
+# name, nomenclature, RA (h m s, J2000), Dec (d m s, J2000),
+# proper motion RA*cos(Dec) and Dec (mas/yr), visual magnitude
+BUILTIN_STARS: Tuple[Tuple[str, str, str, str, float, float, float], ...] = (
+    ("Alpheratz", "alAnd", "00 08 23.26", "+29 05 25.6", 135.7, -162.9, 2.06),
+    ("Algenib", "gaPeg", "00 13 14.15", "+15 11 00.9", 1.0, -8.2, 2.83),
+    ("Mirach", "beAnd", "01 09 43.92", "+35 37 14.0", 175.9, -112.2, 2.05),
+    ("Achernar", "alEri", "01 37 42.85", "-57 14 12.3", 88.0, -40.1, 0.46),
+    ("Hamal", "alAri", "02 07 10.41", "+23 27 44.7", 190.7, -145.8, 2.00),
+    ("Polaris", "alUMi", "02 31 49.09", "+89 15 50.8", 44.5, -11.9, 1.98),
+    ("Menkar", "alCet", "03 02 16.77", "+04 05 23.1", -10.4, -76.9, 2.54),
+    ("Algol", "bePer", "03 08 10.13", "+40 57 20.3", 2.4, -1.4, 2.12),
+    ("Mirfak", "alPer", "03 24 19.37", "+49 51 40.2", 24.1, -26.0, 1.79),
+    ("Alcyone", "etTau", "03 47 29.08", "+24 06 18.5", 19.3, -43.7, 2.87),
+    ("Aldebaran", "alTau", "04 35 55.24", "+16 30 33.5", 63.5, -188.9, 0.86),
+    ("Rigel", "beOri", "05 14 32.27", "-08 12 05.9", 1.3, 0.5, 0.13),
+    ("Capella", "alAur", "05 16 41.36", "+45 59 52.8", 75.5, -427.1, 0.08),
+    ("Bellatrix", "gaOri", "05 25 07.86", "+06 20 59.0", -8.1, -12.9, 1.64),
+    ("El Nath", "beTau", "05 26 17.51", "+28 36 26.8", 22.8, -174.2, 1.65),
+    ("Alnilam", "epOri", "05 36 12.81", "-01 12 06.9", 1.4, -1.1, 1.69),
+    ("Alnitak", "zeOri", "05 40 45.53", "-01 56 33.3", 3.2, 2.0, 1.77),
+    ("Betelgeuse", "alOri", "05 55 10.31", "+07 24 25.4", 27.5, 11.3, 0.42),
+    ("Canopus", "alCar", "06 23 57.11", "-52 41 44.4", 19.9, 23.2, -0.74),
+    ("Sirius", "alCMa", "06 45 08.92", "-16 42 58.0", -546.0, -1223.1, -1.46),
+    ("Castor", "alGem", "07 34 35.86", "+31 53 17.8", -191.5, -145.2, 1.58),
+    ("Procyon", "alCMi", "07 39 18.12", "+05 13 30.0", -716.6, -1034.6, 0.37),
+    ("Pollux", "beGem", "07 45 18.95", "+28 01 34.3", -626.6, -45.8, 1.14),
+    ("Alphard", "alHya", "09 27 35.24", "-08 39 31.0", -15.2, 34.4, 1.99),
+    ("Regulus", "alLeo", "10 08 22.31", "+11 58 02.0", -249.4, 4.9, 1.40),
+    ("Dubhe", "alUMa", "11 03 43.67", "+61 45 03.7", -134.1, -34.7, 1.79),
+    ("Denebola", "beLeo", "11 49 03.58", "+14 34 19.4", -499.0, -113.8, 2.14),
+    ("Acrux", "alCru", "12 26 35.90", "-63 05 56.7", -35.8, -14.9, 0.76),
+    ("Alioth", "epUMa", "12 54 01.75", "+55 57 35.4", 111.9, -8.2, 1.77),
+    ("Vindemiatrix", "epVir", "13 02 10.60", "+10 57 32.9", -273.8, 20.0, 2.79),
+    ("Spica", "alVir", "13 25 11.58", "-11 09 40.8", -42.4, -31.7, 0.97),
+    ("Alkaid", "etUMa", "13 47 32.44", "+49 18 47.8", -121.2, -15.0, 1.86),
+    ("Arcturus", "alBoo", "14 15 39.67", "+19 10 56.7", -1093.4, -1999.4, -0.05),
+    ("Zubenelgenubi", "al2Lib", "14 50 52.71", "-16 02 30.4", -105.7, -68.4, 2.75),
+    ("Zubeneschamali", "beLib", "15 17 00.41", "-09 22 58.5", -95.1, -21.6, 2.61),
+    ("Unukalhai", "alSer", "15 44 16.07", "+06 25 32.3", 133.8, 44.8, 2.63),
+    ("Antares", "alSco", "16 29 24.46", "-26 25 55.2", -12.1, -23.3, 1.06),
+    ("Ras Algethi", "al1Her", "17 14 38.86", "+14 23 25.2", -7.3, 36.1, 3.37),
+    ("Shaula", "laSco", "17 33 36.52", "-37 06 13.8", -8.5, -30.8, 1.62),
+    ("Rasalhague", "alOph", "17 34 56.07", "+12 33 36.1", 108.1, -221.6, 2.07),
+    ("Vega", "alLyr", "18 36 56.34", "+38 47 01.3", 200.9, 286.2, 0.03),
+    ("Nunki", "siSgr", "18 55 15.93", "-26 17 48.2", 15.1, -53.4, 2.05),
+    ("Altair", "alAql", "19 50 47.00", "+08 52 06.0", 536.2, 385.3, 0.76),
+    ("Deneb", "alCyg", "20 41 25.92", "+45 16 49.2", 2.0, 1.9, 1.25),
+    ("Sadalsuud", "beAqr", "21 31 33.53", "-05 34 16.2", 18.8, -8.2, 2.87),
+    ("Deneb Algedi", "deCap", "21 47 02.44", "-16 07 38.2", 261.8, -296.2, 2.85),
+    ("Sadalmelik", "alAqr", "22 05 47.04", "-00 19 11.5", 17.9, -9.9, 2.95),
+    ("Fomalhaut", "alPsA", "22 57 39.05", "-29 37 20.1", 329.2, -164.2, 1.16),
+    ("Scheat", "bePeg", "23 03 46.46", "+28 04 58.0", 187.8, 137.6, 2.42),
+    ("Markab", "alPeg", "23 04 45.65", "+15 12 19.0", 60.4, -41.3, 2.48),
+)
+
+
+def _sexagesimal(parts: Sequence[str]) -> float:
+    sign = -1.0 if parts[0].strip().startswith("-") else 1.0
+    d, m, s = (abs(float(p)) for p in parts)
+    return sign * (d + m / 60.0 + s / 3600.0)
+
+
+@dataclass(frozen=True, eq=False)
+class StarPositions:
+    """Ecliptic positions of the whole catalog at one moment."""
+
+    jd_ut: float
+    lon_deg: np.ndarray
+    lat_deg: np.ndarray
+    order: np.ndarray
+    sorted_lon_deg: np.ndarray
+
+
+class StarCatalog:
+    """Fixed stars as arrays of J2000 coordinates, proper motions and magnitudes."""
+
+    def __init__(self, rows: Sequence[Tuple[str, str, float, float, float, float, float]], source: str) -> None:
+        self.source = source
+        self.names: List[str] = [r[0] for r in rows]
+        self.nomenclature: List[str] = [r[1] for r in rows]
+        self.index: Dict[str, int] = {}
+        for i, (name, nomen) in enumerate(zip(self.names, self.nomenclature)):
+            self.index.setdefault(name.lower(), i)
+            self.index.setdefault(nomen.lower(), i)
+        ra, dec, pm_ra, pm_dec, mag = (np.array([r[k] for r in rows], dtype=float).reshape(-1) for k in range(2, 7))
+        self.ra_deg, self.dec_deg, self.magnitude = ra, dec, mag
+        self.pm_ra_mas, self.pm_dec_mas = pm_ra, pm_dec
+        self._positions: "OrderedDict[Tuple[int, float], StarPositions]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def builtin(cls) -> "StarCatalog":
+        rows = [
+            (name, nomen, _sexagesimal(ra.split()) * 15.0, _sexagesimal(dec.split()), pm_ra, pm_dec, mag)
+            for name, nomen, ra, dec, pm_ra, pm_dec, mag in BUILTIN_STARS
+        ]
+        return cls(rows, "builtin")
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "StarCatalog":
+        """Parse a Swiss Ephemeris ``sefstars.txt``; rows not in ICRS/J2000 are skipped."""
+        rows = []
+        seen = set()
+        with open(path, encoding="latin-1") as fh:
+            for line in fh:
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                f = [p.strip() for p in line.split(",")]
+                if len(f) < 14 or f[2] not in ("ICRS", "2000"):
+                    continue
+                name = f[0] or f[1]
+                if name.lower() in seen:
+                    continue
+                seen.add(name.lower())
+                ra = _sexagesimal(f[3:6]) * 15.0
+                dec = _sexagesimal(f[6:9])
+                rows.append((name, f[1], ra, dec, float(f[9]), float(f[10]), float(f[13])))
+        return cls(rows, str(path))
+
+    @classmethod
+    def load(cls, ephe_path: str | Path | None = None) -> "StarCatalog":
+        """Load ``sefstars.txt`` from the ephemeris path, else the builtin list."""
+        path = Path(ephe_path or DEFAULT_EPHE_PATH) / CATALOG_FILE
+        return cls.from_file(path) if path.is_file() else cls.builtin()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def find(self, name: str) -> int:
+        """Return the row of a star by traditional name or nomenclature."""
+        try:
+            return self.index[name.lower()]
+        except KeyError:
+            raise KeyError(f"unknown fixed star {name}") from None
+
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+
+    def _compute(self, jd_ut: float) -> StarPositions:
+        jd_tt = jd_ut + swe.deltat(jd_ut)
+        t = (jd_tt - J2000) / 36525.0
+        years = t * 100.0
+
+        # proper motion, then unit vectors in the J2000 equator
+        dec = np.radians(self.dec_deg + self.pm_dec_mas * years / 3.6e6)
+        cos_dec0 = np.cos(np.radians(self.dec_deg))
+        ra = np.radians(self.ra_deg + self.pm_ra_mas * years / 3.6e6 / np.maximum(cos_dec0, 1e-9))
+        vec = np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)])
+
+        # IAU 1976 precession to the mean equator of date
+        arcsec = math.pi / 180.0 / 3600.0
+        zeta = (2306.2181 * t + 0.30188 * t**2 + 0.017998 * t**3) * arcsec
+        z = (2306.2181 * t + 1.09468 * t**2 + 0.018203 * t**3) * arcsec
+        theta = (2004.3109 * t - 0.42665 * t**2 - 0.041833 * t**3) * arcsec
+        vec = _rot_z(-z) @ _rot_y(theta) @ _rot_z(-zeta) @ vec
+
+        # mean ecliptic of date, then nutation in longitude and aberration
+        _, eps_mean, dpsi, _ = swiss.ecl_nut(jd_ut)[:4]
+        eps = math.radians(eps_mean)
+        y = vec[1] * math.cos(eps) + vec[2] * math.sin(eps)
+        zz = -vec[1] * math.sin(eps) + vec[2] * math.cos(eps)
+        lon = np.degrees(np.arctan2(y, vec[0])) + dpsi
+        lat = np.degrees(np.arcsin(np.clip(zz, -1.0, 1.0)))
+
+        sun = math.radians(swiss.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)["lon_deg"])
+        lam, beta = np.radians(lon), np.radians(lat)
+        lon = lon - ABERRATION_DEG * np.cos(sun - lam) / np.cos(beta)
+        lat = lat - ABERRATION_DEG * np.sin(sun - lam) * np.sin(beta)
+
+        lon = np.mod(lon, 360.0)
+        order = np.argsort(lon, kind="stable")
+        return StarPositions(jd_ut, lon, lat, order, lon[order])
+
+    def positions(self, jd_ut: float, bucket_days: float = DEFAULT_BUCKET_DAYS) -> StarPositions:
+        """Return tropical positions of all stars, cached per JD bucket.
+
+        Positions are computed at the centre of the ``bucket_days`` wide
+        bucket containing ``jd_ut`` (stars move about 0.5" a day at most);
+        pass ``bucket_days=0`` for the exact moment.
+        """
+        if bucket_days <= 0:
+            return self._compute(jd_ut)
+        bucket = math.floor(jd_ut / bucket_days)
+        key = (bucket, bucket_days)
+        cached = self._positions.get(key)
+        if cached is None:
+            cached = self._compute((bucket + 0.5) * bucket_days)
+            self._positions[key] = cached
+            if len(self._positions) > POSITION_CACHE_SIZE:
+                self._positions.popitem(last=False)
+        else:
+            self._positions.move_to_end(key)
+        return cached
+
+    def conjunctions(
+        self,
+        jd_ut: float,
+        longitudes: Mapping[str, float],
+        orb_deg: float = 1.0,
+        ayanamsa_deg: float = 0.0,
+        max_magnitude: float | None = None,
+        bucket_days: float = DEFAULT_BUCKET_DAYS,
+    ) -> List[Dict[str, Any]]:
+        """Return stars within ``orb_deg`` of each longitude, closest first.
+
+        ``longitudes`` maps point names to ecliptic longitudes; with an
+        ``ayanamsa_deg`` they are taken as sidereal.  Separation is measured
+        in longitude only.
+        """
+        pos = self.positions(jd_ut, bucket_days)
+        sorted_lon = pos.sorted_lon_deg
+        n = sorted_lon.size
+        hits: List[Dict[str, Any]] = []
+        for point, lon in longitudes.items():
+            trop = (lon + ayanamsa_deg) % 360.0
+            lo = np.searchsorted(sorted_lon, trop - orb_deg, side="left")
+            hi = np.searchsorted(sorted_lon, trop + orb_deg, side="right")
+            idx = list(range(lo, hi))
+            if trop - orb_deg < 0.0:
+                idx += range(np.searchsorted(sorted_lon, trop - orb_deg + 360.0), n)
+            if trop + orb_deg >= 360.0:
+                idx += range(0, np.searchsorted(sorted_lon, trop + orb_deg - 360.0, side="right"))
+            for k in idx:
+                star = int(pos.order[k])
+                if max_magnitude is not None and self.magnitude[star] > max_magnitude:
+                    continue
+                sep = (float(pos.lon_deg[star]) - trop + 180.0) % 360.0 - 180.0
+                hits.append(
+                    {
+                        "point": point,
+                        "star": self.names[star],
+                        "separation_deg": sep,
+                        "star_lon_deg": (float(pos.lon_deg[star]) - ayanamsa_deg) % 360.0,
+                        "star_lat_deg": float(pos.lat_deg[star]),
+                        "magnitude": float(self.magnitude[star]),
+                    }
+                )
+        hits.sort(key=lambda h: abs(h["separation_deg"]))
+        return hits
+
+
+def _rot_z(a: float) -> np.ndarray:
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _rot_y(a: float) -> np.ndarray:
+    c, s = math.cos(a), math.sin(a)
+    return np.array([[c, 0.0, -s], [0.0, 1.0, 0.0], [s, 0.0, c]])
+
+
+def core_conjunctions(
+    core: Mapping[str, Any], orb_deg: float = 1.0, **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """Star conjunctions of the planets and axes of a ``build_base_core`` result."""
+    longitudes = {
+        name: data["lon_sidereal_deg"]
+        for name, data in core["planets"].items()
+        if "lon_sidereal_deg" in data
+    }
+    for key in (ASC_DEG_SID, MC_DEG_SID):
+        if key in core["axes"]:
+            longitudes[key] = core["axes"][key]
+    return get_catalog().conjunctions(
+        core["time"]["jd_ut"],
+        longitudes,
+        orb_deg,
+        ayanamsa_deg=core["geometry"][AYANAMSA_DEG],
+        **kwargs,
+    )
+
+
+_catalog: StarCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> StarCatalog:
+    """Return the shared catalog, loaded on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                swiss.init_ephemeris()
+                _catalog = StarCatalog.load()
+    return _catalog
+
+
+__all__ = [
+    "BUILTIN_STARS",
+    "StarCatalog",
+    "StarPositions",
+    "core_conjunctions",
+    "get_catalog",
+]
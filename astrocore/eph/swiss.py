@@ -2,26 +2,38 @@
 from __future__ import annotations
 
 import threading
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 import swisseph as swe
 
 from ..config import DEFAULT_EPHE_PATH, AYANAMSA_MAP
+from ..errors import EphemerisError
 
 _swe_lock = threading.Lock()
-_initialized = False
+# Ephemeris path and sidereal mode of the first initialisation, applied once
+# in every thread: pyswisseph keeps this state per thread.
+_config: Tuple[str, int | None] | None = None
+_thread_state = threading.local()
 
 
 def init_ephemeris(ephe_path: str | None = None, ayanamsa: str = "Lahiri", sidereal: bool = True) -> None:
-    """Initialise Swiss Ephemeris library."""
-    global _initialized
+    """Initialise Swiss Ephemeris library.
+
+    The first call fixes the configuration for the process; later calls
+    apply it in threads that have not been initialised yet.
+    """
+    global _config
+    if getattr(_thread_state, "initialized", False):
+        return
     with _swe_lock:
-        if _initialized:
-            return
-        swe.set_ephe_path(str(ephe_path or DEFAULT_EPHE_PATH))
-        if sidereal:
-            swe.set_sid_mode(AYANAMSA_MAP.get(ayanamsa, swe.SIDM_LAHIRI))
-        _initialized = True
+        if _config is None:
+            sid = AYANAMSA_MAP.get(ayanamsa, swe.SIDM_LAHIRI) if sidereal else None
+            _config = (str(ephe_path or DEFAULT_EPHE_PATH), sid)
+        path, sid = _config
+        swe.set_ephe_path(path)
+        if sid is not None:
+            swe.set_sid_mode(sid)
+        _thread_state.initialized = True
 
 
 def set_sid_mode(name: str) -> None:
@@ -34,10 +46,7 @@ def set_sid_mode(name: str) -> None:
         swe.set_sid_mode(sid)
 
 
-def calc_ut(jd_ut: float, body: int, flags: int) -> Dict[str, Any]:
-    """Thread-safe wrapper around ``swe.calc_ut``."""
-    with _swe_lock:
-        pos, _ = swe.calc_ut(jd_ut, body, flags)
+def _position(pos) -> Dict[str, Any]:
     return {
         "lon_deg": pos[0],
         "lat_deg": pos[1],
@@ -46,6 +55,101 @@ def calc_ut(jd_ut: float, body: int, flags: int) -> Dict[str, Any]:
     }
 
 
+def calc_ut(jd_ut: float, body: int, flags: int) -> Dict[str, Any]:
+    """Thread-safe wrapper around ``swe.calc_ut``."""
+    with _swe_lock:
+        try:
+            pos, _ = swe.calc_ut(jd_ut, body, flags)
+        except swe.Error as exc:
+            raise EphemerisError(str(exc)) from exc
+    return _position(pos)
+
+
+def calc_ut_topo(
+    items: Sequence[Tuple[float, int]],
+    flags: int,
+    longitude_deg: float,
+    latitude_deg: float,
+    elevation_m: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """Topocentric ``swe.calc_ut`` for several ``(jd_ut, body)`` pairs.
+
+    ``swe.set_topo`` and the calculations run under one lock acquisition, so
+    the global observer location cannot leak into other threads' calls and is
+    set only once for the whole group.
+    """
+    flags |= swe.FLG_TOPOCTR
+    with _swe_lock:
+        swe.set_topo(longitude_deg, latitude_deg, elevation_m)
+        try:
+            out = [swe.calc_ut(jd_ut, body, flags)[0] for jd_ut, body in items]
+        except swe.Error as exc:
+            raise EphemerisError(str(exc)) from exc
+    return [_position(pos) for pos in out]
+
+
+def fixstar_ut(name: str, jd_ut: float, flags: int) -> Dict[str, Any]:
+    """Thread-safe wrapper around ``swe.fixstar2_ut``."""
+    with _swe_lock:
+        try:
+            pos, _, _ = swe.fixstar2_ut(name, jd_ut, flags)
+        except swe.Error as exc:
+            raise EphemerisError(str(exc)) from exc
+    return _position(pos)
+
+
+def rise_trans(
+    items: Sequence[Tuple[float, int, int]],
+    longitude_deg: float,
+    latitude_deg: float,
+    elevation_m: float = 0.0,
+    flags: int = swe.FLG_SWIEPH,
+) -> List[float | None]:
+    """``swe.rise_trans`` for several ``(jd_ut, body, rsmi)`` searches.
+
+    All searches run under one lock acquisition.  Returns the event time for
+    each item, ``None`` when the body is circumpolar.
+    """
+    geopos = (longitude_deg, latitude_deg, elevation_m)
+    with _swe_lock:
+        try:
+            out = [swe.rise_trans(jd_ut, body, rsmi, geopos, flags=flags) for jd_ut, body, rsmi in items]
+        except swe.Error as exc:
+            raise EphemerisError(str(exc)) from exc
+    return [tret[0] if res == 0 else None for res, tret in out]
+
+
+def search_chain(
+    search: Callable[..., tuple],
+    jd_start: float,
+    jd_end: float,
+    *args: Any,
+    batch: int = 32,
+    **kwargs: Any,
+) -> List[tuple]:
+    """Repeat a Swiss ``*_when*`` eclipse search from ``jd_start`` to ``jd_end``.
+
+    ``search(jd, *args, **kwargs)`` must return ``(retflag, tret, ...)`` with
+    the time of maximum in ``tret[0]``; each call starts a day after the
+    previous maximum.  Up to ``batch`` searches share one lock acquisition.
+    """
+    results: List[tuple] = []
+    jd = jd_start
+    while jd < jd_end:
+        with _swe_lock:
+            try:
+                for _ in range(batch):
+                    found = search(jd, *args, **kwargs)
+                    if found[0] == 0 or found[1][0] > jd_end:
+                        jd = jd_end
+                        break
+                    results.append(found)
+                    jd = found[1][0] + 1.0
+            except swe.Error as exc:
+                raise EphemerisError(str(exc)) from exc
+    return results
+
+
 def houses(jd_ut: float, latitude_deg: float, longitude_deg: float):
     """Thread-safe wrapper around ``swe.houses``."""
     with _swe_lock:
@@ -60,8 +164,21 @@ def houses_ex(
         return swe.houses_ex(jd_ut, latitude_deg, longitude_deg, hsys)
 
 
-def get_ayanamsa(jd_ut: float) -> float:
+def get_ayanamsa(jd_ut: float, ayanamsa: str | None = None) -> float:
+    """Return the ayanamsa at ``jd_ut``.
+
+    With ``ayanamsa`` the sidereal mode is switched and read under one lock
+    acquisition, so threads using other ayanamsas cannot interleave; without
+    it the current sidereal mode is used.
+    """
+    if ayanamsa is None:
+        with _swe_lock:
+            return swe.get_ayanamsa(jd_ut)
+    sid = AYANAMSA_MAP.get(ayanamsa)
+    if sid is None:
+        raise ValueError(f"unknown ayanamsa {ayanamsa}")
     with _swe_lock:
+        swe.set_sid_mode(sid)
         return swe.get_ayanamsa(jd_ut)
 
 
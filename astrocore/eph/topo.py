@@ -0,0 +1,145 @@
+"""Topocentric positions without leaking global observer state.
+
+Two paths are offered:
+
+* :func:`compute_topocentric_batch` groups requests by observer location and
+  calls :func:`swiss.calc_ut_topo` once per group, so ``swe.set_topo`` runs
+  once per location and always under the ephemeris lock.
+* :func:`parallax_correct` derives topocentric ecliptic coordinates from
+  geocentric ones and the observer's position on the WGS84 ellipsoid, with no
+  Swiss global state at all.  It is vectorized over bodies and observers.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from . import swiss
+
+# WGS84 equatorial radius expressed in AU, and flattening.
+EARTH_RADIUS_AU = 6378.137 / 149597870.7
+EARTH_FLATTENING = 1.0 / 298.257223563
+
+
+@dataclass(frozen=True)
+class TopoRequest:
+    jd_ut: float
+    latitude_deg: float
+    longitude_deg: float
+    elevation_m: float = 0.0
+
+
+def compute_topocentric_batch(
+    requests: Sequence[TopoRequest],
+    bodies: Mapping[str, int],
+    flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED,
+) -> List[Dict[str, Dict[str, Any]]]:
+    """Compute topocentric positions of ``bodies`` for many requests.
+
+    Requests sharing a location are evaluated together with a single
+    ``set_topo`` call.  The result is aligned with ``requests`` and maps body
+    name to the dictionary returned by :func:`swiss.calc_ut`.
+    """
+
+    groups: Dict[Tuple[float, float, float], List[int]] = defaultdict(list)
+    for i, req in enumerate(requests):
+        groups[(req.longitude_deg, req.latitude_deg, req.elevation_m)].append(i)
+
+    names = list(bodies)
+    results: List[Dict[str, Dict[str, Any]]] = [{} for _ in requests]
+    for (lon, lat, elev), idxs in groups.items():
+        items = [(requests[i].jd_ut, bodies[name]) for i in idxs for name in names]
+        out = swiss.calc_ut_topo(items, flags, lon, lat, elev)
+        for n, i in enumerate(idxs):
+            row = out[n * len(names):(n + 1) * len(names)]
+            results[i] = dict(zip(names, row))
+    return results
+
+
+def observer_vector_au(latitude_deg, lst_deg, elevation_m=0.0) -> np.ndarray:
+    """Return the observer's geocentric equatorial position in AU.
+
+    Arrays broadcast; the last axis of the result holds ``x, y, z``.
+    """
+
+    phi = np.radians(latitude_deg)
+    theta = np.radians(lst_deg)
+    h = np.asarray(elevation_m, dtype=float) / 6378137.0
+    c = 1.0 / np.sqrt(np.cos(phi) ** 2 + (1.0 - EARTH_FLATTENING) ** 2 * np.sin(phi) ** 2)
+    s = (1.0 - EARTH_FLATTENING) ** 2 * c
+    rho_cos = (c + h) * np.cos(phi)
+    rho_sin = (s + h) * np.sin(phi)
+    return EARTH_RADIUS_AU * np.stack(
+        np.broadcast_arrays(rho_cos * np.cos(theta), rho_cos * np.sin(theta), rho_sin), axis=-1
+    )
+
+
+def parallax_correct(
+    lon_deg,
+    lat_deg,
+    distance_au,
+    latitude_deg,
+    lst_deg,
+    epsilon_deg,
+    elevation_m=0.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert geocentric ecliptic coordinates of date to topocentric ones.
+
+    Args:
+        lon_deg: Geocentric ecliptic longitude (tropical, of date).
+        lat_deg: Geocentric ecliptic latitude.
+        distance_au: Geocentric distance.
+        latitude_deg: Observer geodetic latitude.
+        lst_deg: Local apparent sidereal time in degrees (``ramc_deg``).
+        epsilon_deg: True obliquity of the ecliptic.
+        elevation_m: Observer height above the ellipsoid.
+
+    Returns:
+        A tuple of topocentric (lon_deg, lat_deg, distance_au) arrays.
+    """
+
+    lam = np.radians(lon_deg)
+    beta = np.radians(lat_deg)
+    eps = np.radians(epsilon_deg)
+    dist = np.asarray(distance_au, dtype=float)
+
+    x = dist * np.cos(beta) * np.cos(lam)
+    y = dist * np.cos(beta) * np.sin(lam)
+    z = dist * np.sin(beta)
+    # ecliptic -> equatorial
+    ye = y * np.cos(eps) - z * np.sin(eps)
+    ze = y * np.sin(eps) + z * np.cos(eps)
+
+    obs = observer_vector_au(latitude_deg, lst_deg, elevation_m)
+    xt = x - obs[..., 0]
+    yt = ye - obs[..., 1]
+    zt = ze - obs[..., 2]
+
+    # equatorial -> ecliptic
+    yl = yt * np.cos(eps) + zt * np.sin(eps)
+    zl = -yt * np.sin(eps) + zt * np.cos(eps)
+    dist_t = np.sqrt(xt * xt + yl * yl + zl * zl)
+    lon_t = np.mod(np.degrees(np.arctan2(yl, xt)), 360.0)
+    lat_t = np.degrees(np.arcsin(zl / dist_t))
+    return lon_t, lat_t, dist_t
+
+
+def observer_geometry(jd_ut: float, longitude_deg: float) -> Tuple[float, float]:
+    """Return (local apparent sidereal time in degrees, true obliquity)."""
+    lst_deg = (swiss.sidtime(jd_ut) * 15.0 + longitude_deg) % 360.0
+    return lst_deg, swiss.ecl_nut(jd_ut)[0]
+
+
+__all__ = [
+    "EARTH_RADIUS_AU",
+    "EARTH_FLATTENING",
+    "TopoRequest",
+    "compute_topocentric_batch",
+    "observer_vector_au",
+    "parallax_correct",
+    "observer_geometry",
+]
@@ -14,10 +14,12 @@ first house.  Values are normalised to ``[0, 360)``.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal, Dict, List
+from typing import Literal, Dict, List, Sequence, Tuple, Union
 
 import math
 
+from . import capture
+from .config import AYANAMSA_MAP
 from .constants import (
     ASC_DEG_SID,
     MC_DEG_SID,
@@ -37,13 +39,22 @@ from .utils.angles import mod360
 
 
 
+HouseSystem = Literal["whole-sign", "sripati", "placidus"]
+HOUSE_SYSTEMS: Tuple[str, ...] = ("whole-sign", "sripati", "placidus")
+
+
 @dataclass
 class HouseRequest:
+    """Input of :func:`compute_houses`.
+
+    ``house_system`` is one system, a sequence of systems or ``"all"``.
+    """
+
     jd_ut: float
     latitude_deg: float
     longitude_deg: float
     ayanamsa: str = "Lahiri"
-    house_system: Literal["whole-sign", "sripati", "placidus"] = "whole-sign"
+    house_system: Union[HouseSystem, Literal["all"], Sequence[HouseSystem]] = "whole-sign"
     backend: Literal["auto", "swiss", "native"] = "auto"
     options: Dict[str, object] = field(default_factory=dict)
 
@@ -150,49 +161,88 @@ def _whole_sign_borders(asc_sid: float) -> List[float]:
 # Main entry
 # ---------------------------------------------------------------------------
 
-def compute_houses(req: HouseRequest) -> Dict[str, object]:
-    """Return house data according to :class:`HouseRequest`.
+CLASSIFICATION: Dict[str, Tuple[int, ...]] = {
+    "kendra": (1, 4, 7, 10),
+    "trikona": (1, 5, 9),
+    "upachaya": (3, 6, 10, 11),
+    "dusthana": (6, 8, 12),
+}
+
+
+def _classification() -> Dict[str, List[int]]:
+    """Return a fresh copy of :data:`CLASSIFICATION` for one result."""
+    return {name: list(houses) for name, houses in CLASSIFICATION.items()}
+
+
+def _requested_systems(house_system) -> Tuple[str, ...] | None:
+    """Return the systems of a multi-system request, ``None`` for a single one."""
+    if house_system == "all":
+        return HOUSE_SYSTEMS
+    if isinstance(house_system, str):
+        return None
+    return tuple(dict.fromkeys(house_system))
+
+
+class _AngleSource:
+    """Shares Swiss ``houses_ex`` calls between the systems of one request."""
+
+    def __init__(self, req: HouseRequest) -> None:
+        self.req = req
+        self._placidus: Tuple[List[float], List[float]] | None = None
+        self._placidus_error: Exception | None = None
+        self._angles: Dict[str, float] | None = None
+
+    def placidus(self) -> Tuple[List[float], List[float]]:
+        if self._placidus_error is not None:
+            raise self._placidus_error
+        if self._placidus is None:
+            req = self.req
+            try:
+                self._placidus = swiss.houses_ex(
+                    req.jd_ut, req.latitude_deg, req.longitude_deg, b"P"
+                )
+            except Exception as exc:
+                self._placidus_error = exc
+                raise
+        return self._placidus
+
+    def angles(self) -> Dict[str, float]:
+        if self._angles is None:
+            if self._placidus is not None:
+                # Asc/MC of houses_ex do not depend on the house system.
+                ascmc = self._placidus[1]
+                self._angles = {ASC_DEG_TROP: ascmc[0], MC_DEG_TROP: ascmc[1]}
+            else:
+                req = self.req
+                self._angles = compute_angles_native(
+                    req.jd_ut, req.latitude_deg, req.longitude_deg
+                )
+        return self._angles
+
+
+def _system_houses(
+    house_system: str,
+    backend: str,
+    ayanamsa_deg: float,
+    options: Dict[str, object],
+    source: _AngleSource,
+    status: str,
+    notes: str,
+) -> Tuple[Dict[str, object], Dict[str, float], str, str, str]:
+    """Compute one house system; returns ``houses, axes, backend, status, notes``."""
 
-    The result dictionary contains ``meta``, ``axes``, ``houses`` and
-    ``classification`` keys.  ``houses`` follow the contract described in the
-    module docstring.
-    """
-
-
-    backend = req.backend
     if backend == "auto":
-        backend = "native" if req.house_system in ("whole-sign", "sripati") else "swiss"
-
+        backend = "native" if house_system in ("whole-sign", "sripati") else "swiss"
 
-    options = req.options or {}
     return_borders = bool(options.get("return_borders"))
     return_width = bool(options.get("return_width"))
 
-    status = "ok"
-    notes = ""
-
-    ayanamsa_name = req.ayanamsa
-    try:
-        swiss.set_sid_mode(ayanamsa_name)
-    except ValueError:
-        ayanamsa_name = "Lahiri"
-        status = "warn"
-        notes = f"unknown ayanamsa {req.ayanamsa}, fallback to Lahiri"
-        swiss.set_sid_mode(ayanamsa_name)
-
-    geometry = compute_geometry(req.jd_ut, req.latitude_deg, req.longitude_deg)
-    ayanamsa_deg = geometry[AYANAMSA_DEG]
-    ramc_deg = geometry[RAMC_DEG]
-    epsilon_deg = geometry[EPSILON_DEG]
-
     houses: Dict[str, object] = {}
     axes: Dict[str, float] = {}
 
-    if req.house_system == "placidus" and backend == "swiss":
+    if house_system == "placidus" and backend == "swiss":
         try:
-            borders_trop, ascmc = swiss.houses_ex(
-                req.jd_ut, req.latitude_deg, req.longitude_deg, b"P"
-            )
+            borders_trop, ascmc = source.placidus()
             asc_trop, mc_trop = ascmc[0], ascmc[1]
             borders_sid = [to_sidereal(b, ayanamsa_deg) for b in borders_trop]
             cusps_sid = madhya_from_borders(borders_sid)
@@ -214,7 +264,7 @@ def compute_houses(req: HouseRequest) -> Dict[str, object]:
             notes = "fallback to sripati because placidus undefined at latitude"
 
     if not axes:  # Whole-sign or Śrīpati or fallback branch
-        ang = compute_angles_native(req.jd_ut, req.latitude_deg, req.longitude_deg)
+        ang = source.angles()
 
         asc_sid = to_sidereal(ang[ASC_DEG_TROP], ayanamsa_deg)
         mc_sid = to_sidereal(ang[MC_DEG_TROP], ayanamsa_deg)
@@ -222,7 +272,7 @@ def compute_houses(req: HouseRequest) -> Dict[str, object]:
         axes[MC_DEG_SID] = mc_sid
 
 
-        if req.house_system == "whole-sign":
+        if house_system == "whole-sign":
             houses["type"] = "sign-based"
             borders = _whole_sign_borders(asc_sid)
             cusps = [mod360(b + 15.0) for b in borders]
@@ -242,43 +292,108 @@ def compute_houses(req: HouseRequest) -> Dict[str, object]:
                 if return_width:
                     houses["width_deg"] = widths_from_borders(borders)
 
+    return houses, axes, backend, status, notes
+
 
+def compute_houses(
+    req: HouseRequest, geometry: Dict[str, float] | None = None
+) -> Dict[str, object]:
+    """Return house data according to :class:`HouseRequest`.
 
+    The result dictionary contains ``meta``, ``axes``, ``houses`` and
+    ``classification`` keys.  ``houses`` follow the contract described in the
+    module docstring.  A ``geometry`` already computed by
+    :func:`compute_geometry` for the same moment, location and ayanamsa may be
+    passed to skip recomputing it.
+
+    When ``req.house_system`` is a sequence of systems or ``"all"``, the
+    ayanamsa, geometry and angles are computed once and ``houses`` maps each
+    system to its houses.  ``meta["systems"]`` then holds the ``backend``,
+    ``status`` and ``notes`` of every system; ``axes`` are shared.
+    """
 
-    meta = {
-        "house_system": req.house_system,
-        "backend": backend,
+    if geometry is None:
+        capture.record(capture.COMPUTE_HOUSES, req)
+
+    status = "ok"
+    notes = ""
+
+    ayanamsa_name = req.ayanamsa
+    if ayanamsa_name not in AYANAMSA_MAP:
+        ayanamsa_name = "Lahiri"
+        status = "warn"
+        notes = f"unknown ayanamsa {req.ayanamsa}, fallback to Lahiri"
+
+    if geometry is None or ayanamsa_name != req.ayanamsa:
+        geometry = compute_geometry(
+            req.jd_ut, req.latitude_deg, req.longitude_deg, ayanamsa_name
+        )
+    ayanamsa_deg = geometry[AYANAMSA_DEG]
+    ramc_deg = geometry[RAMC_DEG]
+    epsilon_deg = geometry[EPSILON_DEG]
+
+    options = req.options or {}
+    source = _AngleSource(req)
+    systems = _requested_systems(req.house_system)
+
+    shared_meta = {
         "ayanamsa_name": ayanamsa_name,
         AYANAMSA_DEG: ayanamsa_deg,
         EPSILON_DEG: epsilon_deg,
         RAMC_DEG: ramc_deg,
-
-        "status": status,
-    }
-    if notes:
-        meta["notes"] = notes
-
-    classification = {
-        "kendra": [1, 4, 7, 10],
-        "trikona": [1, 5, 9],
-        "upachaya": [3, 6, 10, 11],
-        "dusthana": [6, 8, 12],
     }
 
+    if systems is None:
+        houses, axes, backend, status, notes = _system_houses(
+            req.house_system, req.backend, ayanamsa_deg, options, source, status, notes
+        )
+        meta: Dict[str, object] = {
+            "house_system": req.house_system,
+            "backend": backend,
+            **shared_meta,
+            "status": status,
+        }
+        if notes:
+            meta["notes"] = notes
+        return {
+            "meta": meta,
+            "axes": axes,
+            "houses": houses,
+            "classification": _classification(),
+        }
+
+    # Run Placidus first so the other systems reuse its Asc/MC.
+    order = sorted(systems, key=lambda s: s != "placidus")
+    all_houses: Dict[str, object] = {}
+    system_meta: Dict[str, Dict[str, str]] = {}
+    axes = {}
+    for system in order:
+        houses, system_axes, backend, sys_status, sys_notes = _system_houses(
+            system, req.backend, ayanamsa_deg, options, source, status, notes
+        )
+        all_houses[system] = houses
+        system_meta[system] = {"backend": backend, "status": sys_status}
+        if sys_notes:
+            system_meta[system]["notes"] = sys_notes
+        axes = axes or system_axes
+    meta = {
+        "house_system": list(systems),
+        **shared_meta,
+        "systems": {s: system_meta[s] for s in systems},
+    }
     return {
         "meta": meta,
         "axes": axes,
-        "houses": houses,
-        "classification": classification,
+        "houses": {s: all_houses[s] for s in systems},
+        "classification": _classification(),
     }
 
 
 __all__ = [
     "HouseRequest",
+    "HOUSE_SYSTEMS",
     "compute_houses",
     "compute_sripati_from_angles",
     "compute_angles_native",
     "to_sidereal",
 ]
-
-
@@ -0,0 +1,387 @@
+"""Load test replaying captured traffic.
+
+:func:`replay` drives the records of an :mod:`astrocore.capture` file through
+``build_base_core`` and ``compute_houses`` from ``workers`` threads or
+processes, each worker replaying its share of the records back to back, and
+returns a report: throughput, latency percentiles (overall and per kind),
+Swiss Ephemeris lock contention and the hit rates of the library caches.
+Reports are plain dicts that survive ``json.dumps``; :func:`compare` lines up
+two of them, e.g. before and after a change.
+
+Lock contention is measured by wrapping ``swiss._swe_lock`` in a
+:class:`CountingLock` for the duration of the run; an acquisition counts as
+contended when the lock is held by another thread at that moment.  With
+processes every worker has its own lock and caches, and their counts are
+summed.
+
+Run ``benchmarks/replay.py`` for the command line version.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .capture import BUILD_BASE_CORE, COMPUTE_HOUSES, KINDS
+from .eph import interp, swiss
+from .eph.base_core import build_base_core
+from .eph.manager import get_manager
+from .eph.planets import compile_plan
+from .houses import HouseRequest, compute_houses
+from .utils.tz import zone_table
+
+MODES = ("threads", "processes")
+PERCENTILES = (50, 90, 99)
+
+# name -> callable returning (hits, misses)
+CACHES: Dict[str, Callable[[], Tuple[int, int]]] = {
+    "planet_plan": lambda: compile_plan.cache_info()[:2],
+    "interp": lambda: interp.cache_info()[:2],
+    "zone_table": lambda: zone_table.cache_info()[:2],
+    "ephemeris_check": lambda: (get_manager().check_stats["hits"], get_manager().check_stats["misses"]),
+}
+
+# metric path -> True when higher is better
+METRICS: Tuple[Tuple[str, bool], ...] = (
+    ("throughput_rps", True),
+    ("latency_ms.mean", False),
+    ("latency_ms.p50", False),
+    ("latency_ms.p90", False),
+    ("latency_ms.p99", False),
+    ("latency_ms.max", False),
+    ("errors", False),
+    ("lock.contention_rate", False),
+    ("lock.wait_ms_per_request", False),
+    ("lock.held_fraction", False),
+)
+
+
+class CountingLock:
+    """Wrapper of a ``threading.Lock`` counting acquisitions and waits.
+
+    Counters are updated while the lock is held, so they need no lock of
+    their own.
+    """
+
+    def __init__(self, lock: Any = None) -> None:
+        self.lock = lock if lock is not None else threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_s = 0.0
+        self.hold_s = 0.0
+        self._acquired_at = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start = perf_counter()
+        if not self.lock.acquire(False):
+            if not blocking or not self.lock.acquire(True, timeout):
+                return False
+            self.contended += 1
+        self._acquired_at = now = perf_counter()
+        self.wait_s += now - start
+        self.acquisitions += 1
+        return True
+
+    def release(self) -> None:
+        self.hold_s += perf_counter() - self._acquired_at
+        self.lock.release()
+
+    def locked(self) -> bool:
+        return self.lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+    def counts(self) -> Dict[str, float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "wait_s": self.wait_s,
+            "hold_s": self.hold_s,
+        }
+
+
+@contextmanager
+def instrument_swe_lock() -> Iterator[CountingLock]:
+    """Wrap ``swiss._swe_lock`` in a :class:`CountingLock` while the block runs."""
+    counting = CountingLock(swiss._swe_lock)
+    swiss._swe_lock = counting
+    try:
+        yield counting
+    finally:
+        swiss._swe_lock = counting.lock
+
+
+def cache_counts() -> Dict[str, Tuple[int, int]]:
+    """Return ``(hits, misses)`` of every cache in :data:`CACHES`."""
+    return {name: tuple(get()) for name, get in CACHES.items()}
+
+
+def load_records(path: str | Path) -> List[Dict[str, Any]]:
+    """Read a capture file, skipping blank lines."""
+    records = []
+    with Path(path).open(encoding="utf-8") as fh:
+        for n, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if rec.get("kind") not in KINDS:
+                raise ValueError(f"{path}:{n}: unknown record kind {rec.get('kind')!r}")
+            records.append(rec)
+    return records
+
+
+def run_record(record: Mapping[str, Any]) -> Any:
+    """Replay one captured call and return its result."""
+    kind, data = record["kind"], record["input"]
+    if kind == BUILD_BASE_CORE:
+        return build_base_core(data)
+    if kind == COMPUTE_HOUSES:
+        return compute_houses(HouseRequest(**data))
+    raise ValueError(f"unknown record kind {kind!r}")
+
+
+def _warm(records: Sequence[Mapping[str, Any]]) -> None:
+    for rec in records:
+        try:
+            run_record(rec)
+        except Exception:
+            pass
+
+
+def _timed(records: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Replay ``records`` in sequence; latencies of successful calls by kind."""
+    latencies: Dict[str, List[float]] = {kind: [] for kind in KINDS}
+    errors: Counter = Counter()
+    start = time()
+    for rec in records:
+        t0 = perf_counter()
+        try:
+            run_record(rec)
+        except Exception as exc:
+            errors[type(exc).__name__] += 1
+            continue
+        latencies[rec["kind"]].append(perf_counter() - t0)
+    return {"start": start, "end": time(), "latencies": latencies, "errors": dict(errors)}
+
+
+def _delta(before: Mapping[str, Tuple[int, int]], after: Mapping[str, Tuple[int, int]]):
+    return {name: (after[name][0] - before[name][0], after[name][1] - before[name][1]) for name in after}
+
+
+def _process_worker(records: Sequence[Mapping[str, Any]], warmup: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    _warm(warmup)
+    before = cache_counts()
+    with instrument_swe_lock() as lock:
+        result = _timed(records)
+    result["lock"] = lock.counts()
+    result["caches"] = _delta(before, cache_counts())
+    return result
+
+
+def _latency_ms(values: Sequence[float]) -> Dict[str, float]:
+    if not values:
+        return {"count": 0}
+    ms = np.asarray(values) * 1000.0
+    out = {"count": int(ms.size), "mean": float(ms.mean())}
+    for p, value in zip(PERCENTILES, np.percentile(ms, PERCENTILES)):
+        out[f"p{p}"] = float(value)
+    out["max"] = float(ms.max())
+    return out
+
+
+def replay(
+    records: Sequence[Mapping[str, Any]],
+    workers: int = 1,
+    mode: str = "threads",
+    repeat: int = 1,
+    warmup: int = 0,
+) -> Dict[str, Any]:
+    """Replay captured records and return a report.
+
+    Args:
+        records: Capture records, see :func:`load_records`.
+        workers: Number of threads or processes.
+        mode: ``"threads"`` or ``"processes"``.
+        repeat: Replay the records this many times.
+        warmup: Number of leading records replayed untimed first, once in
+            threads mode and in every process in processes mode.
+
+    Returns:
+        Report dict with ``config``, ``requests``, ``errors`` (and
+        ``error_types``), ``wall_s``, ``throughput_rps``, ``latency_ms``,
+        ``kinds`` (latencies per record kind), ``lock`` and ``caches``.
+        Latencies cover successful calls; the wall time runs from the first
+        worker start to the last worker end.
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown mode {mode}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    work = list(records) * repeat
+    warm = list(records[:warmup])
+    chunks = [work[i::workers] for i in range(workers)]
+
+    if mode == "threads":
+        _warm(warm)
+        before = cache_counts()
+        with instrument_swe_lock() as lock, ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(_timed, chunks))
+        lock_counts = lock.counts()
+        caches = _delta(before, cache_counts())
+        lock_holders = 1
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_process_worker, chunks, [warm] * workers))
+        lock_counts = {key: sum(r["lock"][key] for r in results) for key in results[0]["lock"]}
+        caches = {
+            name: tuple(map(sum, zip(*(r["caches"][name] for r in results))))
+            for name in CACHES
+        }
+        lock_holders = workers
+
+    wall = max(r["end"] for r in results) - min(r["start"] for r in results)
+    latencies = {kind: [v for r in results for v in r["latencies"][kind]] for kind in KINDS}
+    errors: Counter = Counter()
+    for r in results:
+        errors.update(r["errors"])
+    requests = len(work)
+    acquisitions = lock_counts["acquisitions"]
+    return {
+        "config": {
+            "mode": mode,
+            "workers": workers,
+            "records": len(records),
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "requests": requests,
+        "errors": sum(errors.values()),
+        "error_types": dict(errors),
+        "wall_s": wall,
+        "throughput_rps": requests / wall if wall > 0 else 0.0,
+        "latency_ms": _latency_ms([v for values in latencies.values() for v in values]),
+        "kinds": {kind: _latency_ms(values) for kind, values in latencies.items() if values},
+        "lock": {
+            "acquisitions": acquisitions,
+            "contended": lock_counts["contended"],
+            "contention_rate": lock_counts["contended"] / acquisitions if acquisitions else 0.0,
+            "wait_ms": lock_counts["wait_s"] * 1000.0,
+            "hold_ms": lock_counts["hold_s"] * 1000.0,
+            "wait_ms_per_request": lock_counts["wait_s"] * 1000.0 / requests if requests else 0.0,
+            # share of the run the lock(s) were held
+            "held_fraction": lock_counts["hold_s"] / (wall * lock_holders) if wall > 0 else 0.0,
+        },
+        "caches": {
+            name: {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else None,
+            }
+            for name, (hits, misses) in caches.items()
+        },
+    }
+
+
+def _get(report: Mapping[str, Any], path: str) -> Any:
+    value: Any = report
+    for key in path.split("."):
+        if not isinstance(value, Mapping) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(base: Mapping[str, Any], new: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Compare two :func:`replay` reports metric by metric.
+
+    Returns one row per metric with ``metric``, ``base``, ``new``, the relative
+    ``change`` (``new / base - 1``, ``None`` without a non-zero base) and
+    ``better`` (``None`` when equal or not comparable).  Cache hit rates
+    follow the :data:`METRICS`.
+    """
+    metrics = list(METRICS)
+    names = list(base.get("caches", {})) + [n for n in new.get("caches", {}) if n not in base.get("caches", {})]
+    metrics += [(f"caches.{name}.hit_rate", True) for name in names]
+    rows = []
+    for path, higher_is_better in metrics:
+        a, b = _get(base, path), _get(new, path)
+        change = better = None
+        if a is not None and b is not None:
+            if a:
+                change = b / a - 1.0
+            if a != b:
+                better = (b > a) == higher_is_better
+        rows.append({"metric": path, "base": a, "new": b, "change": change, "better": better})
+    return rows
+
+
+def _fmt(value: Any) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def format_report(report: Mapping[str, Any]) -> str:
+    """Render a :func:`replay` report as text."""
+    cfg = report["config"]
+    lines = [
+        f"{report['requests']} requests, {cfg['workers']} {cfg['mode']}, "
+        f"{report['errors']} errors, {report['wall_s']:.3f} s, "
+        f"{report['throughput_rps']:.1f} req/s",
+    ]
+    for label, lat in [("all", report["latency_ms"])] + sorted(report["kinds"].items()):
+        if lat.get("count"):
+            stats = "  ".join(f"{k} {_fmt(v)}" for k, v in lat.items() if k != "count")
+            lines.append(f"  {label:<16} n {lat['count']:<6} ms: {stats}")
+    lock = report["lock"]
+    lines.append(
+        f"  swe lock: {lock['acquisitions']} acquisitions, "
+        f"{lock['contention_rate']:.1%} contended, {lock['wait_ms']:.1f} ms waiting, "
+        f"held {lock['held_fraction']:.1%} of the run"
+    )
+    for name, cache in report["caches"].items():
+        rate = "-" if cache["hit_rate"] is None else f"{cache['hit_rate']:.1%}"
+        lines.append(f"  cache {name}: {cache['hits']} hits, {cache['misses']} misses ({rate})")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: Sequence[Mapping[str, Any]]) -> str:
+    """Render :func:`compare` rows as a table."""
+    lines = [f"{'metric':<30}{'base':>12}{'new':>12}{'change':>10}"]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        mark = {True: "  better", False: "  worse", None: ""}[row["better"]]
+        lines.append(
+            f"{row['metric']:<30}{_fmt(row['base']):>12}{_fmt(row['new']):>12}{change:>10}{mark}"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "MODES",
+    "PERCENTILES",
+    "CACHES",
+    "METRICS",
+    "CountingLock",
+    "instrument_swe_lock",
+    "cache_counts",
+    "load_records",
+    "run_record",
+    "replay",
+    "compare",
+    "format_report",
+    "format_comparison",
+]
@@ -0,0 +1,346 @@
+"""Fast JSON and MessagePack encoding of ``build_base_core`` results.
+
+:class:`ChartEncoder` keeps one ``%``-format template per dict shape (its key
+tuple), with the JSON keys and separators already rendered, so encoding a
+dict is a type check and one string formatting call.  Templates for the chart
+contract of ``docs/naming_spec.md`` are compiled up front; other shapes are
+compiled on first sight.  Dicts whose values are all numbers (axes,
+geometry), and dicts of such dicts (planets), are formatted in one call
+without per-value dispatch; float-free sections fixed by the schema (settings,
+ephemeris meta) reuse their text while they repeat.
+
+Without ``float_precision`` the JSON output is byte-for-byte that of
+``json.dumps(core)`` (or ``json.dumps(core, separators=...)``) for finite
+floats.  ``repr`` of floats dominates that case, so number-only sections then
+go through a reused instance of json's C encoder and the gain is limited to
+the repeated sections.  With ``float_precision`` floats are written
+fixed-point, which is several times cheaper than ``repr``
+(``benchmarks/bench_serialize.py``).
+"""
+from __future__ import annotations
+
+from copy import deepcopy
+from itertools import chain
+from math import isfinite
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from typing import IO, Any, Callable, Dict, Iterable, Mapping, Tuple
+
+try:  # optional dependency
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+from .constants import (
+    ASC_DEG_SID,
+    ASC_DEG_TROP,
+    AYANAMSA_DEG,
+    EPSILON_DEG,
+    GST_HOURS,
+    LON_SIDEREAL_DEG,
+    LON_TROPICAL_DEG,
+    LST_HOURS,
+    MC_DEG_SID,
+    MC_DEG_TROP,
+    PLANET_FIELDS,
+    RAMC_DEG,
+)
+from .settings import CoreSettingsModel
+
+DEFAULT_SEPARATORS = (", ", ": ")
+COMPACT_SEPARATORS = (",", ":")
+
+# Key tuples of the chart contract, compiled when an encoder is created.
+CONTRACT_SHAPES: Tuple[Tuple[str, ...], ...] = (
+    ("time", "location", "settings", "geometry", "axes", "planets", "houses", "meta"),
+    ("datetime_local", "datetime_utc", "jd_ut", "delta_t_sec", "jd_tt"),
+    ("latitude_deg", "longitude_deg"),
+    (AYANAMSA_DEG, EPSILON_DEG, GST_HOURS, LST_HOURS, RAMC_DEG),
+    (ASC_DEG_SID, MC_DEG_SID, ASC_DEG_TROP, MC_DEG_TROP),
+    PLANET_FIELDS,
+    (LON_TROPICAL_DEG, LON_SIDEREAL_DEG),
+    (LON_SIDEREAL_DEG,),
+    ("house_system", "cusps_deg_sid"),
+    ("engine", "versions", "calc_ms", "ephemeris"),
+)
+
+# Float-free shapes whose value types are fixed by the schema; they repeat
+# across requests, so the text of the last value is reused while equal.
+MEMO_SHAPES: Tuple[Tuple[str, ...], ...] = (
+    tuple(CoreSettingsModel.model_fields),
+    ("accuracy", "flags", "sources"),
+)
+
+_NUMBERS = {float, int}
+_FLOATS = {float}
+_STRINGS = {str}
+_DICTS = {dict}
+_PLAIN = {str, int, bool, type(None)}
+_LITERALS = {True: "true", False: "false", None: "null"}
+# non-finite floats as written by ``json.dumps``
+_NON_FINITE = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+class ChartEncoder:
+    """Encoder for chart dicts; reuse one instance per thread.
+
+    Args:
+        float_precision: Decimals written for every float (fixed-point, so
+            ``135.0`` becomes ``135.000000`` at 6); ``None`` keeps ``repr``.
+            Ints are always written as ints, and NaN and infinities as
+            ``NaN``, ``Infinity`` and ``-Infinity`` like ``json.dumps``.
+        separators: Item and key separators as for ``json.dumps``.
+
+    Raises:
+        ValueError: If ``float_precision`` is below 1, where floats would
+            read as ints.
+    """
+
+    def __init__(
+        self,
+        float_precision: int | None = None,
+        separators: Tuple[str, str] = DEFAULT_SEPARATORS,
+    ) -> None:
+        if float_precision is not None and float_precision < 1:
+            raise ValueError(f"float_precision must be at least 1, got {float_precision}")
+        self.float_precision = float_precision
+        self.item_sep, self.key_sep = separators
+        self._slot = "%r" if float_precision is None else f"%.{int(float_precision)}f"
+        # types formatted through the numeric slot: with a fixed precision
+        # ints need their own conversion and take the per-value path
+        self._numbers = _NUMBERS if float_precision is None else _FLOATS
+        # key tuple -> (template with value slots, template with number slots)
+        self._templates: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+        self._list_templates: Dict[int, str] = {}
+        self._nested_templates: Dict[Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]], str] = {}
+        self._convert: Dict[type, Callable[[Any], str]] = {
+            float: self._float,
+            int: int.__repr__,
+            str: encode_basestring_ascii,
+            bool: _LITERALS.__getitem__,
+            type(None): _LITERALS.__getitem__,
+            dict: self._dict,
+            list: self._list,
+            tuple: self._list,
+        }
+        self._c_encode = None
+        if float_precision is None and c_make_encoder is not None:
+            self._c_encode = c_make_encoder(
+                None, _unserializable, encode_basestring_ascii, None, self.key_sep, self.item_sep, False, False, True
+            )
+        # last value and text of each memoised shape
+        self._memo: Dict[Tuple[str, ...], Tuple[Any, str]] = dict.fromkeys(MEMO_SHAPES, (None, ""))
+        self._packer = None
+        for keys in CONTRACT_SHAPES:
+            self._template(keys)
+
+    # ------------------------------------------------------------------
+    # JSON
+    # ------------------------------------------------------------------
+
+    def _template(self, keys: Tuple[str, ...]) -> Tuple[str, str]:
+        templates = self._templates.get(keys)
+        if templates is None:
+            prefixes = [encode_basestring_ascii(k).replace("%", "%%") + self.key_sep for k in keys]
+            templates = self._templates[keys] = (
+                "{" + self.item_sep.join(p + "%s" for p in prefixes) + "}",
+                "{" + self.item_sep.join(p + self._slot for p in prefixes) + "}",
+            )
+        return templates
+
+    def _float(self, value: float) -> str:
+        if isfinite(value):
+            return self._slot % value
+        return _NON_FINITE[repr(value)]
+
+    def _value(self, value: Any) -> str:
+        convert = self._convert.get(type(value))
+        if convert is not None:
+            return convert(value)
+        if isinstance(value, float):
+            return self._float(float(value))
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
+        if isinstance(value, Mapping):
+            return self._dict(value)
+        if isinstance(value, (list, tuple)):
+            return self._list(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _dict(self, obj: Mapping[str, Any]) -> str:
+        if not obj:
+            return "{}"
+        keys = tuple(obj)
+        if set(map(type, keys)) != _STRINGS:
+            keys = tuple(map(_key, keys))
+        memo = self._memo.get(keys)
+        if memo is not None:
+            if obj == memo[0] and _same(obj, memo[0]):
+                return memo[1]
+            self._memo[keys] = memo = (deepcopy(obj), self._encode_dict(keys, obj))
+            return memo[1]
+        return self._encode_dict(keys, obj)
+
+    def _encode_dict(self, keys: Tuple[str, ...], obj: Mapping[str, Any]) -> str:
+        values = tuple(obj.values())
+        mixed, numeric = self._template(keys)
+        types = set(map(type, values))
+        if self._c_encode is not None and (types <= _NUMBERS or types == _DICTS):
+            # repr() of floats dominates; json's C encoder does it with less overhead
+            return "".join(self._c_encode(obj, 0))
+        if types <= self._numbers and _finite(values):
+            return numeric % values
+        if types == _DICTS:
+            text = self._nested(keys, values)
+            if text is not None:
+                return text
+        if types == _STRINGS:
+            return mixed % tuple(map(encode_basestring_ascii, values))
+        return mixed % tuple(map(self._value, values))
+
+    def _nested(self, keys: Tuple[str, ...], values: Tuple[Mapping[str, Any], ...]) -> str | None:
+        """Encode a dict of number-only dicts (planets) with one template, if it is one."""
+        flat = tuple(chain.from_iterable(v.values() for v in values))
+        if not set(map(type, flat)) <= self._numbers or not _finite(flat):
+            return None
+        inner = tuple(map(tuple, values))
+        template = self._nested_templates.get((keys, inner))
+        if template is None:
+            if not all(isinstance(k, str) for ks in inner for k in ks) or () in inner:
+                return None
+            parts = [self._template(ks)[1] for ks in inner]
+            prefixes = [encode_basestring_ascii(k).replace("%", "%%") + self.key_sep for k in keys]
+            template = "{" + self.item_sep.join(p + t for p, t in zip(prefixes, parts)) + "}"
+            self._nested_templates[keys, inner] = template
+        return template % flat
+
+    def _list(self, seq: Iterable[Any]) -> str:
+        seq = tuple(seq)
+        if not seq:
+            return "[]"
+        if set(map(type, seq)) <= self._numbers and _finite(seq):
+            template = self._list_templates.get(len(seq))
+            if template is None:
+                template = "[" + self.item_sep.join([self._slot] * len(seq)) + "]"
+                self._list_templates[len(seq)] = template
+            return template % seq
+        return "[" + self.item_sep.join(map(self._value, seq)) + "]"
+
+    def encode(self, obj: Any) -> str:
+        """Return the JSON text of ``obj``."""
+        return self._value(obj)
+
+    def encode_bytes(self, obj: Any) -> bytes:
+        """Return the JSON of ``obj`` as ASCII bytes."""
+        return self.encode(obj).encode("ascii")
+
+    def encode_into(self, obj: Any, buffer: bytearray) -> int:
+        """Append the JSON of ``obj`` to ``buffer``; returns its length.
+
+        A convenience wrapper: the text is built as one string and appended
+        as ASCII bytes, so it copies as much as :meth:`encode_bytes`.
+        """
+        data = self.encode(obj).encode("ascii")
+        buffer += data
+        return len(data)
+
+    def dump(self, obj: Any, fp: IO[str]) -> None:
+        """Write the JSON of ``obj`` to a text file object."""
+        fp.write(self.encode(obj))
+
+    # ------------------------------------------------------------------
+    # MessagePack
+    # ------------------------------------------------------------------
+
+    def _rounded(self, obj: Any) -> Any:
+        if isinstance(obj, float):
+            return round(obj, self.float_precision)
+        if isinstance(obj, Mapping):
+            return {k: self._rounded(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [self._rounded(v) for v in obj]
+        return obj
+
+    def encode_msgpack(self, obj: Any) -> bytes:
+        """Return ``obj`` as MessagePack; needs the optional ``msgpack`` package.
+
+        Keys and order match the JSON output.  Without ``float_precision``
+        floats are packed as doubles, with it as rounded doubles.
+        """
+        if msgpack is None:
+            raise ImportError("MessagePack output needs the msgpack package")
+        if self._packer is None:
+            self._packer = msgpack.Packer(use_bin_type=True)
+        if self.float_precision is not None:
+            obj = self._rounded(obj)
+        return self._packer.pack(obj)
+
+
+def _finite(values: Tuple[Any, ...]) -> bool:
+    """Whether numeric ``values`` are all finite; a sum is NaN or infinite otherwise."""
+    try:
+        return isfinite(sum(values))
+    except OverflowError:  # ints beyond the float range
+        return False
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Whether equal ``a`` and ``b`` also encode alike.
+
+    ``==`` does not tell ``True``, ``1`` and ``1.0``, ``0.0`` and ``-0.0``, or
+    dicts in other key order apart.
+    """
+    t = type(a)
+    if t is not type(b):
+        return False
+    if t is float:
+        return repr(a) == repr(b)
+    if t in _PLAIN:
+        return True
+    if t is dict or isinstance(a, Mapping):
+        if tuple(a) != tuple(b):
+            return False
+        a, b = a.values(), b.values()
+    elif not isinstance(a, (list, tuple)):
+        return True
+    types = tuple(map(type, a))
+    return types == tuple(map(type, b)) and all(
+        _same(x, y) for x, y, t in zip(a, b, types) if t not in _PLAIN
+    )
+
+
+def _unserializable(obj: Any) -> None:
+    """``default`` of the C encoder: fail like ``json.dumps``."""
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _key(key: Any) -> str:
+    """Coerce a non-string key the way ``json.dumps`` does."""
+    if isinstance(key, str):
+        return key
+    if key is True or key is False or key is None:
+        return _LITERALS[key]
+    if isinstance(key, float):
+        return _NON_FINITE.get(repr(key), repr(key))
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+_default = ChartEncoder()
+
+
+def dumps(obj: Any) -> str:
+    """Encode with a shared :class:`ChartEncoder` using ``json.dumps`` defaults."""
+    return _default.encode(obj)
+
+
+__all__ = [
+    "ChartEncoder",
+    "CONTRACT_SHAPES",
+    "MEMO_SHAPES",
+    "COMPACT_SEPARATORS",
+    "DEFAULT_SEPARATORS",
+    "dumps",
+]
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from pydantic import BaseModel, field_validator
 
-from typing import Literal
+from typing import List, Literal, Optional
 
-from .config import AYANAMSA_MAP
+from .config import AYANAMSA_MAP, BODY_CODES, DERIVED_BODIES
+from .constants import PLANET_FIELDS
 
 
 class CoreSettingsModel(BaseModel):
@@ -15,6 +16,13 @@ class CoreSettingsModel(BaseModel):
     ayanamsa: str = "Lahiri"
     node_type: Literal["TRUE", "MEAN"] = "TRUE"
     topocentric: bool = False
+    topocentric_method: Literal["swiss", "parallax"] = "swiss"
+    bodies: Optional[List[str]] = None
+    fixed_stars: List[str] = []
+    speed: bool = True
+    fields: Optional[List[str]] = None
+    strict_ephemeris: bool = False
+    accuracy: Literal["swiss", "moshier", "interpolated"] = "swiss"
 
     @field_validator("ayanamsa")
     def check_ayanamsa(cls, v: str) -> str:  # noqa: D401
@@ -22,5 +30,21 @@ class CoreSettingsModel(BaseModel):
             raise ValueError(f"Unsupported ayanamsa: {v}")
         return v
 
+    @field_validator("bodies")
+    def check_bodies(cls, v: Optional[List[str]]) -> Optional[List[str]]:  # noqa: D401
+        if v is not None:
+            unknown = [b for b in v if b not in BODY_CODES and b not in DERIVED_BODIES]
+            if unknown:
+                raise ValueError(f"Unsupported bodies: {', '.join(unknown)}")
+        return v
+
+    @field_validator("fields")
+    def check_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:  # noqa: D401
+        if v is not None:
+            unknown = [f for f in v if f not in PLANET_FIELDS]
+            if unknown:
+                raise ValueError(f"Unsupported fields: {', '.join(unknown)}")
+        return v
+
 
 __all__ = ["CoreSettingsModel"]
@@ -0,0 +1,201 @@
+"""Persistent SQLite store for ``build_base_core`` results.
+
+Each chart is stored as JSON together with one indexed ``REAL`` column per
+sidereal longitude (planets' ``lon_sidereal_deg`` and the sidereal axes).  Range
+queries are half-open arcs ``[start_deg, end_deg)`` measured in the direction
+of increasing longitude, so an arc crossing ``0°`` is split into two index
+ranges instead of falling back to a full scan.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from .constants import ASC_DEG_SID, MC_DEG_SID
+from .errors import InvalidInputError
+from .types import CoreOutput
+
+# Stored longitude -> column name.
+INDEXED_FIELDS: Dict[str, str] = {
+    "Sun": "sun_lon_sidereal_deg",
+    "Moon": "moon_lon_sidereal_deg",
+    "Mercury": "mercury_lon_sidereal_deg",
+    "Venus": "venus_lon_sidereal_deg",
+    "Mars": "mars_lon_sidereal_deg",
+    "Jupiter": "jupiter_lon_sidereal_deg",
+    "Saturn": "saturn_lon_sidereal_deg",
+    "Rahu": "rahu_lon_sidereal_deg",
+    "Ketu": "ketu_lon_sidereal_deg",
+    ASC_DEG_SID: ASC_DEG_SID,
+    MC_DEG_SID: MC_DEG_SID,
+}
+
+
+def arc_bounds(start_deg: float, end_deg: float) -> List[Tuple[float, float]]:
+    """Split the arc ``[start_deg, end_deg)`` into non-wrapping intervals.
+
+    An arc of 360° or more covers the whole circle.
+    """
+
+    if end_deg - start_deg >= 360.0:
+        return [(0.0, 360.0)]
+    start = start_deg % 360.0
+    end = end_deg % 360.0
+    if start < end:
+        return [(start, end)]
+    if start == end:
+        return []
+    return [(start, 360.0), (0.0, end)]
+
+
+def sign_arc(sign_index: int) -> Tuple[float, float]:
+    """Return the arc ``[start, end)`` of a zero-based zodiac sign index."""
+    start = (sign_index % 12) * 30.0
+    return start, start + 30.0
+
+
+class ChartStore:
+    """SQLite-backed store of chart results with longitude indexes."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path)
+        self._create_schema()
+
+    # ------------------------------------------------------------------
+    # Schema and writes
+    # ------------------------------------------------------------------
+
+    def _create_schema(self) -> None:
+        cols = ", ".join(f"{col} REAL" for col in INDEXED_FIELDS.values())
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS charts ("
+                "id INTEGER PRIMARY KEY, chart_key TEXT, data TEXT NOT NULL, "
+                f"{cols})"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_charts_chart_key ON charts (chart_key)"
+            )
+            for col in INDEXED_FIELDS.values():
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_charts_{col} ON charts ({col})"
+                )
+
+    @staticmethod
+    def _row(core: CoreOutput, key: str | None) -> Tuple[object, ...]:
+        planets = core.get("planets", {})
+        axes = core.get("axes", {})
+        lons = []
+        for name in INDEXED_FIELDS:
+            if name in axes:
+                lons.append(axes[name])
+            elif name in planets and "lon_sidereal_deg" in planets[name]:
+                lons.append(planets[name]["lon_sidereal_deg"])
+            else:
+                lons.append(None)
+        return (key, json.dumps(core), *lons)
+
+    def append(self, core: CoreOutput, key: str | None = None) -> int:
+        """Store one chart and return its id."""
+        return self.extend([core], None if key is None else [key])[0]
+
+    def extend(
+        self, cores: Iterable[CoreOutput], keys: Sequence[str] | None = None
+    ) -> List[int]:
+        """Bulk-append charts in a single transaction and return their ids."""
+
+        cores = list(cores)
+        if keys is not None and len(keys) != len(cores):
+            raise InvalidInputError("keys and cores differ in length")
+        rows = [self._row(core, None if keys is None else keys[i]) for i, core in enumerate(cores)]
+        cols = ", ".join(["chart_key", "data", *INDEXED_FIELDS.values()])
+        marks = ", ".join("?" * (2 + len(INDEXED_FIELDS)))
+        with self._conn:
+            # take the write lock before reading MAX(id), so concurrent
+            # writers on the same file cannot hand out the same ids
+            self._conn.execute("BEGIN IMMEDIATE")
+            first = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM charts").fetchone()[0] + 1
+            ids = list(range(first, first + len(rows)))
+            self._conn.executemany(
+                f"INSERT INTO charts (id, {cols}) VALUES (?, {marks})",
+                [(i, *row) for i, row in zip(ids, rows)],
+            )
+        return ids
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM charts").fetchone()[0]
+
+    def get(self, chart_id: int) -> CoreOutput:
+        row = self._conn.execute("SELECT data FROM charts WHERE id = ?", (chart_id,)).fetchone()
+        if row is None:
+            raise KeyError(chart_id)
+        return json.loads(row[0])
+
+    def fetch(self, chart_ids: Iterable[int]) -> List[CoreOutput]:
+        return [self.get(i) for i in chart_ids]
+
+    def ids_for_key(self, key: str) -> List[int]:
+        rows = self._conn.execute("SELECT id FROM charts WHERE chart_key = ?", (key,))
+        return [r[0] for r in rows]
+
+    @staticmethod
+    def _column(name: str) -> str:
+        try:
+            return INDEXED_FIELDS[name]
+        except KeyError:
+            raise InvalidInputError(f"longitude {name} is not indexed") from None
+
+    def query(self, ranges: Mapping[str, Tuple[float, float]]) -> List[int]:
+        """Return ids of charts matching every longitude arc in ``ranges``.
+
+        Args:
+            ranges: Mapping of body or axis name to ``(start_deg, end_deg)``;
+                the arc is half-open and may wrap through ``0°``.
+
+        Returns:
+            Sorted list of matching chart ids.
+        """
+
+        if not ranges:
+            return [r[0] for r in self._conn.execute("SELECT id FROM charts ORDER BY id")]
+
+        clauses: List[str] = []
+        params: List[float] = []
+        for name, (start, end) in ranges.items():
+            col = self._column(name)
+            parts = []
+            for lo, hi in arc_bounds(start, end):
+                parts.append(f"({col} >= ? AND {col} < ?)")
+                params.extend((lo, hi))
+            clauses.append("(" + " OR ".join(parts) + ")" if parts else "0")
+        sql = "SELECT id FROM charts WHERE " + " AND ".join(clauses) + " ORDER BY id"
+        return [r[0] for r in self._conn.execute(sql, params)]
+
+    def conjunctions(self, name: str, lon_deg: float, orb_deg: float) -> List[int]:
+        """Return ids of charts with ``name`` within ``orb_deg`` of ``lon_deg``."""
+        return self.query({name: (lon_deg - orb_deg, lon_deg + orb_deg)})
+
+    def longitudes(self, names: Sequence[str]) -> Tuple[List[int], List[Tuple[float, ...]]]:
+        """Return chart ids and the stored longitudes of ``names`` per chart."""
+        cols = ", ".join(self._column(n) for n in names)
+        rows = self._conn.execute(f"SELECT id, {cols} FROM charts ORDER BY id").fetchall()
+        return [r[0] for r in rows], [tuple(r[1:]) for r in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ChartStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["INDEXED_FIELDS", "ChartStore", "arc_bounds", "sign_arc"]
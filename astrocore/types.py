@@ -1,7 +1,7 @@
 """Public type hints for astrocore API."""
 from __future__ import annotations
 
-from typing import TypedDict, Literal, Dict, Any
+from typing import TypedDict, Literal, Dict, Any, List, NotRequired
 
 
 class CoreSettings(TypedDict, total=False):
@@ -9,14 +9,23 @@ class CoreSettings(TypedDict, total=False):
     ayanamsa: str
     node_type: Literal["TRUE", "MEAN"]
     topocentric: bool
+    topocentric_method: Literal["swiss", "parallax"]
+    bodies: List[str]
+    fixed_stars: List[str]
+    speed: bool
+    fields: List[str]
+    strict_ephemeris: bool
+    accuracy: Literal["swiss", "moshier", "interpolated"]
 
 
 class BaseInput(TypedDict):
     date: str
     time: str
-    tz_offset_hours: float
+    tz_offset_hours: NotRequired[float]
+    tz_name: NotRequired[str]
     latitude_deg: float
     longitude_deg: float
+    elevation_m: NotRequired[float]
     settings: CoreSettings
 
 
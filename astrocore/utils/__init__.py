@@ -1,5 +1,5 @@
 from __future__ import annotations
 
-from .dms import dec_to_dms360, format_dms360
+from .dms import dec_to_dms360, format_dms360, dec_to_dms360_array, format_dms360_array
 
-__all__ = ["dec_to_dms360", "format_dms360"]
+__all__ = ["dec_to_dms360", "format_dms360", "dec_to_dms360_array", "format_dms360_array"]
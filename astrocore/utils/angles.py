@@ -1,10 +1,17 @@
 """Angle helpers."""
 from __future__ import annotations
 
+import numpy as np
+
 
 def mod360(value: float) -> float:
     """Normalize value to 0..360 degrees."""
     return value % 360.0
 
 
-__all__ = ["mod360"]
+def mod360_array(values) -> np.ndarray:
+    """Normalize an array of values to 0..360 degrees like :func:`mod360`."""
+    return np.mod(np.asarray(values, dtype=float), 360.0)
+
+
+__all__ = ["mod360", "mod360_array"]
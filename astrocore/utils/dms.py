@@ -1,7 +1,15 @@
 from __future__ import annotations
 import math
+from functools import lru_cache
 
-__all__ = ["dec_to_dms360", "format_dms360"]
+import numpy as np
+
+__all__ = [
+    "dec_to_dms360",
+    "format_dms360",
+    "dec_to_dms360_array",
+    "format_dms360_array",
+]
 
 def _normalize360(x: float) -> float:
     if math.isnan(x) or math.isinf(x):
@@ -48,3 +56,63 @@ def format_dms360(value_deg: float, *, sec_precision: int = 3,
         m_str = str(m)
         s_str = f"{s:.{sec_precision}f}" if sec_precision > 0 else str(int(round(s)))
     return f"{d}{deg_sym} {m_str}{min_sym} {s_str}{sec_sym}"
+
+
+def _normalize360_array(x: np.ndarray) -> np.ndarray:
+    if not np.all(np.isfinite(x)):
+        raise ValueError("Angle must be finite.")
+    x = np.fmod(x, 360.0)
+    return np.where(x < 0, x + 360.0, x)
+
+def dec_to_dms360_array(values_deg, *, sec_precision: int = 3) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array version of :func:`dec_to_dms360` with identical results.
+
+    Returns integer degree and minute arrays and a float second array.
+    """
+    x = _normalize360_array(np.asarray(values_deg, dtype=float))
+    total_sec = x * 3600.0
+    q = 10 ** sec_precision
+    sec_rounded = np.floor(total_sec * q + 0.5) / q
+
+    deg = sec_rounded // 3600
+    rem = sec_rounded - deg * 3600
+    minute = rem // 60
+    second = rem - minute * 60
+
+    carry = second >= 60 - 10 ** (-sec_precision)
+    second = np.where(carry, 0.0, second)
+    minute = minute + carry
+    carry = minute >= 60
+    minute = np.where(carry, 0, minute)
+    deg = deg + carry
+    deg = np.where(deg >= 360, 0, deg)
+
+    return deg.astype(np.int64), minute.astype(np.int64), np.round(second, sec_precision)
+
+@lru_cache(maxsize=None)
+def _dms_tables(sec_precision: int, zero_pad: bool, symbols: tuple[str, str, str]):
+    """Precomputed degree, minute and (when small enough) second strings."""
+    deg_sym, min_sym, sec_sym = symbols
+    deg_tab = [f"{d}{deg_sym} " for d in range(360)]
+    if zero_pad:
+        min_tab = [f"{m:02d}{min_sym} " for m in range(60)]
+        width = 2 + (1 + sec_precision if sec_precision > 0 else 0)
+        s_fmt = f"{{:0{width}.{sec_precision}f}}{sec_sym}"
+    else:
+        min_tab = [f"{m}{min_sym} " for m in range(60)]
+        s_fmt = f"{{:.{sec_precision}f}}{sec_sym}"
+    q = 10 ** sec_precision
+    sec_tab = [s_fmt.format(k / q) for k in range(60 * q)] if q <= 1000 else None
+    return deg_tab, min_tab, sec_tab, s_fmt
+
+def format_dms360_array(values_deg, *, sec_precision: int = 3,
+                        zero_pad: bool = True, symbols: tuple[str, str, str] = ("°", "′", "″")) -> list[str]:
+    """Bulk version of :func:`format_dms360` returning a list of strings."""
+    d, m, s = dec_to_dms360_array(values_deg, sec_precision=sec_precision)
+    deg_tab, min_tab, sec_tab, s_fmt = _dms_tables(sec_precision, zero_pad, tuple(symbols))
+    if sec_tab is not None:
+        k = np.rint(s * 10 ** sec_precision).astype(np.int64)
+        return [deg_tab[a] + min_tab[b] + sec_tab[c]
+                for a, b, c in zip(d.tolist(), m.tolist(), k.tolist())]
+    return [deg_tab[a] + min_tab[b] + s_fmt.format(c)
+            for a, b, c in zip(d.tolist(), m.tolist(), s.tolist())]
@@ -1,25 +1,54 @@
 """Time related utilities."""
 from __future__ import annotations
 
+import math
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Sequence, Tuple
 
+import numpy as np
 import swisseph as swe
 
+from ..errors import InvalidInputError
+from .tz import STATUSES, local_seconds, resolve_offset, resolve_offsets
 
-def compute_time(date: str, time_str: str, tz_offset_hours: float) -> Dict[str, Any]:
+# Julian day of 1970-01-01T00:00 UT.
+JD_UNIX_EPOCH = 2440587.5
+
+
+def compute_time(
+    date: str,
+    time_str: str,
+    tz_offset_hours: float | None = None,
+    tz_name: str | None = None,
+) -> Dict[str, Any]:
     """Normalize time input and compute Julian dates.
 
     Args:
         date: Date string in ``YYYY-MM-DD`` format.
         time_str: Time string ``HH:MM`` or ``HH:MM:SS``.
         tz_offset_hours: Offset from UTC in hours.
+        tz_name: IANA zone name, used instead of ``tz_offset_hours``.
 
     Returns:
-        Dictionary with local/UTC datetimes and Julian day values.
+        Dictionary with local/UTC datetimes and Julian day values.  With
+        ``tz_name`` it also holds ``tz_name``, the resolved
+        ``tz_offset_hours`` and ``tz_status`` (``ok``, ``ambiguous`` or
+        ``nonexistent``, see :mod:`astrocore.utils.tz`).
+
+    Raises:
+        InvalidInputError: If not exactly one of ``tz_offset_hours`` and
+            ``tz_name`` is given, or the zone is unknown.
     """
 
+    if (tz_offset_hours is None) == (tz_name is None):
+        raise InvalidInputError("give exactly one of tz_offset_hours and tz_name")
     dt_local = datetime.fromisoformat(f"{date}T{time_str}")
+    zone: Dict[str, Any] = {}
+    if tz_name is not None:
+        local_sec = math.floor((dt_local - datetime(1970, 1, 1)).total_seconds())
+        offset_sec, status = resolve_offset(tz_name, local_sec)
+        tz_offset_hours = offset_sec / 3600.0
+        zone = {"tz_name": tz_name, "tz_offset_hours": tz_offset_hours, "tz_status": status}
     tzinfo = timezone(timedelta(hours=tz_offset_hours))
     dt_local = dt_local.replace(tzinfo=tzinfo)
     dt_utc = dt_local.astimezone(timezone.utc)
@@ -36,4 +65,32 @@ def compute_time(date: str, time_str: str, tz_offset_hours: float) -> Dict[str,
         "jd_ut": jd_ut,
         "delta_t_sec": delta_t_sec,
         "jd_tt": jd_tt,
+        **zone,
     }
+
+
+def payload_time(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Run :func:`compute_time` on the time fields of a ``BaseInput``."""
+    return compute_time(
+        payload["date"],
+        payload["time"],
+        payload.get("tz_offset_hours"),
+        payload.get("tz_name"),
+    )
+
+
+def jd_ut_array(
+    dates: Sequence[str], times: Sequence[str], tz_name: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised JD UT of local dates and times in one IANA zone.
+
+    Returns:
+        ``jd_ut`` (float64) and ``tz_status`` strings, one per input.
+    """
+    local = local_seconds(dates, times)
+    offsets, status = resolve_offsets(tz_name, local)
+    jd_ut = JD_UNIX_EPOCH + (local - offsets) / 86400.0
+    return jd_ut, np.asarray(STATUSES)[status]
+
+
+__all__ = ["compute_time", "payload_time", "jd_ut_array"]
@@ -0,0 +1,191 @@
+"""Resolution of IANA time zone names to UTC offsets.
+
+``zoneinfo`` is exact but slow per call.  :func:`zone_table` scans a zone once
+and keeps its UTC offset changes as a sorted transition table; local times are
+then resolved with :mod:`bisect` (or :func:`numpy.searchsorted` for batches).
+Tables cover :data:`TABLE_YEARS`; moments outside fall back to ``zoneinfo``.
+
+Local times that occur twice (clocks set back) are ``"ambiguous"`` and local
+times skipped by a forward change are ``"nonexistent"``.  Both resolve like
+``zoneinfo`` with ``fold=0``: to the offset in effect before the change.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from ..errors import InvalidInputError
+
+TABLE_YEARS = (1800, 2100)
+# Sampling step of the scan; offset changes closer together than this and
+# cancelling each other out would be missed.
+SCAN_STEP_SEC = 86400
+
+STATUS_OK = "ok"
+STATUS_AMBIGUOUS = "ambiguous"
+STATUS_NONEXISTENT = "nonexistent"
+STATUSES = (STATUS_OK, STATUS_AMBIGUOUS, STATUS_NONEXISTENT)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _year_sec(year: int) -> int:
+    return int((datetime(year, 1, 1) - _EPOCH).total_seconds())
+
+
+@dataclass(frozen=True, eq=False)
+class ZoneTable:
+    """UTC offset changes of one zone within :data:`TABLE_YEARS`.
+
+    Segment ``k`` has offset ``offsets_sec[k]`` and lasts from transition
+    ``k - 1`` to transition ``k`` (segment 0 starts before the first one).
+    ``local_starts[k - 1]`` and ``local_ends[k]`` are its bounds in local wall
+    time.  Times are seconds since 1970-01-01.
+    """
+
+    name: str
+    start_sec: int
+    end_sec: int
+    transitions_utc: List[int]
+    offsets_sec: List[int]
+    local_starts: List[int]
+    local_ends: List[int]
+
+    @property
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``offsets_sec``, ``local_starts`` and ``local_ends`` as arrays."""
+        return _arrays(self)
+
+
+@lru_cache(maxsize=64)
+def _arrays(table: ZoneTable) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return (
+        np.asarray(table.offsets_sec, dtype=np.int64),
+        np.asarray(table.local_starts, dtype=np.int64),
+        np.asarray(table.local_ends, dtype=np.int64),
+    )
+
+
+def _zone(name: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise InvalidInputError(f"unknown time zone {name!r}") from exc
+
+
+@lru_cache(maxsize=64)
+def zone_table(name: str) -> ZoneTable:
+    """Return the cached transition table of zone ``name``.
+
+    The first call per zone scans it with ``zoneinfo`` (about 0.2 s).
+    """
+    zone = _zone(name)
+    start, end = _year_sec(TABLE_YEARS[0]), _year_sec(TABLE_YEARS[1])
+
+    def offset(t: int) -> int:
+        return int(datetime.fromtimestamp(t, zone).utcoffset().total_seconds())
+
+    transitions: List[int] = []
+    offsets = [offset(start)]
+    prev_t, prev = start, offsets[0]
+    for t in range(start + SCAN_STEP_SEC, end + SCAN_STEP_SEC, SCAN_STEP_SEC):
+        cur = offset(t)
+        if cur != prev:
+            lo, hi = prev_t, t  # offset(lo) == prev, offset(hi) == cur
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if offset(mid) == prev:
+                    lo = mid
+                else:
+                    hi = mid
+            transitions.append(hi)
+            offsets.append(cur)
+        prev_t, prev = t, cur
+    local_starts = [t + o for t, o in zip(transitions, offsets[1:])]
+    local_ends = [t + o for t, o in zip(transitions, offsets)] + [end + offsets[-1]]
+    return ZoneTable(name, start, end, transitions, offsets, local_starts, local_ends)
+
+
+def _fallback(name: str, local_sec: int) -> Tuple[int, str]:
+    zone = _zone(name)
+    local = _EPOCH + timedelta(seconds=local_sec)
+    first = local.replace(tzinfo=zone)
+    offset = int(first.utcoffset().total_seconds())
+    other = int(local.replace(tzinfo=zone, fold=1).utcoffset().total_seconds())
+    if offset == other:
+        return offset, STATUS_OK
+    # a gap time does not survive the round trip through UTC
+    roundtrip = first.astimezone(timezone.utc).astimezone(zone).replace(tzinfo=None)
+    return offset, STATUS_AMBIGUOUS if roundtrip == local else STATUS_NONEXISTENT
+
+
+def _in_table(table: ZoneTable, local_sec):
+    return (table.start_sec + 86400 <= local_sec) & (local_sec < table.end_sec - 86400)
+
+
+def resolve_offset(name: str, local_sec: int) -> Tuple[int, str]:
+    """Return ``(offset_sec, status)`` for a local wall time in zone ``name``.
+
+    Args:
+        name: IANA zone name, e.g. ``"Europe/Berlin"``.
+        local_sec: Local wall time as seconds since 1970-01-01 (naive).
+
+    Raises:
+        InvalidInputError: If the zone is unknown.
+    """
+    table = zone_table(name)
+    if not _in_table(table, local_sec):
+        return _fallback(name, local_sec)
+    offsets = table.offsets_sec
+    k = bisect_right(table.local_starts, local_sec)
+    if local_sec >= table.local_ends[k]:
+        return offsets[k], STATUS_NONEXISTENT
+    if k > 0 and local_sec < table.local_ends[k - 1]:
+        return offsets[k - 1], STATUS_AMBIGUOUS
+    return offsets[k], STATUS_OK
+
+
+def resolve_offsets(name: str, local_sec) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised :func:`resolve_offset`.
+
+    Returns:
+        ``offset_sec`` (int64) and ``status`` codes indexing :data:`STATUSES`.
+    """
+    local = np.asarray(local_sec, dtype=np.int64)
+    table = zone_table(name)
+    offsets, starts, ends = table.arrays
+    k = np.searchsorted(starts, local, side="right")
+    gap = local >= ends[k]
+    prev = np.maximum(k - 1, 0)
+    overlap = ~gap & (k > 0) & (local < ends[prev])
+    result = np.where(overlap, offsets[prev], offsets[k])
+    status = np.where(gap, 2, np.where(overlap, 1, 0))
+    outside = ~_in_table(table, local)
+    for i in np.flatnonzero(outside):
+        offset, text = _fallback(name, int(local[i]))
+        result[i] = offset
+        status[i] = STATUSES.index(text)
+    return result, status
+
+
+def local_seconds(dates, times) -> np.ndarray:
+    """Parse ``YYYY-MM-DD`` dates and ``HH:MM[:SS]`` times to local seconds."""
+    stamps = [f"{d}T{t}" for d, t in zip(dates, times)]
+    return np.asarray(stamps, dtype="datetime64[s]").astype(np.int64)
+
+
+__all__ = [
+    "ZoneTable",
+    "zone_table",
+    "resolve_offset",
+    "resolve_offsets",
+    "local_seconds",
+    "STATUSES",
+    "TABLE_YEARS",
+]
@@ -0,0 +1,69 @@
+"""Latency, throughput and error of the accuracy tiers.
+
+Run from the repository root::
+
+    python benchmarks/bench_accuracy.py [charts]
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from astrocore.eph import interp, swiss  # noqa: E402
+from astrocore.eph.manager import get_manager  # noqa: E402
+from astrocore.eph.planets import compute_planets, planet_plan  # noqa: E402
+from astrocore.settings import CoreSettingsModel  # noqa: E402
+
+TIERS = ("swiss", "moshier", "interpolated")
+
+
+def run(jds: np.ndarray, accuracy: str):
+    settings = CoreSettingsModel(accuracy=accuracy)
+    latencies = np.empty(jds.size)
+    results = []
+    for i, jd in enumerate(jds):
+        start = perf_counter()
+        results.append(compute_planets(float(jd), settings, 0.0, 0.0, 0.0))
+        latencies[i] = perf_counter() - start
+    return latencies, results
+
+
+def max_error_arcsec(reference, results, names) -> float:
+    worst = 0.0
+    for a, b in zip(reference, results):
+        for name in names:
+            data = a[name]
+            diff = (data["lon_sidereal_deg"] - b[name]["lon_sidereal_deg"] + 180.0) % 360.0 - 180.0
+            worst = max(worst, abs(diff) * 3600.0)
+    return worst
+
+
+def main(charts: int = 20000) -> None:
+    swiss.init_ephemeris(sidereal=False)
+    rng = np.random.default_rng(0)
+    # charts clustered over a few months, as in a preview listing
+    jds = 2460310.5 + np.sort(rng.uniform(0.0, 120.0, charts))
+    # bodies whose reference is the Moshier fallback (no file) are not compared
+    bodies = dict(planet_plan(CoreSettingsModel()).ephemeris)
+    sources = get_manager().sources(float(jds[0]), bodies)
+    names = [name for name, source in sources.items() if source == "swiss"]
+    reference = None
+    print(f"{'tier':<14}{'p50 us':>10}{'p99 us':>10}{'charts/s':>12}{'max err':>10}")
+    for tier in TIERS:
+        interp.cache_clear()
+        latencies, results = run(jds, tier)
+        if reference is None:
+            reference = results
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e6
+        rate = jds.size / latencies.sum()
+        err = max_error_arcsec(reference, results, names)
+        print(f"{tier:<14}{p50:>10.1f}{p99:>10.1f}{rate:>12.0f}{err:>9.3f}\"")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
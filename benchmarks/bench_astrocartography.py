@@ -0,0 +1,80 @@
+"""Analytic astrocartography lines against a compute_axes grid search.
+
+The grid approach evaluates ``compute_axes`` on every cell of a lat/lon grid
+and interpolates where the Ascendant or MC crosses each planet; the analytic
+lines need one set of planet positions.  Both use zodiacal lines so that they
+describe the same curves.  Run from the repository root::
+
+    python benchmarks/bench_astrocartography.py [grid_step_deg]
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from astrocore.constants import ASC_DEG_TROP, MC_DEG_TROP  # noqa: E402
+from astrocore.eph import swiss  # noqa: E402
+from astrocore.eph.astrocartography import astrocartography  # noqa: E402
+from astrocore.eph.axes import compute_axes  # noqa: E402
+from astrocore.eph.base_core import compute_time_geometry  # noqa: E402
+from astrocore.eph.planets import compute_planets  # noqa: E402
+from astrocore.settings import CoreSettingsModel  # noqa: E402
+
+JD_UT = 2460310.5
+MAX_LAT = 60.0
+
+
+def grid_lines(step: float):
+    """Return {(body, angle): {lat: lon}} from a compute_axes grid."""
+    settings = CoreSettingsModel()
+    geometry = compute_time_geometry(JD_UT)
+    planets = compute_planets(JD_UT, settings, geometry["ayanamsa_deg"], 0.0, 0.0)
+    lons = {
+        n: p.get("lon_tropical_deg", p["lon_sidereal_deg"] + geometry["ayanamsa_deg"])
+        for n, p in planets.items()
+    }
+    lat_grid = np.arange(-MAX_LAT, MAX_LAT + step / 2, step)
+    lon_grid = np.arange(-180.0, 180.0 + step / 2, step)
+    found = {}
+    for lat in lat_grid:
+        axes = [compute_axes(JD_UT, 0.0, float(lat), float(lon)) for lon in lon_grid]
+        for angle, key in (("ASC", ASC_DEG_TROP), ("MC", MC_DEG_TROP)):
+            values = np.array([a[key] for a in axes])
+            for name, target in lons.items():
+                diff = (values - target + 180.0) % 360.0 - 180.0
+                for i in np.flatnonzero((diff[:-1] <= 0.0) & (diff[1:] > 0.0) & (diff[1:] - diff[:-1] < 90.0)):
+                    frac = -diff[i] / (diff[i + 1] - diff[i])
+                    found.setdefault((name, angle), {})[round(float(lat), 6)] = lon_grid[i] + frac * step
+    return found, lat_grid.size * lon_grid.size
+
+
+def main(step: float = 1.0) -> None:
+    swiss.init_ephemeris()
+    start = perf_counter()
+    grid, calls = grid_lines(step)
+    grid_s = perf_counter() - start
+
+    start = perf_counter()
+    lines = astrocartography(JD_UT, zodiacal=True, lat_step_deg=step, max_lat_deg=MAX_LAT)
+    analytic_s = perf_counter() - start
+
+    worst = 0.0
+    for rec in lines:
+        points = grid.get((rec["body"], rec["angle"]), {})
+        for poly in rec["polylines"]:
+            for lat, lon in poly:
+                if round(lat, 6) in points:
+                    diff = (points[round(lat, 6)] - lon + 180.0) % 360.0 - 180.0
+                    worst = max(worst, abs(diff))
+    print(f"grid      {calls:>8} compute_axes calls {grid_s * 1e3:>10.1f} ms")
+    print(f"analytic  {len(lines):>8} lines              {analytic_s * 1e3:>10.1f} ms")
+    print(f"speed-up  {grid_s / analytic_s:>8.0f}x   max grid interpolation gap {worst:.4f} deg")
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:2]))
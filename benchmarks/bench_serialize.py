@@ -0,0 +1,67 @@
+"""ChartEncoder against json.dumps on build_base_core results.
+
+Run from the repository root::
+
+    python benchmarks/bench_serialize.py [charts]
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from astrocore import build_base_core  # noqa: E402
+from astrocore.serialize import COMPACT_SEPARATORS, ChartEncoder, msgpack  # noqa: E402
+
+
+def charts(n: int):
+    return [
+        build_base_core(
+            {
+                "date": f"{1950 + i % 70}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+                "time": f"{i % 24:02d}:{i % 60:02d}",
+                "tz_offset_hours": 3.0,
+                "latitude_deg": -60.0 + (i * 7) % 120,
+                "longitude_deg": -180.0 + (i * 13) % 360,
+            }
+        )
+        for i in range(n)
+    ]
+
+
+def timed(cases, cores, rounds: int = 9):
+    """Best time per chart (us) and mean size of each case; rounds interleave cases."""
+    best = dict.fromkeys(cases, float("inf"))
+    sizes = {}
+    for _ in range(rounds):
+        for name, encode in cases.items():
+            start = perf_counter()
+            out = [encode(c) for c in cores]
+            best[name] = min(best[name], perf_counter() - start)
+            sizes[name] = sum(len(o) for o in out) / len(out)
+    return {name: (best[name] / len(cores) * 1e6, sizes[name]) for name in cases}
+
+
+def main(n: int = 500) -> None:
+    cores = charts(n)
+    cases = {
+        "json.dumps": lambda c: json.dumps(c).encode(),
+        "json.dumps compact": lambda c: json.dumps(c, separators=(",", ":")).encode(),
+        "encoder": ChartEncoder().encode_bytes,
+        "encoder compact": ChartEncoder(separators=COMPACT_SEPARATORS).encode_bytes,
+        "encoder compact p6": ChartEncoder(6, COMPACT_SEPARATORS).encode_bytes,
+        "encoder compact p4": ChartEncoder(4, COMPACT_SEPARATORS).encode_bytes,
+    }
+    if msgpack is not None:
+        cases["msgpack"] = ChartEncoder().encode_msgpack
+        cases["msgpack p6"] = ChartEncoder(6).encode_msgpack
+    print(f"{'encoder':<22}{'us/chart':>10}{'bytes':>8}")
+    for name, (us, size) in timed(cases, cores).items():
+        print(f"{name:<22}{us:>10.1f}{size:>8.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,54 @@
+"""Replay captured traffic and compare load test runs.
+
+Capture inputs in the application with ``astrocore.capture.Capture``, then
+run from the repository root::
+
+    python benchmarks/replay.py run traffic.jsonl --workers 4 --mode threads --out base.json
+    python benchmarks/replay.py run traffic.jsonl --workers 4 --mode processes --out new.json
+    python benchmarks/replay.py compare base.json new.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from astrocore import loadtest  # noqa: E402
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="replay a capture file")
+    run.add_argument("capture")
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--mode", choices=loadtest.MODES, default="threads")
+    run.add_argument("--repeat", type=int, default=1)
+    run.add_argument("--warmup", type=int, default=0)
+    run.add_argument("--out", help="write the report as JSON")
+    cmp = sub.add_parser("compare", help="compare two reports")
+    cmp.add_argument("base")
+    cmp.add_argument("new")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = loadtest.replay(
+            loadtest.load_records(args.capture),
+            workers=args.workers,
+            mode=args.mode,
+            repeat=args.repeat,
+            warmup=args.warmup,
+        )
+        print(loadtest.format_report(report))
+        if args.out:
+            Path(args.out).write_text(json.dumps(report, indent=2))
+    else:
+        base, new = (json.loads(Path(p).read_text()) for p in (args.base, args.new))
+        print(loadtest.format_comparison(loadtest.compare(base, new)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Vectorized Bhinnashtakavarga and Sarvashtakavarga.
+
+The Parashari benefic-point rules (:data:`BENEFIC_HOUSES`) are compiled once
+into :data:`POINTS`, a ``(contributor, sign, planet, sign)`` table holding the
+points each contributor gives from each sign it can occupy.  A chart is then
+one gather on the contributor signs and one sum, and an array of charts shaped
+``(..., 8)`` is scored in the same two operations.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from astrocore.constants import ASC_DEG_SID
+from .signs import lon_to_sign_index
+
+PLANETS: Tuple[str, ...] = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+CONTRIBUTORS: Tuple[str, ...] = PLANETS + ("Ascendant",)
+
+# planet: {contributor: houses counted from the contributor that get a point}
+BENEFIC_HOUSES: Dict[str, Dict[str, Tuple[int, ...]]] = {
+    "Sun": {
+        "Sun": (1, 2, 4, 7, 8, 9, 10, 11),
+        "Moon": (3, 6, 10, 11),
+        "Mars": (1, 2, 4, 7, 8, 9, 10, 11),
+        "Mercury": (3, 5, 6, 9, 10, 11, 12),
+        "Jupiter": (5, 6, 9, 11),
+        "Venus": (6, 7, 12),
+        "Saturn": (1, 2, 4, 7, 8, 9, 10, 11),
+        "Ascendant": (3, 4, 6, 10, 11, 12),
+    },
+    "Moon": {
+        "Sun": (3, 6, 7, 8, 10, 11),
+        "Moon": (1, 3, 6, 7, 10, 11),
+        "Mars": (2, 3, 5, 6, 9, 10, 11),
+        "Mercury": (1, 3, 4, 5, 7, 8, 10, 11),
+        "Jupiter": (1, 4, 7, 8, 10, 11, 12),
+        "Venus": (3, 4, 5, 7, 9, 10, 11),
+        "Saturn": (3, 5, 6, 11),
+        "Ascendant": (3, 6, 10, 11),
+    },
+    "Mars": {
+        "Sun": (3, 5, 6, 10, 11),
+        "Moon": (3, 6, 11),
+        "Mars": (1, 2, 4, 7, 8, 10, 11),
+        "Mercury": (3, 5, 6, 11),
+        "Jupiter": (6, 10, 11, 12),
+        "Venus": (6, 8, 11, 12),
+        "Saturn": (1, 4, 7, 8, 9, 10, 11),
+        "Ascendant": (1, 3, 6, 10, 11),
+    },
+    "Mercury": {
+        "Sun": (5, 6, 9, 11, 12),
+        "Moon": (2, 4, 6, 8, 10, 11),
+        "Mars": (1, 2, 4, 7, 8, 9, 10, 11),
+        "Mercury": (1, 3, 5, 6, 9, 10, 11, 12),
+        "Jupiter": (6, 8, 11, 12),
+        "Venus": (1, 2, 3, 4, 5, 8, 9, 11),
+        "Saturn": (1, 2, 4, 7, 8, 9, 10, 11),
+        "Ascendant": (1, 2, 4, 6, 8, 10, 11),
+    },
+    "Jupiter": {
+        "Sun": (1, 2, 3, 4, 7, 8, 9, 10, 11),
+        "Moon": (2, 5, 7, 9, 11),
+        "Mars": (1, 2, 4, 7, 8, 10, 11),
+        "Mercury": (1, 2, 4, 5, 6, 9, 10, 11),
+        "Jupiter": (1, 2, 3, 4, 7, 8, 10, 11),
+        "Venus": (2, 5, 6, 9, 10, 11),
+        "Saturn": (3, 5, 6, 12),
+        "Ascendant": (1, 2, 4, 5, 6, 7, 9, 10, 11),
+    },
+    "Venus": {
+        "Sun": (8, 11, 12),
+        "Moon": (1, 2, 3, 4, 5, 8, 9, 11, 12),
+        "Mars": (3, 5, 6, 9, 11, 12),
+        "Mercury": (3, 5, 6, 9, 11),
+        "Jupiter": (5, 8, 9, 10, 11),
+        "Venus": (1, 2, 3, 4, 5, 8, 9, 10, 11),
+        "Saturn": (3, 4, 5, 8, 9, 10, 11),
+        "Ascendant": (1, 2, 3, 4, 5, 8, 9, 11),
+    },
+    "Saturn": {
+        "Sun": (1, 2, 4, 7, 8, 10, 11),
+        "Moon": (3, 6, 11),
+        "Mars": (3, 5, 6, 10, 11, 12),
+        "Mercury": (6, 8, 9, 10, 11, 12),
+        "Jupiter": (5, 6, 11, 12),
+        "Venus": (6, 11, 12),
+        "Saturn": (3, 5, 6, 11),
+        "Ascendant": (1, 3, 4, 6, 10, 11),
+    },
+}
+
+
+def _compile_masks() -> np.ndarray:
+    """Return the rules as 12-bit masks, bit ``h - 1`` set for house ``h``."""
+    masks = np.zeros((len(PLANETS), len(CONTRIBUTORS)), dtype=np.uint16)
+    for p, planet in enumerate(PLANETS):
+        for c, contributor in enumerate(CONTRIBUTORS):
+            for house in BENEFIC_HOUSES[planet][contributor]:
+                masks[p, c] |= 1 << (house - 1)
+    return masks
+
+
+def _compile_points(masks: np.ndarray) -> np.ndarray:
+    """Expand masks into points per (contributor, contributor sign, planet, sign)."""
+    signs = np.arange(12)
+    # house of each target sign counted from each contributor sign, 0-based
+    house = (signs[None, :] - signs[:, None]) % 12
+    bits = (masks[:, :, None, None] >> house[None, None, :, :].astype(np.uint16)) & 1
+    # (planet, contributor, from, to) -> (contributor, from, planet, to)
+    return np.ascontiguousarray(bits.transpose(1, 2, 0, 3).astype(np.uint8))
+
+
+MASKS = _compile_masks()
+POINTS = _compile_points(MASKS)
+_CONTRIBUTOR_INDEX = np.arange(len(CONTRIBUTORS))
+
+
+def bhinnashtakavarga(signs) -> np.ndarray:
+    """Return benefic points per planet and sign.
+
+    Args:
+        signs: Sign indices (0 = Aries) of the :data:`CONTRIBUTORS`, shape
+            ``(..., 8)``.
+
+    Returns:
+        Array of shape ``(..., 7, 12)`` with the points of each planet in
+        :data:`PLANETS` order, per sign from Aries.
+    """
+    signs = np.asarray(signs, dtype=np.intp)
+    if signs.shape[-1] != len(CONTRIBUTORS):
+        raise ValueError(f"expected {len(CONTRIBUTORS)} contributor signs, got {signs.shape[-1]}")
+    return POINTS[_CONTRIBUTOR_INDEX, signs].sum(axis=-3, dtype=np.int16)
+
+
+def sarvashtakavarga(bav: np.ndarray) -> np.ndarray:
+    """Sum :func:`bhinnashtakavarga` points over planets, shape ``(..., 12)``."""
+    return np.asarray(bav).sum(axis=-2)
+
+
+def contributor_signs(
+    planets: Mapping[str, Mapping[str, float]], axes: Mapping[str, float]
+) -> np.ndarray:
+    """Collect the sidereal signs of the contributors from core outputs."""
+    lons = [planets[name]["lon_sidereal_deg"] for name in PLANETS] + [axes[ASC_DEG_SID]]
+    return lon_to_sign_index(lons)[0]
+
+
+def ashtakavarga_batch(longitudes) -> Tuple[np.ndarray, np.ndarray]:
+    """Score charts given as sidereal longitudes shaped ``(charts, 8)``.
+
+    Columns follow :data:`CONTRIBUTORS`.  Returns ``(bav, sav)`` with shapes
+    ``(charts, 7, 12)`` and ``(charts, 12)``.
+    """
+    bav = bhinnashtakavarga(lon_to_sign_index(longitudes)[0])
+    return bav, sarvashtakavarga(bav)
+
+
+def ashtakavarga(
+    planets: Mapping[str, Mapping[str, float]], axes: Mapping[str, float]
+) -> Dict[str, object]:
+    """Return Bhinnashtakavarga and Sarvashtakavarga of one chart.
+
+    Args:
+        planets: ``compute_planets`` output with the seven classical planets.
+        axes: ``compute_axes`` output.
+
+    Returns:
+        ``{"bav": {planet: [12 points]}, "sav": [12 points]}``, signs counted
+        from Aries.
+    """
+    bav = bhinnashtakavarga(contributor_signs(planets, axes))
+    bav_rows: List[List[int]] = bav.tolist()
+    return {
+        "bav": dict(zip(PLANETS, bav_rows)),
+        "sav": sarvashtakavarga(bav).tolist(),
+    }
+
+
+__all__ = [
+    "PLANETS",
+    "CONTRIBUTORS",
+    "BENEFIC_HOUSES",
+    "MASKS",
+    "POINTS",
+    "bhinnashtakavarga",
+    "sarvashtakavarga",
+    "contributor_signs",
+    "ashtakavarga_batch",
+    "ashtakavarga",
+]
@@ -0,0 +1,226 @@
+"""Vectorized aspect and conjunction matrices.
+
+Separations are computed with NumPy over arrays of sidereal longitudes shaped
+``(..., n)`` so that a single chart, a synastry pair (chart A × chart B) and a
+batch of charts all go through the same kernels.  Only the hits within orb are
+returned, as flat index arrays.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from astrocore.constants import ASC_DEG_SID, MC_DEG_SID
+
+# Aspect angles in degrees and default orbs.
+ASPECTS: Dict[str, float] = {
+    "conjunction": 0.0,
+    "sextile": 60.0,
+    "square": 90.0,
+    "trine": 120.0,
+    "opposition": 180.0,
+}
+
+DEFAULT_ORBS: Dict[str, float] = {
+    "conjunction": 8.0,
+    "sextile": 6.0,
+    "square": 7.0,
+    "trine": 7.0,
+    "opposition": 8.0,
+}
+
+DEFAULT_BODIES: Tuple[str, ...] = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Rahu",
+    "Ketu",
+)
+
+DEFAULT_AXES: Tuple[str, ...] = (ASC_DEG_SID, MC_DEG_SID)
+
+
+@dataclass
+class AspectHits:
+    """Sparse list of aspect hits.
+
+    All arrays have the same length, one entry per hit.  ``chart`` indexes the
+    leading batch dimension (``0`` for a single chart), ``i`` and ``j`` index
+    the bodies of side A and side B, ``aspect`` indexes :attr:`aspect_names`.
+    """
+
+    chart: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+    aspect: np.ndarray
+    separation_deg: np.ndarray
+    orb_deg: np.ndarray
+    aspect_names: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.chart.shape[0])
+
+
+def chart_longitudes(
+    planets: Mapping[str, Mapping[str, float]],
+    axes: Mapping[str, float] | None = None,
+    bodies: Sequence[str] = DEFAULT_BODIES,
+    axis_keys: Sequence[str] = DEFAULT_AXES,
+) -> Tuple[List[str], np.ndarray]:
+    """Collect sidereal longitudes from ``planets`` and ``axes`` outputs.
+
+    Returns:
+        A tuple of (labels, longitudes) where longitudes is a 1-D array.
+    """
+
+    labels: List[str] = []
+    values: List[float] = []
+    for name in bodies:
+        if name in planets:
+            labels.append(name)
+            values.append(planets[name]["lon_sidereal_deg"])
+    if axes is not None:
+        for key in axis_keys:
+            if key in axes:
+                labels.append(key)
+                values.append(axes[key])
+    return labels, np.asarray(values, dtype=float)
+
+
+def separation_matrix(lon_a: np.ndarray, lon_b: np.ndarray | None = None) -> np.ndarray:
+    """Return shortest angular separations in ``[0, 180]``.
+
+    ``lon_a`` has shape ``(..., n)`` and ``lon_b`` shape ``(..., m)``; leading
+    dimensions broadcast.  The result has shape ``(..., n, m)``.  Without
+    ``lon_b`` the matrix of ``lon_a`` against itself is returned.
+    """
+
+    a = np.asarray(lon_a, dtype=float)
+    b = a if lon_b is None else np.asarray(lon_b, dtype=float)
+    diff = np.abs(a[..., :, None] - b[..., None, :]) % 360.0
+    return np.minimum(diff, 360.0 - diff)
+
+
+def _aspect_table(
+    aspects: Mapping[str, float] | None, orbs: Mapping[str, float] | None
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    aspects = ASPECTS if aspects is None else aspects
+    orbs = DEFAULT_ORBS if orbs is None else orbs
+    names = tuple(aspects)
+    missing = [n for n in names if n not in orbs]
+    if missing:
+        raise ValueError(f"no orb given for aspects: {', '.join(missing)}")
+    angles = np.array([aspects[n] for n in names], dtype=float)
+    orb_arr = np.array([orbs[n] for n in names], dtype=float)
+    return names, angles, orb_arr
+
+
+def find_aspects(
+    lon_a: np.ndarray,
+    lon_b: np.ndarray | None = None,
+    aspects: Mapping[str, float] | None = None,
+    orbs: Mapping[str, float] | None = None,
+    chunk_size: int = 4096,
+) -> AspectHits:
+    """Classify separations into aspects and return the sparse hit list.
+
+    Args:
+        lon_a: Longitudes of side A, shape ``(n,)`` or ``(charts, n)``.
+        lon_b: Longitudes of side B for synastry, shape ``(m,)`` or
+            ``(charts, m)``.  When omitted, side A is compared with itself and
+            only pairs ``i < j`` are reported.
+        aspects: Mapping of aspect name to exact angle in degrees.
+        orbs: Mapping of aspect name to allowed orb in degrees.
+        chunk_size: Number of charts processed per NumPy pass.
+
+    Returns:
+        :class:`AspectHits` with one entry per (chart, i, j, aspect) in orb.
+    """
+
+    names, angles, orb_arr = _aspect_table(aspects, orbs)
+    natal = lon_b is None
+    a = np.atleast_2d(np.asarray(lon_a, dtype=float))
+    b = a if natal else np.atleast_2d(np.asarray(lon_b, dtype=float))
+    if a.shape[0] != b.shape[0]:
+        if a.shape[0] == 1:
+            a = np.broadcast_to(a, (b.shape[0], a.shape[1]))
+        elif b.shape[0] == 1:
+            b = np.broadcast_to(b, (a.shape[0], b.shape[1]))
+        else:
+            raise ValueError("chart batches of A and B differ in length")
+
+    pair_mask = None
+    if natal:
+        n = a.shape[1]
+        pair_mask = np.triu(np.ones((n, n), dtype=bool), k=1)
+
+    parts: List[Tuple[np.ndarray, ...]] = []
+    for start in range(0, a.shape[0], chunk_size):
+        sep = separation_matrix(a[start:start + chunk_size], b[start:start + chunk_size])
+        orb = np.abs(sep[..., None] - angles)
+        hit = orb <= orb_arr
+        if pair_mask is not None:
+            hit &= pair_mask[None, :, :, None]
+        c, i, j, k = np.nonzero(hit)
+        parts.append((c + start, i, j, k, sep[c, i, j], orb[c, i, j, k]))
+
+    if parts:
+        cols = [np.concatenate(col) for col in zip(*parts)]
+    else:
+        cols = [np.empty(0, dtype=np.intp)] * 4 + [np.empty(0)] * 2
+    return AspectHits(*cols, aspect_names=names)
+
+
+def chart_aspects(
+    core_a: Mapping[str, object],
+    core_b: Mapping[str, object] | None = None,
+    aspects: Mapping[str, float] | None = None,
+    orbs: Mapping[str, float] | None = None,
+    bodies: Sequence[str] = DEFAULT_BODIES,
+    axis_keys: Sequence[str] = DEFAULT_AXES,
+) -> List[Dict[str, object]]:
+    """Return aspects of a ``build_base_core`` result as a list of dicts.
+
+    With ``core_b`` the result lists synastry aspects between the two charts.
+    """
+
+    labels_a, lon_a = chart_longitudes(core_a["planets"], core_a.get("axes"), bodies, axis_keys)
+    labels_b, lon_b = labels_a, None
+    if core_b is not None:
+        labels_b, lon_b = chart_longitudes(core_b["planets"], core_b.get("axes"), bodies, axis_keys)
+    hits = find_aspects(lon_a, lon_b, aspects, orbs)
+    return [
+        {
+            "body_a": labels_a[i],
+            "body_b": labels_b[j],
+            "aspect": hits.aspect_names[k],
+            "separation_deg": float(sep),
+            "orb_deg": float(orb),
+        }
+        for i, j, k, sep, orb in zip(
+            hits.i.tolist(),
+            hits.j.tolist(),
+            hits.aspect.tolist(),
+            hits.separation_deg,
+            hits.orb_deg,
+        )
+    ]
+
+
+__all__ = [
+    "ASPECTS",
+    "DEFAULT_ORBS",
+    "DEFAULT_BODIES",
+    "DEFAULT_AXES",
+    "AspectHits",
+    "chart_longitudes",
+    "separation_matrix",
+    "find_aspects",
+    "chart_aspects",
+]
@@ -0,0 +1,200 @@
+"""Krishnamurti Paddhati (KP) star, sub and sub-sub lords.
+
+The zodiac is cut once into the 249 KP subs: each nakshatra is divided in the
+Vimshottari proportions starting from its star lord, and the subs crossing a
+sign border are split in two.  Sub-subs divide each sub again from its sub
+lord (2193 divisions).  Boundaries are kept as sorted arrays, so resolving a
+longitude is a binary search (``bisect`` for one value, ``searchsorted`` for
+arrays) instead of a walk over the dasha proportions.
+
+Longitudes are sidereal, normally with the "Krishnamurti" ayanamsa.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple
+
+import numpy as np
+
+from .nakshatras import lon_to_nakshatra
+from .signs import SIGNS
+
+# Vimshottari dasha lords and years, in sequence from Ketu.
+VIMSHOTTARI: Tuple[Tuple[str, int], ...] = (
+    ("Ketu", 7),
+    ("Venus", 20),
+    ("Sun", 6),
+    ("Moon", 10),
+    ("Mars", 7),
+    ("Rahu", 18),
+    ("Jupiter", 16),
+    ("Saturn", 19),
+    ("Mercury", 17),
+)
+LORDS: Tuple[str, ...] = tuple(lord for lord, _ in VIMSHOTTARI)
+SIGN_LORDS: Tuple[str, ...] = (
+    "Mars",
+    "Venus",
+    "Mercury",
+    "Moon",
+    "Sun",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Saturn",
+    "Jupiter",
+)
+
+_NAKSHATRA_SPAN = Fraction(40, 3)
+_TOTAL_YEARS = sum(years for _, years in VIMSHOTTARI)
+
+
+class KPTable(NamedTuple):
+    """Sorted division starts (degrees) and the lords of each division."""
+
+    starts: np.ndarray
+    star_lord: np.ndarray
+    sub_lord: np.ndarray
+    sub_sub_lord: np.ndarray | None
+    starts_list: List[float]
+
+
+def _divide(start: Fraction, span: Fraction, first: int) -> List[Tuple[Fraction, int]]:
+    """Vimshottari divisions of ``span`` starting with lord index ``first``."""
+    out = []
+    for k in range(9):
+        lord = (first + k) % 9
+        out.append((start, lord))
+        start += span * VIMSHOTTARI[lord][1] / _TOTAL_YEARS
+    return out
+
+
+def _build(sub_sub: bool) -> KPTable:
+    rows: List[Tuple[Fraction, int, int, int]] = []
+    for n in range(27):
+        star = n % 9
+        nak_start = n * _NAKSHATRA_SPAN
+        subs = _divide(nak_start, _NAKSHATRA_SPAN, star)
+        for s, (sub_start, sub) in enumerate(subs):
+            sub_end = subs[s + 1][0] if s < 8 else nak_start + _NAKSHATRA_SPAN
+            if sub_sub:
+                for start, lord in _divide(sub_start, sub_end - sub_start, sub):
+                    rows.append((start, star, sub, lord))
+            else:
+                rows.append((sub_start, star, sub, -1))
+    # split the divisions crossing a sign border
+    for sign in range(12):
+        border = Fraction(30 * sign)
+        i = bisect_right([r[0] for r in rows], border) - 1
+        if rows[i][0] != border:
+            rows.insert(i + 1, (border,) + rows[i][1:])
+    starts = [float(r[0]) for r in rows]
+    lords = np.array([r[1:] for r in rows], dtype=np.int8)
+    return KPTable(
+        np.array(starts),
+        lords[:, 0],
+        lords[:, 1],
+        lords[:, 2] if sub_sub else None,
+        starts,
+    )
+
+
+@lru_cache(maxsize=2)
+def kp_table(sub_sub: bool = False) -> KPTable:
+    """Return the 249-sub table, or the sub-sub table with ``sub_sub=True``."""
+    return _build(sub_sub)
+
+
+def kp_index(lon, sub_sub: bool = False) -> np.ndarray:
+    """Return rows of :func:`kp_table` for an array of sidereal longitudes."""
+    table = kp_table(sub_sub)
+    lon = np.mod(np.asarray(lon, dtype=float), 360.0)
+    # tiny negative inputs round up to 360.0
+    lon = np.where(lon >= 360.0, 0.0, lon)
+    return np.searchsorted(table.starts, lon, side="right") - 1
+
+
+def kp_lookup(lon: float, sub_sub: bool = False) -> Dict[str, Any]:
+    """Return sign, nakshatra and KP lords of one sidereal longitude.
+
+    ``sub_number`` is the 1-based KP sub number (1..249).
+    """
+    lon = lon % 360.0
+    if lon >= 360.0:  # tiny negative inputs round up to 360.0
+        lon = 0.0
+    table = kp_table(False)
+    i = bisect_right(table.starts_list, lon) - 1
+    sign = min(int(lon // 30.0), 11)
+    result: Dict[str, Any] = {
+        "sign": SIGNS[sign],
+        "sign_lord": SIGN_LORDS[sign],
+        "nakshatra": lon_to_nakshatra(lon)[0],
+        "star_lord": LORDS[table.star_lord[i]],
+        "sub_lord": LORDS[table.sub_lord[i]],
+        "sub_number": i + 1,
+    }
+    if sub_sub:
+        deep = kp_table(True)
+        j = bisect_right(deep.starts_list, lon) - 1
+        result["sub_sub_lord"] = LORDS[deep.sub_sub_lord[j]]
+    return result
+
+
+def kp_lords(lon, sub_sub: bool = False) -> Dict[str, np.ndarray]:
+    """Array version of :func:`kp_lookup` returning lord indices into :data:`LORDS`."""
+    table = kp_table(False)
+    idx = kp_index(lon)
+    out = {
+        "star_lord": table.star_lord[idx],
+        "sub_lord": table.sub_lord[idx],
+        "sub_number": idx + 1,
+    }
+    if sub_sub:
+        out["sub_sub_lord"] = kp_table(True).sub_sub_lord[kp_index(lon, True)]
+    return out
+
+
+def kp_planets(
+    planets: Mapping[str, Mapping[str, float]], sub_sub: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Apply :func:`kp_lookup` to every body of a ``compute_planets`` result."""
+    return {
+        name: kp_lookup(data["lon_sidereal_deg"], sub_sub)
+        for name, data in planets.items()
+        if "lon_sidereal_deg" in data
+    }
+
+
+def kp_cusps(houses: Mapping[str, Any], sub_sub: bool = False) -> List[Dict[str, Any]]:
+    """Apply :func:`kp_lookup` to the twelve Placidus cusps of ``compute_houses``.
+
+    KP cusps are the house borders, so the request must use
+    ``house_system="placidus"`` (alone or among several systems) with
+    ``options={"return_borders": True}``.
+    """
+    data = houses["houses"]
+    if "placidus" in data:
+        data = data["placidus"]
+    elif houses["meta"]["house_system"] != "placidus":
+        raise ValueError("KP cusps need Placidus houses")
+    if "borders_deg_sid" not in data:
+        raise ValueError("KP cusps need house borders (options return_borders)")
+    return [kp_lookup(lon, sub_sub) for lon in data["borders_deg_sid"]]
+
+
+__all__ = [
+    "VIMSHOTTARI",
+    "LORDS",
+    "SIGN_LORDS",
+    "KPTable",
+    "kp_table",
+    "kp_index",
+    "kp_lookup",
+    "kp_lords",
+    "kp_planets",
+    "kp_cusps",
+]
@@ -0,0 +1,175 @@
+"""Vectorized midpoints, midpoint sorts and harmonic charts.
+
+Like :mod:`derived.aspects`, every kernel takes longitudes shaped ``(..., n)``
+so one chart and a batch of charts share the same code.  Midpoints are the
+nearer midpoints; dial positions are midpoints modulo ``dial_deg`` (90° for
+the cosmobiology dial, where conjunctions, squares and oppositions coincide).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .aspects import DEFAULT_AXES, DEFAULT_BODIES, chart_longitudes
+
+DEFAULT_DIAL_DEG = 90.0
+DEFAULT_ORB_DEG = 1.5
+
+
+@dataclass
+class MidpointSort:
+    """Points and pair midpoints of each chart sorted by dial position.
+
+    Arrays have shape ``(..., k)`` with ``k = n (n + 1) / 2``; entries with
+    ``i == j`` are the points themselves.
+    """
+
+    position_deg: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+
+
+@dataclass
+class MidpointHits:
+    """Sparse list of points standing on midpoints, one entry per hit.
+
+    ``chart`` indexes the batch, ``body`` the activating point (side B),
+    ``i`` and ``j`` the pair of side A whose midpoint it occupies.
+    """
+
+    chart: np.ndarray
+    body: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+    orb_deg: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.chart.shape[0])
+
+
+def midpoint_matrix(lon) -> np.ndarray:
+    """Return nearer midpoints of every pair, shape ``(..., n, n)`` in ``[0, 360)``."""
+    a = np.asarray(lon, dtype=float)
+    diff = (a[..., None, :] - a[..., :, None] + 180.0) % 360.0 - 180.0
+    return np.mod(a[..., :, None] + diff / 2.0, 360.0)
+
+
+def harmonic_longitudes(lon, harmonics: int | Sequence[int]) -> np.ndarray:
+    """Return harmonic charts ``lon * h mod 360``.
+
+    ``harmonics`` is either ``N`` (for ``h = 1..N``) or explicit numbers; the
+    result has shape ``(..., len(harmonics), n)``.
+    """
+    h = np.arange(1, harmonics + 1) if np.ndim(harmonics) == 0 else np.asarray(harmonics)
+    a = np.asarray(lon, dtype=float)
+    return np.mod(a[..., None, :] * h[:, None], 360.0)
+
+
+def midpoint_sort(lon, dial_deg: float = DEFAULT_DIAL_DEG) -> MidpointSort:
+    """Sort points and pair midpoints by position on the dial."""
+    a = np.asarray(lon, dtype=float)
+    n = a.shape[-1]
+    i, j = np.triu_indices(n)
+    position = np.mod(midpoint_matrix(a)[..., i, j], dial_deg)
+    order = np.argsort(position, axis=-1, kind="stable")
+    return MidpointSort(
+        np.take_along_axis(position, order, axis=-1), i[order], j[order]
+    )
+
+
+def midpoint_activations(
+    lon_a,
+    lon_b=None,
+    orb_deg: float = DEFAULT_ORB_DEG,
+    dial_deg: float = DEFAULT_DIAL_DEG,
+    chunk_size: int = 4096,
+) -> MidpointHits:
+    """Find points of side B within ``orb_deg`` of midpoints of side A on the dial.
+
+    Args:
+        lon_a: Longitudes whose pair midpoints are searched, ``(n,)`` or
+            ``(charts, n)``.
+        lon_b: Activating longitudes (transits, a partner chart), ``(m,)`` or
+            ``(charts, m)``.  When omitted, side A activates its own midpoints
+            and points are not matched against pairs they belong to.
+        orb_deg: Allowed distance on the dial.
+        dial_deg: Dial size; ``360`` compares plain midpoints.
+        chunk_size: Number of charts processed per NumPy pass.
+    """
+    natal = lon_b is None
+    a = np.atleast_2d(np.asarray(lon_a, dtype=float))
+    b = a if natal else np.atleast_2d(np.asarray(lon_b, dtype=float))
+    if a.shape[0] != b.shape[0]:
+        if a.shape[0] == 1:
+            a = np.broadcast_to(a, (b.shape[0], a.shape[1]))
+        elif b.shape[0] == 1:
+            b = np.broadcast_to(b, (a.shape[0], b.shape[1]))
+        else:
+            raise ValueError("chart batches of A and B differ in length")
+
+    pi, pj = np.triu_indices(a.shape[1], k=1)
+    own = None
+    if natal:
+        body = np.arange(b.shape[1])[:, None]
+        own = (body == pi) | (body == pj)
+
+    parts: List[Tuple[np.ndarray, ...]] = []
+    for start in range(0, a.shape[0], chunk_size):
+        mids = midpoint_matrix(a[start:start + chunk_size])[:, pi, pj]
+        d = np.mod(b[start:start + chunk_size, :, None] - mids[:, None, :], dial_deg)
+        sep = np.minimum(d, dial_deg - d)
+        hit = sep <= orb_deg
+        if own is not None:
+            hit &= ~own
+        c, k, p = np.nonzero(hit)
+        parts.append((c + start, k, pi[p], pj[p], sep[c, k, p]))
+
+    if parts:
+        cols = [np.concatenate(col) for col in zip(*parts)]
+    else:
+        cols = [np.empty(0, dtype=np.intp)] * 4 + [np.empty(0)]
+    return MidpointHits(*cols)
+
+
+def chart_midpoints(
+    core_a: Mapping[str, object],
+    core_b: Mapping[str, object] | None = None,
+    orb_deg: float = DEFAULT_ORB_DEG,
+    dial_deg: float = DEFAULT_DIAL_DEG,
+    bodies: Sequence[str] = DEFAULT_BODIES,
+    axis_keys: Sequence[str] = DEFAULT_AXES,
+) -> List[Dict[str, object]]:
+    """Return midpoint activations of a ``build_base_core`` result as dicts.
+
+    With ``core_b`` its points activate the midpoints of ``core_a``.
+    """
+    labels_a, lon_a = chart_longitudes(core_a["planets"], core_a.get("axes"), bodies, axis_keys)
+    labels_b, lon_b = labels_a, None
+    if core_b is not None:
+        labels_b, lon_b = chart_longitudes(core_b["planets"], core_b.get("axes"), bodies, axis_keys)
+    hits = midpoint_activations(lon_a, lon_b, orb_deg, dial_deg)
+    rows = [
+        {
+            "body": labels_b[k],
+            "midpoint": (labels_a[i], labels_a[j]),
+            "orb_deg": float(orb),
+        }
+        for k, i, j, orb in zip(hits.body.tolist(), hits.i.tolist(), hits.j.tolist(), hits.orb_deg)
+    ]
+    rows.sort(key=lambda r: r["orb_deg"])
+    return rows
+
+
+__all__ = [
+    "DEFAULT_DIAL_DEG",
+    "DEFAULT_ORB_DEG",
+    "MidpointSort",
+    "MidpointHits",
+    "midpoint_matrix",
+    "harmonic_longitudes",
+    "midpoint_sort",
+    "midpoint_activations",
+    "chart_midpoints",
+]
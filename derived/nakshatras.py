@@ -0,0 +1,59 @@
+"""Lunar mansion (nakshatra) utilities."""
+from __future__ import annotations
+
+import numpy as np
+
+NAKSHATRAS = [
+    "Ashwini",
+    "Bharani",
+    "Krittika",
+    "Rohini",
+    "Mrigashira",
+    "Ardra",
+    "Punarvasu",
+    "Pushya",
+    "Ashlesha",
+    "Magha",
+    "Purva Phalguni",
+    "Uttara Phalguni",
+    "Hasta",
+    "Chitra",
+    "Swati",
+    "Vishakha",
+    "Anuradha",
+    "Jyeshtha",
+    "Mula",
+    "Purva Ashadha",
+    "Uttara Ashadha",
+    "Shravana",
+    "Dhanishta",
+    "Shatabhisha",
+    "Purva Bhadrapada",
+    "Uttara Bhadrapada",
+    "Revati",
+]
+
+NAKSHATRA_SPAN_DEG = 360.0 / 27.0
+
+
+def lon_to_nakshatra(lon: float) -> tuple[str, float]:
+    """Return nakshatra name and degrees within it for a sidereal longitude.
+
+    Args:
+        lon: Sidereal longitude in degrees (0..360 range accepted).
+
+    Returns:
+        A tuple of (nakshatra_name, degrees_in_nakshatra).
+    """
+    lon = lon % 360.0
+    idx = min(int(lon // NAKSHATRA_SPAN_DEG), 26)
+    return NAKSHATRAS[idx], lon - idx * NAKSHATRA_SPAN_DEG
+
+
+def nakshatra_index(lon) -> np.ndarray:
+    """Return zero-based nakshatra indices for an array of longitudes."""
+    lon = np.mod(np.asarray(lon, dtype=float), 360.0)
+    return np.minimum((lon // NAKSHATRA_SPAN_DEG).astype(np.int8), 26)
+
+
+__all__ = ["NAKSHATRAS", "NAKSHATRA_SPAN_DEG", "lon_to_nakshatra", "nakshatra_index"]
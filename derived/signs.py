@@ -1,6 +1,8 @@
 """Zodiac sign utilities."""
 from __future__ import annotations
 
+import numpy as np
+
 SIGNS = [
     "Aries",
     "Taurus",
@@ -31,4 +33,19 @@ def lon_to_sign_deg(lon: float) -> tuple[str, float]:
     return SIGNS[idx], lon - idx * 30.0
 
 
-__all__ = ["lon_to_sign_deg", "SIGNS"]
+def lon_to_sign_index(lon) -> tuple[np.ndarray, np.ndarray]:
+    """Array version of :func:`lon_to_sign_deg`.
+
+    Args:
+        lon: Array of longitudes in degrees.
+
+    Returns:
+        A tuple of (sign_indices, degrees_in_sign) arrays; indices point into
+        :data:`SIGNS`.
+    """
+    lon = np.mod(np.asarray(lon, dtype=float), 360.0)
+    idx = (lon // 30.0).astype(np.int64)
+    return idx, lon - idx * 30.0
+
+
+__all__ = ["lon_to_sign_deg", "lon_to_sign_index", "SIGNS"]
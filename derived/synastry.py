@@ -0,0 +1,248 @@
+"""One-to-many synastry scoring over a compact store of chart longitudes.
+
+Stored charts are packed once into a ``(charts, bodies)`` ``float32`` matrix of
+sidereal longitudes plus the Moon nakshatra index, taken from the ``float64``
+longitude like that of the query chart.  A query chart is scored
+against every stored chart with a handful of column-wise NumPy kernels, one per
+weighted body pair, so no ``build_base_core`` call is needed for candidates.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from astrocore.constants import ASC_DEG_SID
+from .aspects import ASPECTS, DEFAULT_ORBS
+from .nakshatras import nakshatra_index
+
+STORE_BODIES: Tuple[str, ...] = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Rahu",
+    ASC_DEG_SID,
+)
+
+# Weight of each (query body, stored body) pair in the total score.
+DEFAULT_PAIR_WEIGHTS: Dict[Tuple[str, str], float] = {
+    ("Sun", "Moon"): 1.0,
+    ("Moon", "Sun"): 1.0,
+    ("Moon", "Moon"): 1.0,
+    ("Venus", "Mars"): 1.0,
+    ("Mars", "Venus"): 1.0,
+    ("Venus", "Venus"): 0.5,
+    ("Sun", "Sun"): 0.5,
+    (ASC_DEG_SID, ASC_DEG_SID): 0.5,
+    ("Moon", ASC_DEG_SID): 0.5,
+    (ASC_DEG_SID, "Moon"): 0.5,
+}
+
+# Harmony of each aspect; negative values penalise tense contacts.
+DEFAULT_ASPECT_WEIGHTS: Dict[str, float] = {
+    "conjunction": 1.0,
+    "sextile": 0.6,
+    "square": -0.6,
+    "trine": 0.8,
+    "opposition": -0.3,
+}
+
+# Tara (count from the query Moon nakshatra to the stored one, modulo 9) scores:
+# Janma, Sampat, Vipat, Kshema, Pratyak, Sadhana, Naidhana, Mitra, Parama Mitra.
+TARA_SCORES = np.array([0.0, 1.0, -1.0, 1.0, -1.0, 1.0, -1.0, 1.0, 1.0], dtype=np.float32)
+
+
+@dataclass
+class ChartLongitudes:
+    """Compact column store of chart longitudes used for matching."""
+
+    ids: np.ndarray
+    lon_deg: np.ndarray
+    moon_nakshatra: np.ndarray
+    bodies: Tuple[str, ...] = STORE_BODIES
+    _columns: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.ids = np.asarray(self.ids)
+        self.lon_deg = np.mod(np.asarray(self.lon_deg, dtype=np.float32), np.float32(360.0))
+        self.moon_nakshatra = np.asarray(self.moon_nakshatra, dtype=np.int8)
+        if self.lon_deg.ndim != 2 or self.lon_deg.shape[1] != len(self.bodies):
+            raise ValueError("lon_deg must have shape (charts, len(bodies))")
+        if not (len(self.ids) == len(self.lon_deg) == len(self.moon_nakshatra)):
+            raise ValueError("ids, lon_deg and moon_nakshatra differ in length")
+        self._columns = {name: i for i, name in enumerate(self.bodies)}
+
+    def __len__(self) -> int:
+        return int(self.lon_deg.shape[0])
+
+    def column(self, name: str) -> int:
+        return self._columns[name]
+
+    @classmethod
+    def from_cores(
+        cls,
+        cores: Iterable[Mapping[str, object]],
+        ids: Sequence[object] | None = None,
+        bodies: Sequence[str] = STORE_BODIES,
+    ) -> "ChartLongitudes":
+        """Pack ``build_base_core`` outputs into a compact store."""
+        rows = [pack_chart(core, bodies) for core in cores]
+        lon = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(bodies))
+        # before the float32 cast, so boundary Moons match the query side
+        moon = nakshatra_index(lon[:, list(bodies).index("Moon")])
+        if ids is None:
+            ids = np.arange(len(rows))
+        return cls(np.asarray(ids), lon, moon, tuple(bodies))
+
+    def slice(self, start: int, stop: int) -> "ChartLongitudes":
+        return ChartLongitudes(
+            self.ids[start:stop],
+            self.lon_deg[start:stop],
+            self.moon_nakshatra[start:stop],
+            self.bodies,
+        )
+
+
+def pack_chart(core: Mapping[str, object], bodies: Sequence[str] = STORE_BODIES) -> List[float]:
+    """Return the longitudes of ``bodies`` from a ``build_base_core`` result."""
+    planets = core["planets"]
+    axes = core["axes"]
+    return [
+        axes[name] if name in axes else planets[name]["lon_sidereal_deg"]
+        for name in bodies
+    ]
+
+
+def _aspect_kernel(
+    q: float, col: np.ndarray, aspect_weights: Mapping[str, float], orbs: Mapping[str, float]
+) -> np.ndarray:
+    # Stored longitudes are already in [0, 360), so no modulo is needed.
+    sep = np.abs(col - np.float32(q % 360.0))
+    np.minimum(sep, np.float32(360.0) - sep, out=sep)
+    out = np.zeros(col.shape, dtype=np.float32)
+    tmp = np.empty_like(sep)
+    for name, weight in aspect_weights.items():
+        inv_orb = np.float32(1.0 / orbs[name])
+        np.subtract(sep, np.float32(ASPECTS[name]), out=tmp)
+        np.abs(tmp, out=tmp)
+        tmp *= -inv_orb
+        tmp += np.float32(1.0)
+        np.maximum(tmp, np.float32(0.0), out=tmp)
+        tmp *= np.float32(weight)
+        out += tmp
+    return out
+
+
+def score_charts(
+    query: Mapping[str, object],
+    store: ChartLongitudes,
+    pair_weights: Mapping[Tuple[str, str], float] | None = None,
+    aspect_weights: Mapping[str, float] | None = None,
+    orbs: Mapping[str, float] | None = None,
+    nakshatra_weight: float = 1.0,
+) -> np.ndarray:
+    """Score one query chart against every chart in ``store``.
+
+    Args:
+        query: A ``build_base_core`` result.
+        store: Packed stored charts.
+        pair_weights: Mapping of (query body, stored body) to weight.
+        aspect_weights: Mapping of aspect name to harmony weight.
+        orbs: Mapping of aspect name to orb in degrees.
+        nakshatra_weight: Weight of the Moon nakshatra (tara) component.
+
+    Returns:
+        ``float32`` array of scores, one per stored chart.
+
+    Raises:
+        ValueError: If an aspect of ``aspect_weights`` is unknown or has no orb.
+    """
+
+    pair_weights = DEFAULT_PAIR_WEIGHTS if pair_weights is None else pair_weights
+    aspect_weights = DEFAULT_ASPECT_WEIGHTS if aspect_weights is None else aspect_weights
+    orbs = DEFAULT_ORBS if orbs is None else orbs
+    unknown = set(aspect_weights) - set(ASPECTS)
+    if unknown:
+        raise ValueError(f"unknown aspects: {', '.join(sorted(unknown))}")
+    missing = set(aspect_weights) - set(orbs)
+    if missing:
+        raise ValueError(f"no orb for aspects: {', '.join(sorted(missing))}")
+
+    q_lon = dict(zip(store.bodies, pack_chart(query, store.bodies)))
+    scores = np.zeros(len(store), dtype=np.float32)
+    for (body_q, body_s), weight in pair_weights.items():
+        col = store.lon_deg[:, store.column(body_s)]
+        scores += np.float32(weight) * _aspect_kernel(q_lon[body_q], col, aspect_weights, orbs)
+
+    if nakshatra_weight:
+        q_nak = int(nakshatra_index(q_lon["Moon"]))
+        tara = (store.moon_nakshatra.astype(np.int16) - q_nak) % 27 % 9
+        scores += np.float32(nakshatra_weight) * TARA_SCORES[tara]
+    return scores
+
+
+def _top_k_chunk(args) -> Tuple[np.ndarray, np.ndarray]:
+    query, store, k, kwargs = args
+    scores = score_charts(query, store, **kwargs)
+    idx = _top_k_indices(scores, k)
+    return store.ids[idx], scores[idx]
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, scores.shape[0])
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def top_matches(
+    query: Mapping[str, object],
+    store: ChartLongitudes,
+    k: int = 10,
+    workers: int = 0,
+    chunk_size: int = 250_000,
+    **kwargs,
+) -> List[Dict[str, object]]:
+    """Return the ``k`` best matching stored charts for ``query``.
+
+    With ``workers > 0`` the store is split into chunks of ``chunk_size``
+    charts, each chunk is scored in a separate process and the per-chunk top-k
+    lists are merged.  Extra keyword arguments go to :func:`score_charts`.
+    """
+
+    if workers > 0 and len(store) > chunk_size:
+        jobs = [
+            (query, store.slice(start, start + chunk_size), k, kwargs)
+            for start in range(0, len(store), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_top_k_chunk, jobs))
+        ids = np.concatenate([p[0] for p in parts])
+        scores = np.concatenate([p[1] for p in parts])
+    else:
+        ids, scores = _top_k_chunk((query, store, k, kwargs))
+
+    idx = _top_k_indices(scores, k)
+    return [
+        {"chart_id": chart_id, "score": float(score)}
+        for chart_id, score in zip(ids[idx].tolist(), scores[idx])
+    ]
+
+
+__all__ = [
+    "STORE_BODIES",
+    "DEFAULT_PAIR_WEIGHTS",
+    "DEFAULT_ASPECT_WEIGHTS",
+    "TARA_SCORES",
+    "ChartLongitudes",
+    "pack_chart",
+    "score_charts",
+    "top_matches",
+]
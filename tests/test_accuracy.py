@@ -0,0 +1,81 @@
+"""Tests for the selectable accuracy tiers."""
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astrocore import build_base_core
+from astrocore.config import BODY_CODES
+from astrocore.eph import interp, swiss
+from astrocore.eph.manager import get_manager
+from astrocore.eph.planets import compute_planets
+from astrocore.settings import CoreSettingsModel
+
+BODIES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+JDS = np.linspace(swe.julday(1900, 1, 1, 0.0), swe.julday(2100, 1, 1, 0.0), 97) + 0.37
+
+# Bounds from the README in arcseconds: (longitude, latitude).
+BOUNDS = {"moshier": (3.0, 1.0), "interpolated": (0.5, 30.0)}
+
+PAYLOAD = {
+    "date": "1987-08-14",
+    "time": "10:00",
+    "tz_offset_hours": 5.5,
+    "latitude_deg": 28.61,
+    "longitude_deg": 77.21,
+}
+
+
+def _max_errors(accuracy):
+    swiss.init_ephemeris(sidereal=False)
+    reference = CoreSettingsModel(bodies=BODIES)
+    tier = CoreSettingsModel(bodies=BODIES, accuracy=accuracy)
+    codes = {name: BODY_CODES[name] for name in BODIES}
+    lon = lat = 0.0
+    for jd in JDS:
+        a = compute_planets(jd, reference, 0.0, 0.0, 0.0)
+        b = compute_planets(jd, tier, 0.0, 0.0, 0.0)
+        # a reference without its file is Moshier itself and measures nothing
+        sources = get_manager().sources(jd, codes)
+        for name in (n for n in BODIES if sources[n] == "swiss"):
+            dlon = (a[name]["lon_tropical_deg"] - b[name]["lon_tropical_deg"] + 180.0) % 360.0 - 180.0
+            lon = max(lon, abs(dlon) * 3600.0)
+            lat = max(lat, abs(a[name]["lat_tropical_deg"] - b[name]["lat_tropical_deg"]) * 3600.0)
+    return lon, lat
+
+
+@pytest.mark.parametrize("accuracy", sorted(BOUNDS))
+def test_tier_within_bounds(accuracy):
+    lon, lat = _max_errors(accuracy)
+    lon_bound, lat_bound = BOUNDS[accuracy]
+    assert 0.0 < lon < lon_bound
+    assert lat < lat_bound
+
+
+def test_interpolated_reuses_samples():
+    swiss.init_ephemeris(sidereal=False)
+    interp.cache_clear()
+    settings = CoreSettingsModel(bodies=["Sun"], accuracy="interpolated")
+    jd = swe.julday(2024, 3, 1, 0.0)
+    for minutes in range(0, 600, 10):
+        compute_planets(jd + minutes / 1440.0, settings, 0.0, 0.0, 0.0)
+    info = interp.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2 * 60 - 2
+
+
+def test_meta_reports_tier():
+    result = build_base_core({**PAYLOAD, "settings": {"accuracy": "moshier"}})
+    meta = result["meta"]["ephemeris"]
+    assert meta["accuracy"] == "moshier"
+    assert meta["flags"] & swe.FLG_MOSEPH
+    assert meta["sources"]["Sun"] == "moshier"
+    assert meta["sources"]["Moon"] == "moshier"
+
+    default = build_base_core(PAYLOAD)
+    assert default["meta"]["ephemeris"]["accuracy"] == "swiss"
+    assert default["meta"]["ephemeris"]["sources"]["Sun"] == "swiss"
+    for name in ("Sun", "Moon", "Mars"):
+        a = default["planets"][name]["lon_sidereal_deg"]
+        b = result["planets"][name]["lon_sidereal_deg"]
+        assert abs((a - b + 180.0) % 360.0 - 180.0) < 3.0 / 3600.0
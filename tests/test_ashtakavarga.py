@@ -0,0 +1,69 @@
+"""Tests for the vectorized ashtakavarga tables."""
+
+import numpy as np
+import pytest
+
+from astrocore import build_base_core
+from derived.ashtakavarga import (
+    BENEFIC_HOUSES,
+    CONTRIBUTORS,
+    PLANETS,
+    ashtakavarga,
+    ashtakavarga_batch,
+    bhinnashtakavarga,
+)
+from derived.signs import SIGNS, lon_to_sign_deg
+
+GOLDEN_TOTALS = {"Sun": 48, "Moon": 49, "Mars": 39, "Mercury": 54, "Jupiter": 56, "Venus": 52, "Saturn": 39}
+
+
+def _reference(signs):
+    """Nested-dict implementation: sign names keyed by contributor."""
+    bav = {}
+    for planet in PLANETS:
+        points = {sign: 0 for sign in SIGNS}
+        for contributor, houses in BENEFIC_HOUSES[planet].items():
+            start = SIGNS.index(signs[contributor])
+            for house in houses:
+                points[SIGNS[(start + house - 1) % 12]] += 1
+        bav[planet] = [points[sign] for sign in SIGNS]
+    return bav
+
+
+def test_golden_totals():
+    rng = np.random.default_rng(3)
+    bav, sav = ashtakavarga_batch(rng.uniform(0.0, 360.0, size=(100, 8)))
+    assert dict(zip(PLANETS, bav.sum(axis=-1)[0].tolist())) == GOLDEN_TOTALS
+    assert (bav.sum(axis=-1) == list(GOLDEN_TOTALS.values())).all()
+    assert (sav.sum(axis=-1) == 337).all()
+
+
+def test_matches_reference():
+    rng = np.random.default_rng(5)
+    lons = rng.uniform(0.0, 360.0, size=(200, 8))
+    bav, sav = ashtakavarga_batch(lons)
+    for c in range(lons.shape[0]):
+        signs = {name: lon_to_sign_deg(lon)[0] for name, lon in zip(CONTRIBUTORS, lons[c])}
+        ref = _reference(signs)
+        assert bav[c].tolist() == [ref[p] for p in PLANETS]
+        assert sav[c].tolist() == np.sum([ref[p] for p in PLANETS], axis=0).tolist()
+
+
+def test_chart():
+    core = build_base_core(
+        {
+            "date": "1987-08-14",
+            "time": "08:30",
+            "tz_offset_hours": 4.0,
+            "latitude_deg": 44.7153132,
+            "longitude_deg": 42.9978716,
+        }
+    )
+    result = ashtakavarga(core["planets"], core["axes"])
+    signs = {name: lon_to_sign_deg(core["planets"][name]["lon_sidereal_deg"])[0] for name in PLANETS}
+    signs["Ascendant"] = lon_to_sign_deg(core["axes"]["asc_deg_sid"])[0]
+    assert result["bav"] == _reference(signs)
+    assert sum(result["sav"]) == 337
+    assert bhinnashtakavarga(np.zeros(8, dtype=int)).shape == (7, 12)
+    with pytest.raises(ValueError):
+        bhinnashtakavarga(np.zeros(7, dtype=int))
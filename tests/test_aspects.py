@@ -0,0 +1,84 @@
+"""Tests for the vectorized aspect engine."""
+
+import numpy as np
+import pytest
+
+from astrocore import build_base_core
+from derived.aspects import (
+    ASPECTS,
+    DEFAULT_ORBS,
+    chart_aspects,
+    find_aspects,
+    separation_matrix,
+)
+
+
+def _reference(lon_a, lon_b=None):
+    natal = lon_b is None
+    lon_b = lon_a if natal else lon_b
+    hits = set()
+    for i, a in enumerate(lon_a):
+        for j, b in enumerate(lon_b):
+            if natal and j <= i:
+                continue
+            d = abs(a - b) % 360.0
+            sep = min(d, 360.0 - d)
+            for k, name in enumerate(ASPECTS):
+                if abs(sep - ASPECTS[name]) <= DEFAULT_ORBS[name]:
+                    hits.add((i, j, k))
+    return hits
+
+
+def test_separation_wraps_zero():
+    sep = separation_matrix(np.array([359.0]), np.array([1.0, 181.0]))
+    assert sep[0] == pytest.approx([2.0, 178.0])
+
+
+def test_matches_pairwise_reference():
+    rng = np.random.default_rng(7)
+    lons = rng.uniform(0.0, 360.0, size=(50, 11))
+    hits = find_aspects(lons)
+    for c in range(lons.shape[0]):
+        sel = hits.chart == c
+        got = set(zip(hits.i[sel].tolist(), hits.j[sel].tolist(), hits.aspect[sel].tolist()))
+        assert got == _reference(lons[c].tolist())
+
+
+def test_synastry_batch_against_single_chart():
+    rng = np.random.default_rng(11)
+    query = rng.uniform(0.0, 360.0, size=9)
+    others = rng.uniform(0.0, 360.0, size=(20, 9))
+    hits = find_aspects(query, others, chunk_size=6)
+    for c in range(others.shape[0]):
+        sel = hits.chart == c
+        got = set(zip(hits.i[sel].tolist(), hits.j[sel].tolist(), hits.aspect[sel].tolist()))
+        assert got == _reference(query.tolist(), others[c].tolist())
+
+
+def test_custom_aspect_set_requires_orbs():
+    with pytest.raises(ValueError):
+        find_aspects(np.array([0.0, 45.0]), aspects={"semisquare": 45.0}, orbs={})
+    hits = find_aspects(
+        np.array([0.0, 45.5]), aspects={"semisquare": 45.0}, orbs={"semisquare": 1.0}
+    )
+    assert len(hits) == 1
+    assert hits.orb_deg[0] == pytest.approx(0.5)
+
+
+def test_chart_aspects_from_core():
+    payload = {
+        "date": "1987-08-14",
+        "time": "08:30",
+        "tz_offset_hours": 4.0,
+        "latitude_deg": 44.7153132,
+        "longitude_deg": 42.9978716,
+        "settings": {"ayanamsa": "Lahiri", "node_type": "MEAN"},
+    }
+    core = build_base_core(payload)
+    rows = chart_aspects(core)
+    assert any(
+        r["aspect"] == "opposition" and {r["body_a"], r["body_b"]} == {"Rahu", "Ketu"}
+        for r in rows
+    )
+    for r in rows:
+        assert r["orb_deg"] <= DEFAULT_ORBS[r["aspect"]]
@@ -0,0 +1,72 @@
+"""Analytic astrocartography lines."""
+
+import pytest
+import swisseph as swe
+
+from astrocore.constants import ASC_DEG_TROP, MC_DEG_TROP
+from astrocore.eph.astrocartography import angular_lines, astrocartography
+from astrocore.eph.axes import compute_axes
+from astrocore.eph.base_core import compute_time_geometry
+from astrocore.eph.planets import compute_planets
+from astrocore.settings import CoreSettingsModel
+
+JD_UT = 2447022.0
+
+
+def _setup():
+    lines = astrocartography(JD_UT)
+    geometry = compute_time_geometry(JD_UT)
+    planets = compute_planets(JD_UT, CoreSettingsModel(), geometry["ayanamsa_deg"], 0.0, 0.0)
+    return lines, geometry, planets
+
+
+def _lon(planet, geometry):
+    return planet.get("lon_tropical_deg", planet["lon_sidereal_deg"] + geometry["ayanamsa_deg"])
+
+
+def test_zodiacal_lines_match_compute_axes():
+    _, geometry, planets = _setup()
+    lines = angular_lines(planets, geometry, lat_step_deg=5.0, max_lat_deg=60.0, zodiacal=True)
+    assert len(lines) == 4 * len(planets)
+    keys = {"ASC": (ASC_DEG_TROP, 0.0), "DSC": (ASC_DEG_TROP, 180.0), "MC": (MC_DEG_TROP, 0.0), "IC": (MC_DEG_TROP, 180.0)}
+    for rec in lines:
+        key, shift = keys[rec["angle"]]
+        target = _lon(planets[rec["body"]], geometry) + shift
+        for poly in rec["polylines"]:
+            for lat, lon in poly:
+                axes = compute_axes(JD_UT, 0.0, lat, lon)
+                assert (axes[key] - target + 180.0) % 360.0 - 180.0 == pytest.approx(0.0, abs=1e-6)
+
+
+def test_mundane_lines_on_horizon_and_meridian():
+    lines, geometry, planets = _setup()
+    for rec in lines:
+        p = planets[rec["body"]]
+        xin = (_lon(p, geometry), p.get("lat_tropical_deg", 0.0), 1.0)
+        for poly in rec["polylines"]:
+            for lat, lon in poly[::10]:
+                azimuth, altitude, _ = swe.azalt(JD_UT, swe.ECL2HOR, (lon, lat, 0.0), 0.0, 0.0, xin)
+                if rec["angle"] in ("ASC", "DSC"):
+                    assert altitude == pytest.approx(0.0, abs=1e-6)
+                    # Swiss azimuth is measured from the south, westward
+                    assert (azimuth > 180.0) == (rec["angle"] == "ASC")
+                else:
+                    assert (azimuth + 90.0) % 180.0 - 90.0 == pytest.approx(0.0, abs=1e-5)
+
+
+def test_polylines_break_at_circumpolar_latitudes_and_antimeridian():
+    geometry = {"ayanamsa_deg": 0.0, "epsilon_deg": 23.44, "gst_hours": 0.0}
+    planets = {"X": {"lon_tropical_deg": 90.0, "lat_tropical_deg": 0.0}}
+    asc, dsc = angular_lines(planets, geometry, angles=["ASC", "DSC"])
+    # declination +23.44: circumpolar north of 66.56, never rises south of -66.56
+    lats = [lat for poly in asc["polylines"] for lat, _ in poly]
+    assert max(lats) < 66.6 and min(lats) > -66.6
+    for rec in (asc, dsc):
+        for poly in rec["polylines"]:
+            steps = [abs(b[1] - a[1]) for a, b in zip(poly, poly[1:])]
+            assert max(steps) < 180.0
+    mc, ic = angular_lines(planets, geometry, angles=["MC", "IC"])
+    assert mc["polylines"][0][0][1] == pytest.approx(90.0)
+    assert ic["polylines"][0][0][1] == pytest.approx(-90.0)
+    with pytest.raises(ValueError):
+        angular_lines(planets, geometry, angles=["VERTEX"])
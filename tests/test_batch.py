@@ -0,0 +1,82 @@
+"""Chart fingerprints and deduplicated batch computation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from astrocore import build_base_core, build_base_core_batch, chart_fingerprint
+from astrocore.eph import batch
+
+PAYLOAD = {
+    "date": "1987-08-14",
+    "time": "08:30",
+    "tz_offset_hours": 4.0,
+    "latitude_deg": 44.7153132,
+    "longitude_deg": 42.9978716,
+    "settings": {"ayanamsa": "Lahiri", "node_type": "MEAN"},
+}
+
+# Same chart: other time format, other zone, explicit default settings.
+SAME = [
+    {**PAYLOAD, "time": "08:30:00"},
+    {**PAYLOAD, "time": "09:30", "tz_offset_hours": 5.0},
+    {**PAYLOAD, "settings": {**PAYLOAD["settings"], "sidereal": True, "topocentric": False}},
+    {**PAYLOAD, "latitude_deg": 44.71531324},
+]
+DIFFERENT = [
+    {**PAYLOAD, "time": "08:31"},
+    {**PAYLOAD, "latitude_deg": 44.72},
+    {**PAYLOAD, "settings": {"ayanamsa": "Krishnamurti", "node_type": "MEAN"}},
+]
+
+
+def _strip(core):
+    core = dict(core)
+    core["meta"] = {k: v for k, v in core["meta"].items() if k != "calc_ms"}
+    return core
+
+
+def test_fingerprint_is_canonical():
+    key = chart_fingerprint(PAYLOAD)
+    assert len(key) == 32
+    assert all(chart_fingerprint(p) == key for p in SAME)
+    assert len({chart_fingerprint(p) for p in DIFFERENT} | {key}) == len(DIFFERENT) + 1
+    assert chart_fingerprint({**PAYLOAD, "time": "08:30:20"}, jd_precision_sec=60.0) == chart_fingerprint(
+        PAYLOAD, jd_precision_sec=60.0
+    )
+
+
+def test_batch_dedupes_and_fans_out(monkeypatch):
+    calls = []
+
+    def counting(payload):
+        calls.append(payload)
+        return build_base_core(payload)
+
+    monkeypatch.setattr(batch, "build_base_core", counting)
+    payloads = [PAYLOAD] + SAME + DIFFERENT
+    cache = {}
+    results = build_base_core_batch(payloads, cache=cache)
+
+    assert len(calls) == 1 + len(DIFFERENT)
+    assert len(cache) == len(calls)
+    for payload, result in zip(payloads, results):
+        expected = _strip(build_base_core(payload))
+        got = _strip(result)
+        assert got["time"] == expected["time"]
+        assert got["location"] == expected["location"]
+        if payload in DIFFERENT or payload is PAYLOAD:
+            assert got == expected
+    assert results[1]["planets"] == results[0]["planets"]
+    assert results[1]["planets"] is not results[0]["planets"]
+
+    calls.clear()
+    again = build_base_core_batch([SAME[1]], cache=cache)
+    assert calls == []
+    assert again[0]["time"] == results[2]["time"]
+
+
+def test_mixed_ayanamsas_across_threads():
+    payloads = [PAYLOAD, DIFFERENT[2]] * 100
+    expected = [_strip(build_base_core(p)) for p in payloads[:2]] * 100
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = [_strip(r) for r in pool.map(build_base_core, payloads)]
+    assert results == expected
@@ -0,0 +1,52 @@
+"""Eclipse and occultation searches."""
+
+import swisseph as swe
+
+from astrocore.eph import eclipses, swiss
+
+START = swe.julday(2024, 1, 1, 0.0)
+END = swe.julday(2026, 1, 1, 0.0)
+
+
+def _dates(records):
+    return [swe.revjul(r["jd_ut"])[:3] for r in records]
+
+
+def test_global_eclipses():
+    solar = eclipses.solar_eclipses(START, END)
+    assert _dates(solar) == [(2024, 4, 8), (2024, 10, 2), (2025, 3, 29), (2025, 9, 21)]
+    assert [r["type"] for r in solar] == ["total", "annular", "partial", "partial"]
+    assert solar[0]["central"] and not solar[2]["central"]
+    assert solar[0]["begin_jd_ut"] < solar[0]["totality_begin_jd_ut"] < solar[0]["jd_ut"]
+    assert solar[2]["totality_begin_jd_ut"] is None
+
+    lunar = eclipses.lunar_eclipses(START, END)
+    assert [r["type"] for r in lunar] == ["penumbral", "partial", "total", "total"]
+    assert eclipses.lunar_eclipses(START, END, ecltype=swe.ECL_TOTAL) == lunar[2:]
+
+
+def test_local_circumstances():
+    dallas = eclipses.local_solar_eclipses(START, END, 32.78, -96.8)
+    assert len(dallas) == 1
+    eclipse = dallas[0]
+    assert eclipse["type"] == "total" and eclipse["max_visible"]
+    first, second, third, fourth = eclipse["contacts_jd_ut"]
+    assert first < second < eclipse["jd_ut"] < third < fourth
+
+    many = eclipses.local_eclipses_many(
+        [{"latitude_deg": 32.78, "longitude_deg": -96.8}, {"latitude_deg": 28.61, "longitude_deg": 77.21}],
+        START,
+        END,
+        kind="lunar",
+    )
+    assert len(many) == 2
+    assert all(r["jd_ut"] in {e["jd_ut"] for e in eclipses.lunar_eclipses(START, END)} for r in many[1])
+
+
+def test_chain_batches_and_occultations():
+    swiss.init_ephemeris()
+    one = swiss.search_chain(swe.sol_eclipse_when_glob, START, END, batch=1)
+    assert one == swiss.search_chain(swe.sol_eclipse_when_glob, START, END)
+
+    saturn = eclipses.occultations(swe.SATURN, START, swe.julday(2024, 7, 1, 0.0))
+    assert _dates(saturn) == [(2024, 4, 6), (2024, 5, 3), (2024, 5, 31), (2024, 6, 27)]
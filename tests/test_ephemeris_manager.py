@@ -0,0 +1,106 @@
+"""Tests for ephemeris file inventory and coverage validation."""
+
+import shutil
+
+import pytest
+import swisseph as swe
+
+from astrocore import build_base_core
+from astrocore.config import DEFAULT_EPHE_PATH
+from astrocore.eph.manager import EphemerisManager, body_kind
+from astrocore.errors import EphemerisError
+
+JD_1987 = swe.julday(1987, 8, 14, 4.5)
+JD_1500 = swe.julday(1500, 1, 1, 0.0)
+JD_BC = swe.julday(-4000, 1, 1, 0.0)
+
+
+@pytest.fixture
+def ephe_dir(tmp_path):
+    shutil.copy(DEFAULT_EPHE_PATH / "sepl_18.se1", tmp_path)
+    (tmp_path / "sepl_12.se1").write_bytes(b"\0" * 10)
+    (tmp_path / "semo_18.se1").write_bytes(b"\0" * 10)
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_inventory_and_coverage(ephe_dir):
+    manager = EphemerisManager(ephe_dir)
+    report = manager.report()
+    assert report["files"] == ["semo_18.se1", "sepl_12.se1", "sepl_18.se1"]
+    assert report["coverage_years"]["planets"] == [(1200, 1800), (1800, 2400)]
+    assert report["coverage_years"]["asteroids"] == []
+    assert manager.covered("planets", [JD_1500, JD_1987, JD_BC]).tolist() == [True, True, False]
+
+
+def test_validate_batch(ephe_dir):
+    manager = EphemerisManager(ephe_dir)
+    bodies = [swe.SUN, swe.MOON, swe.MEAN_NODE]
+    assert manager.validate([JD_1987, JD_1500], bodies) == {"moon": "moshier", "planets": "swiss"}
+    with pytest.raises(EphemerisError, match="moon"):
+        manager.validate([JD_1987, JD_1500], bodies, strict=True)
+    with pytest.raises(EphemerisError, match="Moshier"):
+        manager.validate([JD_1987, JD_BC], [swe.SUN])
+    with pytest.raises(EphemerisError, match="asteroids"):
+        manager.validate([JD_1987], [swe.CHIRON])
+    assert body_kind(swe.TRUE_NODE) == "moon"
+    assert body_kind(swe.MEAN_NODE) is None
+
+
+def test_check_caches_per_coverage_segment(ephe_dir):
+    manager = EphemerisManager(ephe_dir)
+    bodies = {"Sun": swe.SUN, "Moon": swe.MOON}
+    sources = manager.check(JD_1987, bodies)
+    assert sources == {"Sun": "swiss", "Moon": "swiss"}
+    sources["Sun"] = "changed"
+    assert manager.check(JD_1987 + 3650.0, bodies) == {"Sun": "swiss", "Moon": "swiss"}
+    assert manager.check_stats == {"hits": 1, "misses": 1}
+    # sepl_12 has no semo counterpart: another segment, another answer
+    assert manager.check(JD_1500, bodies) == {"Sun": "swiss", "Moon": "moshier"}
+    for _ in range(2):
+        with pytest.raises(EphemerisError, match="moon"):
+            manager.check(JD_1500, bodies, strict=True)
+        with pytest.raises(EphemerisError, match="Moshier"):
+            manager.check(JD_BC, bodies)
+    assert manager.check_stats == {"hits": 1, "misses": 6}
+
+
+def test_preload(ephe_dir):
+    manager = EphemerisManager(ephe_dir)
+    size = (ephe_dir / "sepl_18.se1").stat().st_size + 20
+    assert manager.preload(use_mmap=False) == size
+    assert manager.preload() == size
+    assert manager.report()["preloaded_bytes"] == size
+    manager.close()
+
+
+def test_preload_skips_empty_files(ephe_dir, caplog):
+    (ephe_dir / "sepl_12.se1").write_bytes(b"")
+    manager = EphemerisManager(ephe_dir)
+    size = (ephe_dir / "sepl_18.se1").stat().st_size + 10
+    assert manager.preload() == size
+    assert "sepl_12.se1 is empty" in caplog.text
+    manager.close()
+
+
+def test_core_meta_reports_sources_and_strict_mode():
+    payload = {
+        "date": "1987-08-14",
+        "time": "08:30",
+        "tz_offset_hours": 4.0,
+        "latitude_deg": 44.7153132,
+        "longitude_deg": 42.9978716,
+        "settings": {"node_type": "MEAN"},
+    }
+    meta = build_base_core(payload)["meta"]["ephemeris"]
+    assert meta["sources"]["Sun"] == "swiss"
+    assert meta["sources"]["MeanNode"] == "analytic"
+    assert meta["flags"] & swe.FLG_SWIEPH
+    payload["settings"] = {"bodies": ["Sun", "Mars"], "strict_ephemeris": True}
+    assert build_base_core(payload)["meta"]["ephemeris"]["sources"] == {
+        "Sun": "swiss",
+        "Mars": "swiss",
+    }
+    payload["settings"] = {"bodies": ["Sun", "Moon"], "strict_ephemeris": True}
+    with pytest.raises(EphemerisError):
+        build_base_core(payload)
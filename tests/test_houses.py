@@ -160,3 +160,40 @@ def test_ayanamsa_switch_changes_values():
     assert not math.isclose(asc1, asc2, abs_tol=1e-3)
 
 
+def test_all_systems_match_single_calls(monkeypatch):
+    from astrocore.eph import swiss
+
+    options = {"return_borders": True, "return_width": True}
+    for latitude in (REQ_ARGS["latitude_deg"], 70.0):
+        args = {**REQ_ARGS, "latitude_deg": latitude, "options": options}
+        singles = {
+            system: compute_houses(HouseRequest(**args, house_system=system))
+            for system in ("whole-sign", "sripati", "placidus")
+        }
+
+        calls = []
+        houses_ex = swiss.houses_ex
+        monkeypatch.setattr(swiss, "houses_ex", lambda *a: calls.append(a[3]) or houses_ex(*a))
+        data = compute_houses(HouseRequest(**args, house_system="all"))
+        monkeypatch.setattr(swiss, "houses_ex", houses_ex)
+
+        assert data["meta"]["house_system"] == ["whole-sign", "sripati", "placidus"]
+        # one Placidus call; Porphyry angles only when Placidus is undefined
+        assert calls == ([b"P"] if latitude < 66 else [b"P", b"O"])
+        for system, single in singles.items():
+            assert data["houses"][system] == single["houses"]
+            assert data["axes"] == single["axes"]
+            expected = {k: single["meta"][k] for k in ("backend", "status", "notes") if k in single["meta"]}
+            assert data["meta"]["systems"][system] == expected
+        assert data["classification"] == singles["placidus"]["classification"]
+
+    # every result owns its classification
+    data["classification"]["kendra"].append(13)
+    assert compute_houses(HouseRequest(**REQ_ARGS))["classification"]["kendra"] == [1, 4, 7, 10]
+
+
+def test_system_subset_keeps_order():
+    data = compute_houses(HouseRequest(**REQ_ARGS, house_system=["sripati", "whole-sign"]))
+    assert list(data["houses"]) == ["sripati", "whole-sign"]
+    assert list(data["meta"]["systems"]) == ["sripati", "whole-sign"]
+    assert data["meta"]["systems"]["sripati"]["status"] == "ok"
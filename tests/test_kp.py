@@ -0,0 +1,70 @@
+"""Tests for the KP sub-lord table."""
+
+import numpy as np
+import pytest
+
+from astrocore.eph import swiss
+from astrocore.houses import HouseRequest, compute_houses
+from derived.kp import LORDS, VIMSHOTTARI, kp_cusps, kp_index, kp_lookup, kp_lords, kp_planets, kp_table
+
+
+def _walk(lon, depth):
+    """Reference: walk the Vimshottari proportions down to ``depth`` levels."""
+    span = 40.0 / 3.0
+    n = int(lon // span)
+    lords = [n % 9]
+    start, width = n * span, span
+    for _ in range(depth - 1):
+        first = lords[-1]
+        for k in range(9):
+            lord = (first + k) % 9
+            part = width * VIMSHOTTARI[lord][1] / 120.0
+            if lon < start + part:
+                lords.append(lord)
+                width = part
+                break
+            start += part
+    return [LORDS[i] for i in lords]
+
+
+def test_table_sizes_and_order():
+    subs, deep = kp_table(), kp_table(True)
+    assert len(subs.starts) == 249
+    assert np.all(np.diff(subs.starts) > 0) and np.all(np.diff(deep.starts) > 0)
+    assert set(range(0, 360, 30)) <= set(subs.starts.tolist())
+    # Aries 28°20' (Rahu sub of Krittika) is split at the Taurus border
+    assert kp_lookup(29.5)["sub_number"] == 22 and kp_lookup(30.5)["sub_number"] == 23
+    assert kp_lookup(30.5)["sub_lord"] == "Rahu" and kp_lookup(30.5)["sign_lord"] == "Venus"
+    # -1e-17 % 360.0 == 360.0; it must resolve like 0°
+    assert kp_lookup(-1e-17, sub_sub=True) == kp_lookup(0.0, sub_sub=True)
+    assert kp_lookup(-1e-17)["nakshatra"] == "Ashwini"
+    assert kp_index([-1e-17], sub_sub=True).tolist() == [0]
+    assert kp_lords([-1e-17])["star_lord"].tolist() == [LORDS.index("Ketu")]
+
+
+def test_matches_walk():
+    lons = np.random.default_rng(9).uniform(0.0, 360.0, 2000)
+    lords = kp_lords(lons, sub_sub=True)
+    for lon, star, sub, deep in zip(lons, lords["star_lord"], lords["sub_lord"], lords["sub_sub_lord"]):
+        assert [LORDS[star], LORDS[sub], LORDS[deep]] == _walk(lon, 3)
+        one = kp_lookup(lon, sub_sub=True)
+        assert [one["star_lord"], one["sub_lord"], one["sub_sub_lord"]] == _walk(lon, 3)
+
+
+def test_planets_and_placidus_cusps():
+    swiss.init_ephemeris(ayanamsa="Krishnamurti")
+    req = HouseRequest(2447022.0, 44.7, 43.0, "Krishnamurti", "placidus", options={"return_borders": True})
+    houses = compute_houses(req)
+    cusps = kp_cusps(houses, sub_sub=True)
+    assert len(cusps) == 12
+    assert cusps[0]["sub_lord"] == _walk(houses["axes"]["asc_deg_sid"], 2)[1]
+    multi = compute_houses(
+        HouseRequest(2447022.0, 44.7, 43.0, "Krishnamurti", ["whole-sign", "placidus"], options={"return_borders": True})
+    )
+    assert kp_cusps(multi, sub_sub=True) == cusps
+    with pytest.raises(ValueError):
+        kp_cusps(compute_houses(HouseRequest(2447022.0, 44.7, 43.0, "Krishnamurti", "placidus")))
+
+    planets = {"Sun": {"lon_sidereal_deg": 123.4}, "Rahu": {"lon_sidereal_deg": 359.99}}
+    result = kp_planets(planets)
+    assert result["Sun"]["star_lord"] == "Ketu" and result["Rahu"]["sub_number"] == 249
@@ -0,0 +1,187 @@
+"""Tests for traffic capture and the replay load test."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from astrocore import build_base_core, capture, loadtest
+from astrocore.capture import Capture
+from astrocore.eph import swiss
+from astrocore.houses import HouseRequest, compute_houses
+
+PAYLOAD = {
+    "date": "1987-08-14",
+    "time": "08:30",
+    "tz_offset_hours": 4.0,
+    "latitude_deg": 44.2371,
+    "longitude_deg": 42.9978716,
+    "elevation_m": 612.0,
+    "name": "client name",
+    "settings": {"ayanamsa": "Krishnamurti", "topocentric": True},
+}
+REQUEST = HouseRequest(
+    2447022.0, 44.7, 43.0, house_system=["placidus", "sripati"], options={"return_borders": True}
+)
+
+
+@pytest.fixture
+def records(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    with Capture(path, seed=7) as cap:
+        build_base_core(PAYLOAD)
+        build_base_core(
+            {
+                **PAYLOAD,
+                "tz_name": "Europe/Moscow",
+                "tz_offset_hours": None,
+                "settings": {"accuracy": "interpolated"},
+            }
+        )
+        compute_houses(REQUEST)
+    assert cap.records == 3
+    return loadtest.load_records(path)
+
+
+def test_capture_anonymizes(records):
+    # the compute_houses call inside build_base_core is not recorded
+    assert [r["kind"] for r in records] == ["build_base_core", "build_base_core", "compute_houses"]
+    payload = records[0]["input"]
+    assert "name" not in payload
+    assert payload["date"].startswith("1987-08-")
+    assert (payload["latitude_deg"], payload["longitude_deg"]) == (44.0, 43.0)
+    assert payload["elevation_m"] == 600.0
+    assert payload["settings"] == PAYLOAD["settings"]
+    assert records[1]["input"]["tz_name"] == "Europe/Moscow"
+    request = records[2]["input"]
+    assert abs(request["jd_ut"] - REQUEST.jd_ut) <= capture.JD_JITTER_DAYS
+    assert request["house_system"] == ["placidus", "sripati"]
+    assert request["options"] == {"return_borders": True}
+
+
+def test_capture_fails_closed(tmp_path):
+    cap = Capture(tmp_path / "odd.jsonl", seed=1)
+    loose = cap._payload({**PAYLOAD, "date": "1987-8-4"})
+    assert loose["date"].startswith("1987-08-") and loose["date"] != "1987-08-04"
+    for date in ("1987-08-14T08:30:00+04:00", "14.08.1987", 19870814):
+        assert "date" not in cap._payload({**PAYLOAD, "date": date})
+    odd = cap._payload({**PAYLOAD, "latitude_deg": "44.2371", "elevation_m": None})
+    assert "latitude_deg" not in odd and "elevation_m" not in odd
+    assert "jd_ut" not in cap._request({"jd_ut": "2447022.0", "latitude_deg": 44.7})
+
+
+def test_capture_drops_unknown_settings(tmp_path):
+    settings = {**PAYLOAD["settings"], "name": "client name", "email": "a@b.c"}
+    for anonymize in (True, False):
+        cap = Capture(tmp_path / "settings.jsonl", anonymize=anonymize)
+        assert cap._payload({**PAYLOAD, "settings": settings})["settings"] == PAYLOAD["settings"]
+        assert "settings" not in cap._payload({**PAYLOAD, "settings": "ayanamsa=Lahiri"})
+
+
+def test_capture_start_is_exclusive(tmp_path):
+    captures = [Capture(tmp_path / f"{i}.jsonl") for i in range(8)]
+    started = []
+    barrier = threading.Barrier(len(captures))
+
+    def start(cap):
+        barrier.wait()
+        try:
+            started.append(cap.start())
+        except RuntimeError:
+            pass
+
+    threads = [threading.Thread(target=start, args=(cap,)) for cap in captures]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(started) == 1 and capture.active() is started[0]
+    started[0].stop()
+    assert capture.active() is None
+
+
+def test_capture_raw_and_sampling(tmp_path):
+    path = tmp_path / "raw.jsonl"
+    with Capture(path, anonymize=False):
+        build_base_core(PAYLOAD)
+        with pytest.raises(RuntimeError):
+            Capture(tmp_path / "other.jsonl").start()
+    assert capture.active() is None
+    build_base_core(PAYLOAD)  # not recorded
+    (rec,) = loadtest.load_records(path)
+    assert rec["input"] == {k: v for k, v in PAYLOAD.items() if k != "name"}
+
+    with Capture(tmp_path / "none.jsonl", sample_rate=0.0) as cap:
+        build_base_core(PAYLOAD)
+    assert cap.records == 0
+
+
+def test_counting_lock_contention():
+    lock = loadtest.CountingLock()
+    lock.acquire()
+    waiter = threading.Thread(target=lambda: lock.acquire() and lock.release())
+    waiter.start()
+    time.sleep(0.05)
+    lock.release()
+    waiter.join()
+    assert lock.acquisitions == 2
+    assert lock.contended == 1
+    assert lock.wait_s >= 0.04
+
+
+def test_instrument_restores_lock():
+    original = swiss._swe_lock
+    with loadtest.instrument_swe_lock() as counting:
+        swiss.get_ayanamsa(2451545.0)
+    assert swiss._swe_lock is original
+    assert counting.acquisitions == 1
+
+
+@pytest.mark.parametrize("mode, workers", [("threads", 1), ("threads", 3), ("processes", 2)])
+def test_replay(records, mode, workers):
+    report = loadtest.replay(records, workers=workers, mode=mode, repeat=2, warmup=1)
+    assert report["requests"] == 6
+    assert report["errors"] == 0
+    assert report["latency_ms"]["count"] == 6
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+    assert report["kinds"]["compute_houses"]["count"] == 2
+    assert report["throughput_rps"] > 0
+    assert report["lock"]["acquisitions"] > 0
+    assert set(report["caches"]) == set(loadtest.CACHES)
+    assert report["caches"]["planet_plan"]["hit_rate"] == 1.0
+    json.dumps(report)
+    assert "requests" in loadtest.format_report(report)
+
+
+def test_replay_counts_errors(records):
+    bad = {"kind": "build_base_core", "input": {**records[0]["input"], "settings": {"ayanamsa": "Nope"}}}
+    report = loadtest.replay(records + [bad])
+    assert report["errors"] == 1
+    assert report["latency_ms"]["count"] == 3
+    with pytest.raises(ValueError):
+        loadtest.replay(records, mode="fibers")
+
+
+def test_compare():
+    base = {
+        "throughput_rps": 100.0,
+        "latency_ms": {"p50": 2.0, "p99": 10.0},
+        "errors": 0,
+        "caches": {"interp": {"hit_rate": 0.5}},
+    }
+    new = {
+        "throughput_rps": 150.0,
+        "latency_ms": {"p50": 2.0, "p99": 12.0},
+        "errors": 0,
+        "caches": {"interp": {"hit_rate": 0.75}},
+    }
+    rows = {r["metric"]: r for r in loadtest.compare(base, new)}
+    assert rows["throughput_rps"]["change"] == pytest.approx(0.5)
+    assert rows["throughput_rps"]["better"] is True
+    assert rows["latency_ms.p50"]["better"] is None
+    assert rows["latency_ms.p99"]["better"] is False
+    assert rows["errors"]["change"] is None
+    assert rows["latency_ms.max"]["base"] is None
+    assert rows["caches.interp.hit_rate"]["better"] is True
+    assert "throughput_rps" in loadtest.format_comparison(list(rows.values()))
@@ -0,0 +1,91 @@
+"""Tests for the midpoint and harmonic kernels."""
+
+import numpy as np
+import pytest
+
+from astrocore import build_base_core
+from derived.midpoints import (
+    chart_midpoints,
+    harmonic_longitudes,
+    midpoint_activations,
+    midpoint_matrix,
+    midpoint_sort,
+)
+
+
+def _midpoint(a, b):
+    d = (b - a) % 360.0
+    return (a + d / 2.0) % 360.0 if d <= 180.0 else (b + (360.0 - d) / 2.0) % 360.0
+
+
+def _reference(lon_a, lon_b, orb, dial):
+    natal = lon_b is None
+    lon_b = lon_a if natal else lon_b
+    hits = set()
+    for i in range(len(lon_a)):
+        for j in range(i + 1, len(lon_a)):
+            mid = _midpoint(lon_a[i], lon_a[j])
+            for k, lon in enumerate(lon_b):
+                if natal and k in (i, j):
+                    continue
+                d = (lon - mid) % dial
+                if min(d, dial - d) <= orb:
+                    hits.add((k, i, j))
+    return hits
+
+
+def test_midpoint_matrix_takes_nearer_midpoint():
+    mids = midpoint_matrix(np.array([350.0, 20.0, 160.0]))
+    assert mids[0, 1] == pytest.approx(5.0) and mids[1, 0] == pytest.approx(5.0)
+    assert mids[1, 2] == pytest.approx(90.0)
+    assert mids[0, 2] == pytest.approx(75.0)
+    assert mids[2, 2] == pytest.approx(160.0)
+
+
+def test_harmonics():
+    lon = np.array([[10.0, 200.0], [359.0, 91.0]])
+    h = harmonic_longitudes(lon, 5)
+    assert h.shape == (2, 5, 2)
+    assert h[0, 0].tolist() == [10.0, 200.0]
+    assert h[0, 3].tolist() == pytest.approx([40.0, 80.0])
+    assert harmonic_longitudes(lon, [9])[1, 0].tolist() == pytest.approx([351.0, 99.0])
+    assert np.array_equal(harmonic_longitudes(lon, np.int64(5)), h)
+
+
+def test_sort_is_ordered_on_dial():
+    lons = np.random.default_rng(4).uniform(0.0, 360.0, size=(5, 8))
+    tree = midpoint_sort(lons)
+    assert tree.position_deg.shape == (5, 36)
+    assert np.all(np.diff(tree.position_deg, axis=-1) >= 0.0)
+    c, k = 3, 17
+    i, j = tree.i[c, k], tree.j[c, k]
+    assert tree.position_deg[c, k] == pytest.approx(_midpoint(lons[c, i], lons[c, j]) % 90.0)
+
+
+@pytest.mark.parametrize("dial", [90.0, 360.0])
+def test_activations_match_reference(dial):
+    rng = np.random.default_rng(12)
+    lons = rng.uniform(0.0, 360.0, size=(40, 10))
+    transits = rng.uniform(0.0, 360.0, size=(40, 6))
+    for lon_b in (None, transits):
+        hits = midpoint_activations(lons, lon_b, orb_deg=1.5, dial_deg=dial, chunk_size=7)
+        for c in range(lons.shape[0]):
+            sel = hits.chart == c
+            got = set(zip(hits.body[sel].tolist(), hits.i[sel].tolist(), hits.j[sel].tolist()))
+            expected = _reference(lons[c].tolist(), None if lon_b is None else lon_b[c].tolist(), 1.5, dial)
+            assert got == expected
+
+
+def test_chart_midpoints():
+    core = build_base_core(
+        {
+            "date": "1987-08-14",
+            "time": "08:30",
+            "tz_offset_hours": 4.0,
+            "latitude_deg": 44.7153132,
+            "longitude_deg": 42.9978716,
+        }
+    )
+    rows = chart_midpoints(core, orb_deg=1.0)
+    assert rows and all(r["body"] not in r["midpoint"] for r in rows)
+    assert [r["orb_deg"] for r in rows] == sorted(r["orb_deg"] for r in rows)
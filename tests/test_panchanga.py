@@ -0,0 +1,75 @@
+"""Panchanga elements and their boundaries."""
+
+import random
+
+import swisseph as swe
+
+from astrocore.eph import swiss
+from astrocore.eph.panchanga import ELEMENTS, PanchangaEngine, panchanga, panchanga_many
+
+DELHI = {"latitude_deg": 28.6139, "longitude_deg": 77.209, "tz_name": "Asia/Kolkata"}
+
+
+def _index(name, jd):
+    swiss.set_sid_mode("Lahiri")
+    sun = swe.calc_ut(jd, swe.SUN)[0][0]
+    moon = swe.calc_ut(jd, swe.MOON)[0][0]
+    c_moon, c_sun, sidereal, names, _ = ELEMENTS[name]
+    if sidereal:
+        aya = swe.get_ayanamsa_ut(jd)
+        sun, moon = sun - aya, moon - aya
+    angle = (c_moon * moon + c_sun * sun) % 360.0
+    return int(angle // (360.0 / len(names)))
+
+
+def test_spans_match_direct_positions():
+    swiss.init_ephemeris()
+    engine = PanchangaEngine()
+    rng = random.Random(7)
+    start = swe.julday(2024, 1, 1, 0.0)
+    for jd in sorted(start + rng.uniform(0.0, 365.0) for _ in range(300)):
+        for name, span in engine.at(jd).items():
+            assert span["start_jd_ut"] <= jd < span["end_jd_ut"]
+            # away from the boundaries the element matches the positions
+            if min(jd - span["start_jd_ut"], span["end_jd_ut"] - jd) > 1e-4:
+                assert span["number"] - 1 == _index(name, jd)
+
+
+def test_engines_keep_their_ayanamsa():
+    swiss.init_ephemeris()
+    jd = swe.julday(2024, 1, 1, 0.0)
+    lahiri, kp = PanchangaEngine("Lahiri"), PanchangaEngine("Krishnamurti")
+    for engine, other in ((lahiri, kp), (kp, lahiri)):
+        swiss.set_sid_mode(other.ayanamsa)
+        assert engine.evaluate(jd)[-1] == swiss.get_ayanamsa(jd, engine.ayanamsa)
+    assert lahiri.evaluate(jd)[-1] != kp.evaluate(jd)[-1]
+
+
+def test_day_records():
+    records = list(panchanga(start_date="2024-01-01", end_date="2024-01-31", **DELHI))
+    assert len(records) == 31
+    assert records[0]["vara"] == "Somavara"
+    assert records[0]["tithi"][0]["name"] == "Krishna Panchami"
+    assert records[0]["nakshatra"][0]["name"] == "Magha"
+    for record in records:
+        sunrise, next_sunrise = record["sunrise_jd_ut"], record["next_sunrise_jd_ut"]
+        for name in ELEMENTS:
+            spans = record[name]
+            assert spans[0]["start_jd_ut"] <= sunrise < spans[0]["end_jd_ut"]
+            assert spans[-1]["end_jd_ut"] >= next_sunrise
+            for a, b in zip(spans, spans[1:]):
+                assert a["end_jd_ut"] == b["start_jd_ut"]
+        karana_starts = {k["start_jd_ut"] for k in record["karana"]}
+        assert {t["end_jd_ut"] for t in record["tithi"][:-1]} <= karana_starts
+
+
+def test_locations_share_timelines():
+    engine = PanchangaEngine()
+    list(engine.days(start_date="2024-02-01", end_date="2024-02-29", **DELHI))
+    evaluations = engine.stats["evaluations"]
+    mumbai = {"latitude_deg": 19.076, "longitude_deg": 72.8777, "tz_name": "Asia/Kolkata"}
+    list(engine.days(start_date="2024-02-01", end_date="2024-02-29", **mumbai))
+    assert engine.stats["evaluations"] - evaluations < 20
+
+    many = list(panchanga_many([DELHI, mumbai], "2024-02-01", "2024-02-02"))
+    assert [i for i, _ in many] == [0, 0, 1, 1]
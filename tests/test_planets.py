@@ -0,0 +1,86 @@
+"""Tests for configurable planet body sets."""
+
+import pytest
+import swisseph as swe
+from pydantic import ValidationError
+
+from astrocore import build_base_core
+from astrocore.eph import swiss
+from astrocore.eph.planets import compile_plan, compute_planets, planet_plan
+from astrocore.errors import EphemerisError, InvalidInputError
+from astrocore.settings import CoreSettingsModel
+
+JD = 2447021.6875
+ARGS = (JD, 23.7, 44.7153132, 42.9978716)
+
+
+def test_default_body_set_unchanged():
+    swiss.init_ephemeris()
+    result = compute_planets(JD, CoreSettingsModel(), *ARGS[1:])
+    assert list(result) == [
+        "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn",
+        "TrueNode", "MeanNode", "Rahu", "Ketu",
+    ]
+    assert set(result["TrueNode"]) == {"lon_tropical_deg", "lon_sidereal_deg"}
+
+
+def test_light_body_set_skips_unrequested_work(monkeypatch):
+    swiss.init_ephemeris()
+    calls = []
+    real = swiss.calc_ut
+
+    def counting(jd_ut, body, flags):
+        calls.append((body, flags))
+        return real(jd_ut, body, flags)
+
+    monkeypatch.setattr(swiss, "calc_ut", counting)
+    settings = CoreSettingsModel(bodies=["Sun", "Moon", "Rahu"], node_type="MEAN", speed=False)
+    result = compute_planets(JD, settings, *ARGS[1:])
+    assert list(result) == ["Sun", "Moon", "Rahu"]
+    assert [b for b, _ in calls] == [swe.SUN, swe.MOON, swe.MEAN_NODE]
+    assert all(not flags & swe.FLG_SPEED for _, flags in calls)
+    assert "speed_lon_deg_per_day" not in result["Sun"]
+
+    full = compute_planets(JD, CoreSettingsModel(node_type="MEAN"), *ARGS[1:])
+    assert result["Rahu"] == full["Rahu"]
+    assert result["Moon"]["lon_sidereal_deg"] == full["Moon"]["lon_sidereal_deg"]
+
+
+def test_plans_are_shared_and_fields_selected():
+    a = planet_plan(CoreSettingsModel(bodies=["Sun", "Uranus"], fields=["lon_sidereal_deg"]))
+    b = planet_plan(CoreSettingsModel(bodies=["Sun", "Uranus"], fields=["lon_sidereal_deg"]))
+    assert a is b
+    settings = CoreSettingsModel(bodies=["Uranus", "Pluto"], fields=["lon_sidereal_deg"])
+    result = compute_planets(JD, settings, *ARGS[1:])
+    assert list(result) == ["Uranus", "Pluto"]
+    assert all(list(v) == ["lon_sidereal_deg"] for v in result.values())
+    assert compile_plan(("Ketu",), "TRUE").ephemeris == (("TrueNode", swe.TRUE_NODE),)
+
+
+def test_invalid_selection_and_missing_files():
+    with pytest.raises(ValidationError):
+        CoreSettingsModel(bodies=["Vulcan"])
+    with pytest.raises(ValidationError):
+        CoreSettingsModel(fields=["lon_trop"])
+    swiss.init_ephemeris()
+    with pytest.raises(InvalidInputError, match="NoSuchStar"):
+        compute_planets(JD, CoreSettingsModel(fixed_stars=["NoSuchStar"]), *ARGS[1:])
+    # no seas_18.se1 ships with the repository
+    payload = {"date": "1987-08-14", "time": "08:30", "tz_offset_hours": 4.0, "latitude_deg": 44.7, "longitude_deg": 43.0}
+    with pytest.raises(EphemerisError, match="asteroids"):
+        build_base_core({**payload, "settings": {"bodies": ["Chiron"]}})
+
+
+def test_fixed_stars_from_catalog():
+    swiss.init_ephemeris()
+    settings = CoreSettingsModel(bodies=["Sun"], fixed_stars=["Aldebaran", "Regulus", "Spica"])
+    result = compute_planets(JD, settings, *ARGS[1:])
+    assert list(result) == ["Sun", "Aldebaran", "Regulus", "Spica"]
+    assert list(result["Spica"]) == [
+        "lon_tropical_deg", "lat_tropical_deg", "speed_lon_deg_per_day", "lon_sidereal_deg",
+    ]
+    # Swiss resolves Spica without sefstars.txt
+    ref = swiss.fixstar_ut("Spica", JD, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    assert result["Spica"]["lon_tropical_deg"] == pytest.approx(ref["lon_deg"], abs=2.0 / 3600.0)
+    assert result["Spica"]["lat_tropical_deg"] == pytest.approx(ref["lat_deg"], abs=2.0 / 3600.0)
+    assert abs(result["Spica"]["speed_lon_deg_per_day"]) < 1e-3
@@ -0,0 +1,85 @@
+"""Tests for return and progression root finding."""
+
+import pytest
+import swisseph as swe
+
+from astrocore.eph import swiss
+from astrocore.eph.returns import (
+    body_longitude,
+    find_longitude,
+    lunar_returns,
+    progressed_crossing,
+    progressed_jd,
+    solar_returns,
+    wrap180,
+)
+from astrocore.errors import CalculationError
+
+NATAL_JD = 2447021.6875
+
+
+def _scan(body, target, start, step, ayanamsa=None):
+    """Brute-force reference: step forward until the target is passed."""
+    jd = start
+    prev = wrap180(body_longitude(jd, body, ayanamsa)["lon_deg"] - target)
+    while True:
+        jd += step
+        cur = wrap180(body_longitude(jd, body, ayanamsa)["lon_deg"] - target)
+        if prev < 0.0 <= cur:
+            lo, hi = jd - step, jd
+            for _ in range(60):
+                mid = 0.5 * (lo + hi)
+                if wrap180(body_longitude(mid, body, ayanamsa)["lon_deg"] - target) < 0.0:
+                    lo = mid
+                else:
+                    hi = mid
+            return lo
+        prev = cur
+
+
+def test_solar_returns_match_scan():
+    swiss.init_ephemeris()
+    target = body_longitude(NATAL_JD, swe.SUN)["lon_deg"]
+    results = solar_returns(NATAL_JD, range(1, 6))
+    assert [r["year_offset"] for r in results] == [1, 2, 3, 4, 5]
+    for r in results:
+        assert abs(wrap180(r["lon_deg"] - target)) <= 1e-6
+        assert r["iterations"] <= 5
+    ref = _scan(swe.SUN, target, NATAL_JD + 360.0, 0.5)
+    assert results[0]["jd_ut"] == pytest.approx(ref, abs=1e-5)
+
+
+def test_sidereal_lunar_returns_are_successive():
+    results = lunar_returns(NATAL_JD, NATAL_JD + 100.0, 13, ayanamsa="Lahiri")
+    target = body_longitude(NATAL_JD, swe.MOON, "Lahiri")["lon_deg"]
+    jds = [r["jd_ut"] for r in results]
+    assert jds[0] > NATAL_JD + 100.0
+    for a, b in zip(jds, jds[1:]):
+        assert 27.0 < b - a < 27.7
+    for r in results:
+        assert abs(wrap180(r["lon_deg"] - target)) <= 1e-6
+    ref = _scan(swe.MOON, target, NATAL_JD + 100.0, 0.25, "Lahiri")
+    assert jds[0] == pytest.approx(ref, abs=1e-5)
+
+
+def test_bisection_fallback_and_failure():
+    swiss.init_ephemeris()
+    target = body_longitude(NATAL_JD + 2.0, swe.MOON)["lon_deg"]
+    res = find_longitude(swe.MOON, target, NATAL_JD, window_days=3.0, max_iter=60)
+    assert res["jd_ut"] == pytest.approx(NATAL_JD + 2.0, abs=1e-5)
+    # the accelerating Moon makes the first Newton step overshoot the window
+    for ayanamsa in (None, "Lahiri"):
+        target = body_longitude(NATAL_JD + 15.0, swe.MOON, ayanamsa)["lon_deg"]
+        res = find_longitude(swe.MOON, target, NATAL_JD + 12.0, ayanamsa=ayanamsa, window_days=3.05)
+        assert res["method"] == "bisection"
+        assert res["jd_ut"] == pytest.approx(NATAL_JD + 15.0, abs=1e-5)
+    with pytest.raises(CalculationError):
+        find_longitude(swe.MOON, target, NATAL_JD + 10.0, window_days=1.0, max_iter=10)
+
+
+def test_progressed_crossing_maps_back_to_real_time():
+    natal_moon = body_longitude(NATAL_JD, swe.MOON)["lon_deg"]
+    target = (natal_moon + 90.0) % 360.0
+    res = progressed_crossing(swe.MOON, target, NATAL_JD, NATAL_JD)
+    assert progressed_jd(NATAL_JD, res["event_jd_ut"]) == pytest.approx(res["jd_ut"])
+    assert 5.0 * 365.0 < res["event_jd_ut"] - NATAL_JD < 9.0 * 365.0
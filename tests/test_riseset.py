@@ -0,0 +1,45 @@
+"""Rise and set times over date ranges."""
+
+import swisseph as swe
+
+from astrocore.eph import riseset
+
+DELHI = {"latitude_deg": 28.6139, "longitude_deg": 77.209, "tz_name": "Asia/Kolkata"}
+
+
+def test_matches_direct_search():
+    riseset.cache_clear()
+    records = riseset.rise_set(start_date="2024-01-01", end_date="2024-01-31", **DELHI)
+    assert len(records) == 31
+    for day, record in enumerate(records):
+        midnight = swe.julday(2024, 1, 1 + day, 0.0) - 5.5 / 24.0
+        res, tret = swe.rise_trans(midnight, swe.SUN, swe.CALC_RISE, (77.209, 28.6139, 0.0))
+        assert res == 0 and record["sunrise_jd_ut"] == tret[0]
+        for event in ("sunrise", "sunset", "moonrise", "moonset"):
+            jd = record[f"{event}_jd_ut"]
+            assert jd is None or midnight <= jd < midnight + 1.0
+        if day:
+            assert records[day - 1]["next_sunrise_jd_ut"] == record["sunrise_jd_ut"]
+    # the Moon rises about 50 minutes later each day and skips a date
+    assert sum(r["moonrise_jd_ut"] is None for r in records) == 1
+    assert riseset.cache_stats == {"hits": 0, "misses": 31 * 4 + 1}
+
+
+def test_cache_reuses_overlapping_ranges():
+    riseset.cache_clear()
+    full = riseset.rise_set(start_date="2024-03-01", end_date="2024-03-10", **DELHI)
+    misses = riseset.cache_stats["misses"]
+    part = riseset.rise_set(
+        28.61391, 77.20904, "2024-03-03", "2024-03-05", tz_name="Asia/Kolkata", events=["sunset"]
+    )
+    assert riseset.cache_stats["misses"] == misses
+    assert [r["sunset_jd_ut"] for r in part] == [r["sunset_jd_ut"] for r in full[2:5]]
+    assert set(part[0]) == {"date", "sunset_jd_ut"}
+
+
+def test_polar_day_and_many_locations():
+    polar = {"latitude_deg": 78.22, "longitude_deg": 15.65, "tz_name": "Arctic/Longyearbyen"}
+    results = riseset.rise_set_many([DELHI, polar], "2024-06-21", events=["sunrise", "sunset"])
+    assert results[0] == riseset.rise_set(start_date="2024-06-21", events=["sunrise", "sunset"], **DELHI)
+    assert results[1][0]["sunrise_jd_ut"] is None
+    assert results[1][0]["sunset_jd_ut"] is None
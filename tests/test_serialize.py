@@ -0,0 +1,112 @@
+"""Tests for the chart encoder."""
+
+import json
+
+import pytest
+
+from astrocore import build_base_core, serialize
+from astrocore.houses import HouseRequest, compute_houses
+from astrocore.serialize import COMPACT_SEPARATORS, ChartEncoder
+
+PAYLOAD = {
+    "date": "1987-08-14",
+    "time": "08:30",
+    "tz_offset_hours": 4.0,
+    "latitude_deg": 44,
+    "longitude_deg": 42.9978716,
+}
+SETTINGS = [
+    {},
+    {"ayanamsa": "Krishnamurti", "node_type": "MEAN"},
+    {"topocentric": True, "fixed_stars": ["Spica"], "fields": ["lon_sidereal_deg"]},
+    {"sidereal": False, "speed": False, "bodies": ["Sun", "Moon"]},
+]
+
+
+@pytest.fixture(scope="module")
+def cores():
+    charts = [build_base_core({**PAYLOAD, "settings": s}) for s in SETTINGS]
+    charts.append(build_base_core({**PAYLOAD, "tz_name": "Europe/Moscow", "tz_offset_hours": None}))
+    return charts
+
+
+def test_json_parity(cores):
+    encoder = ChartEncoder()
+    compact = ChartEncoder(separators=COMPACT_SEPARATORS)
+    # twice, so the second pass goes through the memoised sections
+    for core in cores + cores:
+        assert encoder.encode(core) == json.dumps(core)
+        assert compact.encode(core) == json.dumps(core, separators=(",", ":"))
+    houses = compute_houses(HouseRequest(2447022.0, 44.7, 43.0, house_system="all", options={"return_borders": True}))
+    assert serialize.dumps(houses) == json.dumps(houses)
+    odd = {"s": 0, 1: [True, None, "é\"%s"], "empty": {}, "list": [], "n": [1, 2.5], 2.5: ({"%": 1},)}
+    assert encoder.encode(odd) == json.dumps(odd)
+
+
+def test_memo_follows_changed_settings(cores):
+    encoder = ChartEncoder()
+    core = json.loads(json.dumps(cores[0]))
+    first = encoder.encode(core)
+    core["settings"]["fixed_stars"].append("Regulus")
+    core["meta"]["ephemeris"]["flags"] = 2
+    assert encoder.encode(core) == json.dumps(core) != first
+    # equal but differently typed values are not the memoised text
+    for flags in (2.0, True, 1, 1.0, -0.0, 0.0):
+        core["meta"]["ephemeris"]["flags"] = flags
+        assert encoder.encode(core["meta"]) == json.dumps(core["meta"])
+
+
+def test_float_precision(cores):
+    encoder = ChartEncoder(4, COMPACT_SEPARATORS)
+    for core in cores:
+        text = encoder.encode(core)
+        data = json.loads(text)
+        assert list(data) == list(core)
+        sun = core["planets"]["Sun"]["lon_sidereal_deg"]
+        assert data["planets"]["Sun"]["lon_sidereal_deg"] == pytest.approx(sun, abs=5e-5)
+        assert data["houses"]["cusps_deg_sid"] == pytest.approx(core["houses"]["cusps_deg_sid"])
+        assert len(text) < len(json.dumps(core, separators=(",", ":")))
+
+    # ints stay ints
+    mixed = {"latitude_deg": 44, "lon": 1.5, "n": [1, 2], "m": [1.0, 2], "p": {"a": {"x": 3}}}
+    text = encoder.encode(mixed)
+    assert text == '{"latitude_deg":44,"lon":1.5000,"n":[1,2],"m":[1.0000,2],"p":{"a":{"x":3}}}'
+    data = json.loads(text)
+    assert data == mixed
+    assert [type(v) for v in (data["latitude_deg"], *data["n"], *data["m"], data["p"]["a"]["x"])] == [
+        int, int, int, float, int, int
+    ]
+
+    with pytest.raises(ValueError):
+        ChartEncoder(0)
+
+    buffer = bytearray(b"[")
+    n = encoder.encode_into(cores[0], buffer)
+    assert bytes(buffer[1:]) == encoder.encode_bytes(cores[0]) and n == len(buffer) - 1
+
+
+def test_non_finite_floats():
+    nan, inf = float("nan"), float("inf")
+    values = {"a": nan, "b": inf, "c": -inf, "d": 1.0}
+    objs = [values, [nan, 1.0], [inf, -inf], {"p": values}, {"p": {"x": 1.0}, "q": {"y": inf}}, {nan: 1, inf: 2}]
+    for obj in objs:
+        assert ChartEncoder().encode(obj) == json.dumps(obj)
+        assert ChartEncoder(separators=COMPACT_SEPARATORS).encode(obj) == json.dumps(obj, separators=(",", ":"))
+    assert ChartEncoder(2).encode([nan, inf, -inf, 1.0]) == "[NaN, Infinity, -Infinity, 1.00]"
+    assert ChartEncoder(2).encode({"a": inf, "b": 0.5}) == '{"a": Infinity, "b": 0.50}'
+
+
+def test_unserializable_values():
+    for obj in ({"a": {"b": object()}}, {"a": 1.0, "b": {1, 2}}, [object()]):
+        for encoder in (ChartEncoder(), ChartEncoder(3)):
+            with pytest.raises(TypeError, match="is not JSON serializable"):
+                encoder.encode(obj)
+
+
+def test_msgpack(cores, monkeypatch):
+    if serialize.msgpack is not None:
+        packed = ChartEncoder().encode_msgpack(cores[0])
+        assert serialize.msgpack.unpackb(packed) == json.loads(json.dumps(cores[0]))
+    monkeypatch.setattr(serialize, "msgpack", None)
+    with pytest.raises(ImportError):
+        ChartEncoder().encode_msgpack(cores[0])
@@ -0,0 +1,59 @@
+"""Incremental chart session must match full recomputation."""
+
+import pytest
+
+from astrocore import build_base_core
+from astrocore.eph import swiss
+from astrocore.eph.session import ChartSession
+
+PAYLOAD = {
+    "date": "1987-08-14",
+    "time": "08:30",
+    "tz_offset_hours": 4.0,
+    "latitude_deg": 44.7153132,
+    "longitude_deg": 42.9978716,
+    "settings": {"ayanamsa": "Lahiri", "node_type": "MEAN"},
+}
+
+
+def _strip(core):
+    core = dict(core)
+    core["meta"] = {k: v for k, v in core["meta"].items() if k != "calc_ms"}
+    return core
+
+
+@pytest.mark.parametrize("settings", [PAYLOAD["settings"], {"topocentric": True}])
+def test_session_matches_full_recompute(settings):
+    base = {**PAYLOAD, "settings": settings}
+    session = ChartSession(base)
+    assert _strip(session.compute()) == _strip(build_base_core(base))
+
+    edits = [
+        {"latitude_deg": 51.5, "longitude_deg": -0.12},
+        {"time": "08:31"},
+        {"longitude_deg": 139.7, "latitude_deg": 35.7, "elevation_m": 40.0},
+        {"date": "1990-01-01", "tz_offset_hours": -5.0},
+        {"time": "08:30", "date": "1987-08-14", "tz_offset_hours": 4.0},
+    ]
+    payload = dict(base)
+    for edit in edits:
+        payload.update(edit)
+        assert _strip(session.update(**edit)) == _strip(build_base_core(payload))
+
+
+def test_location_moves_reuse_time_state(monkeypatch):
+    session = ChartSession(PAYLOAD)
+    session.compute()
+    calls = []
+    real = swiss.calc_ut
+    monkeypatch.setattr(swiss, "calc_ut", lambda *a: (calls.append(a), real(*a))[1])
+    result = session.update(latitude_deg=10.0, longitude_deg=20.0)
+    assert calls == []
+    assert session.stats == {"time_hits": 1, "time_misses": 1}
+    result["planets"]["Sun"]["lon_sidereal_deg"] = -1.0
+    assert session.compute()["planets"]["Sun"]["lon_sidereal_deg"] >= 0.0
+
+
+def test_update_rejects_other_fields():
+    with pytest.raises(ValueError):
+        ChartSession(PAYLOAD).update(settings={})
@@ -0,0 +1,115 @@
+"""Fixed-star catalog positions and conjunctions."""
+
+import threading
+import time
+
+import pytest
+import swisseph as swe
+
+from astrocore import build_base_core
+from astrocore.config import DEFAULT_EPHE_PATH
+from astrocore.eph import stars, swiss
+from astrocore.eph.stars import BUILTIN_STARS, StarCatalog, core_conjunctions, get_catalog
+
+# agreement with swe.fixstar2_ut stated in the module docstring
+TOLERANCE_DEG = 2.0 / 3600.0
+
+
+def use_ephe_path(path):
+    """Point Swiss Ephemeris at ``path`` under the wrapper's lock."""
+    with swiss._swe_lock:
+        swe.set_ephe_path(str(path))
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    with open(tmp_path / "sefstars.txt", "w") as fh:
+        fh.write("# name, nomenclature, frame, RA, Dec, pm, rv, parallax, mag, DM\n")
+        for name, nomen, ra, dec, pm_ra, pm_dec, mag in BUILTIN_STARS:
+            fields = [name, nomen, "ICRS", *ra.split(), *dec.split(), pm_ra, pm_dec, 0, 0, mag, 0, 0]
+            fh.write(",".join(map(str, fields)) + "\n")
+        fh.write("Regulus B1950,alLeo,1950,10,05,42.6,+12,12,45,-17.0,0.0,0,0,1.4,0,0\n")
+    yield tmp_path
+    use_ephe_path(DEFAULT_EPHE_PATH)
+
+
+@pytest.mark.parametrize("jd_ut", [2415020.0, 2447022.0, 2488070.0])
+def test_positions_match_swiss(catalog_dir, jd_ut):
+    swiss.init_ephemeris()
+    catalog = StarCatalog.load(catalog_dir)
+    assert len(catalog) == len(BUILTIN_STARS)
+    pos = catalog.positions(jd_ut, bucket_days=0)
+    use_ephe_path(catalog_dir)
+    for i, name in enumerate(catalog.names):
+        ref = swiss.fixstar_ut(name, jd_ut, swe.FLG_SWIEPH)
+        assert (pos.lon_deg[i] - ref["lon_deg"] + 180.0) % 360.0 - 180.0 == pytest.approx(0.0, abs=TOLERANCE_DEG)
+        assert pos.lat_deg[i] == pytest.approx(ref["lat_deg"], abs=TOLERANCE_DEG)
+
+
+def test_positions_cached_per_bucket():
+    catalog = StarCatalog.builtin()
+    a = catalog.positions(2460000.1)
+    assert catalog.positions(2460000.4) is a
+    assert catalog.positions(2460001.1) is not a
+    assert list(a.sorted_lon_deg) == sorted(a.lon_deg)
+
+
+def test_conjunctions_wrap_and_filter():
+    catalog = StarCatalog.builtin()
+    jd = 2460000.5
+    pos = catalog.positions(jd)
+    alpheratz = pos.lon_deg[catalog.find("Alpheratz")]
+    regulus = pos.lon_deg[catalog.find("alLeo")]
+
+    hits = catalog.conjunctions(jd, {"A": regulus + 0.3, "B": (alpheratz - 359.5)}, orb_deg=0.6)
+    by_point = {(h["point"], h["star"]): h for h in hits}
+    assert by_point["A", "Regulus"]["separation_deg"] == pytest.approx(-0.3)
+    # input longitudes are taken modulo 360
+    assert ("B", "Alpheratz") in by_point
+    assert [abs(h["separation_deg"]) for h in hits] == sorted(abs(h["separation_deg"]) for h in hits)
+
+    edge = catalog.conjunctions(jd, {"X": 359.9}, orb_deg=alpheratz + 0.2)
+    assert "Alpheratz" in {h["star"] for h in edge}
+    faint = catalog.conjunctions(jd, {"A": regulus}, orb_deg=0.1, max_magnitude=1.0)
+    assert faint == []
+
+    ayanamsa = 24.0
+    sid = catalog.conjunctions(jd, {"A": regulus - ayanamsa}, orb_deg=0.1, ayanamsa_deg=ayanamsa)
+    assert sid[0]["star_lon_deg"] == pytest.approx(regulus - ayanamsa)
+
+
+def test_core_conjunctions():
+    core = build_base_core(
+        {
+            "date": "1987-08-14",
+            "time": "08:30",
+            "tz_offset_hours": 4.0,
+            "latitude_deg": 44.7153132,
+            "longitude_deg": 42.9978716,
+        }
+    )
+    hits = core_conjunctions(core, orb_deg=3.0)
+    points = set(core["planets"]) | {"asc_deg_sid", "mc_deg_sid"}
+    assert hits and {h["point"] for h in hits} <= points
+    assert all(abs(h["separation_deg"]) <= 3.0 for h in hits)
+
+
+def test_catalog_loads_once_across_threads(monkeypatch):
+    loads = []
+    load = StarCatalog.load
+
+    def slow_load(*args, **kwargs):
+        loads.append(1)
+        time.sleep(0.05)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(stars, "_catalog", None)
+    monkeypatch.setattr(StarCatalog, "load", staticmethod(slow_load))
+    got = []
+    threads = [threading.Thread(target=lambda: got.append(get_catalog())) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1
+    assert len(got) == 4 and all(c is got[0] for c in got)
@@ -0,0 +1,87 @@
+"""Tests for the persistent chart store."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from astrocore.constants import ASC_DEG_SID, MC_DEG_SID
+from astrocore.errors import InvalidInputError
+from astrocore.store import ChartStore, arc_bounds, sign_arc
+
+
+def _core(moon, asc):
+    return {
+        "planets": {"Moon": {"lon_sidereal_deg": moon}, "Sun": {"lon_sidereal_deg": 0.0}},
+        "axes": {ASC_DEG_SID: asc, MC_DEG_SID: (asc + 270.0) % 360.0},
+    }
+
+
+def _in_arc(x, start, end):
+    return (x - start) % 360.0 < (end - start) if end - start < 360.0 else True
+
+
+def test_arc_bounds_wrap():
+    assert arc_bounds(10.0, 13.0) == [(10.0, 13.0)]
+    assert arc_bounds(355.0, 365.0) == [(355.0, 360.0), (0.0, 5.0)]
+    assert arc_bounds(-5.0, 5.0) == [(355.0, 360.0), (0.0, 5.0)]
+    assert arc_bounds(0.0, 360.0) == [(0.0, 360.0)]
+
+
+def test_range_queries_match_scan(tmp_path):
+    rng = np.random.default_rng(5)
+    moons = rng.uniform(0.0, 360.0, 500).tolist()
+    ascs = rng.uniform(0.0, 360.0, 500).tolist()
+    with ChartStore(tmp_path / "charts.sqlite") as store:
+        ids = store.extend([_core(m, a) for m, a in zip(moons, ascs)])
+        assert len(store) == 500
+
+        leo = sign_arc(4)
+        got = store.query({"Moon": (10.0, 13.0), ASC_DEG_SID: leo})
+        expected = [
+            i for i, m, a in zip(ids, moons, ascs) if 10.0 <= m < 13.0 and _in_arc(a, *leo)
+        ]
+        assert got == expected
+
+        got = store.conjunctions("Moon", 358.0, 5.0)
+        assert got == [i for i, m in zip(ids, moons) if _in_arc(m, 353.0, 363.0)]
+        assert got
+
+    with ChartStore(tmp_path / "charts.sqlite") as reopened:
+        assert len(reopened) == 500
+        assert reopened.get(ids[3])["planets"]["Moon"]["lon_sidereal_deg"] == moons[3]
+
+
+def test_keys_and_validation():
+    store = ChartStore()
+    chart_id = store.append(_core(1.0, 2.0), key="abc")
+    assert store.ids_for_key("abc") == [chart_id]
+    assert store.fetch([chart_id])[0]["axes"][ASC_DEG_SID] == 2.0
+    with pytest.raises(InvalidInputError):
+        store.query({"Pluto": (0.0, 10.0)})
+    with pytest.raises(KeyError):
+        store.get(999)
+
+
+def test_concurrent_writers_get_distinct_ids(tmp_path):
+    path = tmp_path / "shared.sqlite"
+    ChartStore(path).close()
+    ids, errors = [], []
+    barrier = threading.Barrier(4)
+
+    def write(n):
+        try:
+            with ChartStore(path) as store:
+                barrier.wait()
+                for _ in range(20):
+                    ids.extend(store.extend([_core(float(n), 0.0)] * 5))
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sorted(ids) == list(range(1, 401))
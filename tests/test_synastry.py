@@ -0,0 +1,93 @@
+"""Tests for one-to-many synastry scoring."""
+
+import numpy as np
+import pytest
+
+from astrocore.constants import ASC_DEG_SID
+from derived.aspects import ASPECTS, DEFAULT_ORBS
+from derived.nakshatras import lon_to_nakshatra, nakshatra_index, NAKSHATRAS
+from derived.synastry import (
+    DEFAULT_ASPECT_WEIGHTS,
+    DEFAULT_PAIR_WEIGHTS,
+    STORE_BODIES,
+    TARA_SCORES,
+    ChartLongitudes,
+    score_charts,
+    top_matches,
+)
+
+
+def _core(lons):
+    values = dict(zip(STORE_BODIES, lons))
+    return {
+        "planets": {
+            name: {"lon_sidereal_deg": float(v)} for name, v in values.items() if name != ASC_DEG_SID
+        },
+        "axes": {ASC_DEG_SID: float(values[ASC_DEG_SID])},
+    }
+
+
+def _reference_score(q, s):
+    qd = dict(zip(STORE_BODIES, q))
+    sd = dict(zip(STORE_BODIES, s))
+    total = 0.0
+    for (bq, bs), w in DEFAULT_PAIR_WEIGHTS.items():
+        d = abs(qd[bq] - sd[bs]) % 360.0
+        sep = min(d, 360.0 - d)
+        for name, aw in DEFAULT_ASPECT_WEIGHTS.items():
+            total += w * aw * max(0.0, 1.0 - abs(sep - ASPECTS[name]) / DEFAULT_ORBS[name])
+    nq = NAKSHATRAS.index(lon_to_nakshatra(qd["Moon"])[0])
+    ns = NAKSHATRAS.index(lon_to_nakshatra(sd["Moon"])[0])
+    return total + float(TARA_SCORES[(ns - nq) % 27 % 9])
+
+
+@pytest.fixture
+def store_and_query():
+    rng = np.random.default_rng(3)
+    lons = rng.uniform(0.0, 360.0, size=(200, len(STORE_BODIES)))
+    store = ChartLongitudes.from_cores([_core(row) for row in lons], ids=[f"c{i}" for i in range(200)])
+    query = rng.uniform(0.0, 360.0, size=len(STORE_BODIES))
+    return lons, store, query
+
+
+def test_nakshatra_index_matches_scalar():
+    lons = np.linspace(0.0, 359.999, 1000)
+    idx = nakshatra_index(lons)
+    assert [NAKSHATRAS[i] for i in idx] == [lon_to_nakshatra(x)[0] for x in lons]
+
+
+def test_scores_match_reference(store_and_query):
+    lons, store, query = store_and_query
+    scores = score_charts(_core(query), store)
+    expected = [_reference_score(query, row) for row in lons]
+    assert scores == pytest.approx(expected, abs=1e-3)
+
+
+def test_top_matches_sorted_and_parallel_consistent(store_and_query):
+    _, store, query = store_and_query
+    scores = score_charts(_core(query), store)
+    best = top_matches(_core(query), store, k=5)
+    assert [b["score"] for b in best] == sorted(np.sort(scores)[-5:].tolist(), reverse=True)
+    parallel = top_matches(_core(query), store, k=5, workers=2, chunk_size=64)
+    assert [b["chart_id"] for b in parallel] == [b["chart_id"] for b in best]
+
+
+def test_store_shape_validation():
+    with pytest.raises(ValueError):
+        ChartLongitudes(np.arange(2), np.zeros((2, 3)), np.zeros(2))
+
+
+def test_boundary_moon_nakshatra_uses_float64():
+    lons = np.full(len(STORE_BODIES), 100.0)
+    lons[STORE_BODIES.index("Moon")] = 40.0 / 3.0 + 1e-8  # float32 rounds below the border
+    store = ChartLongitudes.from_cores([_core(lons)])
+    assert store.moon_nakshatra.tolist() == [nakshatra_index(lons[1])] == [1]
+
+
+def test_aspect_weights_need_orbs(store_and_query):
+    _, store, query = store_and_query
+    orbs = {k: v for k, v in DEFAULT_ORBS.items() if k != "trine"}
+    with pytest.raises(ValueError, match="no orb for aspects: trine"):
+        score_charts(_core(query), store, orbs=orbs)
+    with pytest.raises(ValueError, match="unknown aspects"):
+        score_charts(_core(query), store, aspect_weights={"quincunx": 1.0})
@@ -0,0 +1,75 @@
+"""Tests for topocentric computation paths."""
+
+import math
+
+import swisseph as swe
+
+from astrocore import build_base_core
+from astrocore.eph import swiss
+from astrocore.eph.topo import (
+    TopoRequest,
+    compute_topocentric_batch,
+    observer_geometry,
+    parallax_correct,
+)
+
+JD = 2447021.6875
+LOCATIONS = [(44.7153132, 42.9978716, 0.0), (-33.9, 18.4, 1500.0), (64.1, -21.9, 0.0)]
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+def _arc(a, b):
+    d = abs(a - b) % 360.0
+    return min(d, 360.0 - d)
+
+
+def test_parallax_matches_swiss_topocentric():
+    swiss.init_ephemeris()
+    geo = swiss.calc_ut(JD, swe.MOON, FLAGS)
+    for lat, lon, elev in LOCATIONS:
+        topo = swiss.calc_ut_topo([(JD, swe.MOON)], FLAGS, lon, lat, elev)[0]
+        lst_deg, eps = observer_geometry(JD, lon)
+        lon_t, lat_t, dist_t = parallax_correct(
+            geo["lon_deg"], geo["lat_deg"], geo["distance_au"], lat, lst_deg, eps, elev
+        )
+        assert _arc(float(lon_t), topo["lon_deg"]) < 2e-4
+        assert abs(float(lat_t) - topo["lat_deg"]) < 2e-4
+        assert math.isclose(float(dist_t), topo["distance_au"], rel_tol=1e-5)
+        assert _arc(geo["lon_deg"], topo["lon_deg"]) > 0.05
+
+
+def test_batch_sets_topo_once_per_location(monkeypatch):
+    swiss.init_ephemeris()
+    calls = []
+    real = swe.set_topo
+    monkeypatch.setattr(swe, "set_topo", lambda *a: (calls.append(a), real(*a)))
+    requests = [
+        TopoRequest(JD + k, lat, lon, elev) for k in range(4) for lat, lon, elev in LOCATIONS
+    ]
+    bodies = {"Sun": swe.SUN, "Moon": swe.MOON}
+    out = compute_topocentric_batch(requests, bodies)
+    assert len(calls) == len(LOCATIONS)
+    for req, res in zip(requests, out):
+        single = swiss.calc_ut_topo(
+            [(req.jd_ut, swe.MOON)], FLAGS, req.longitude_deg, req.latitude_deg, req.elevation_m
+        )[0]
+        assert res["Moon"] == single
+
+
+def test_core_topocentric_methods_agree():
+    payload = {
+        "date": "1987-08-14",
+        "time": "08:30",
+        "tz_offset_hours": 4.0,
+        "latitude_deg": 44.7153132,
+        "longitude_deg": 42.9978716,
+        "elevation_m": 500.0,
+        "settings": {"topocentric": True},
+    }
+    swiss_core = build_base_core(payload)
+    payload["settings"] = {"topocentric": True, "topocentric_method": "parallax"}
+    parallax_core = build_base_core(payload)
+    for name in ("Sun", "Moon", "Mars"):
+        a = swiss_core["planets"][name]["lon_sidereal_deg"]
+        b = parallax_core["planets"][name]["lon_sidereal_deg"]
+        assert _arc(a, b) < 2e-4
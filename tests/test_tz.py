@@ -0,0 +1,87 @@
+"""IANA time zone resolution through cached transition tables."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from astrocore import build_base_core
+from astrocore.errors import InvalidInputError
+from astrocore.utils import tz
+from astrocore.utils.time import compute_time, jd_ut_array
+
+ZONES = ["Europe/Berlin", "America/New_York", "Australia/Lord_Howe", "Pacific/Apia", "Asia/Kolkata"]
+EPOCH = datetime(1970, 1, 1)
+
+
+def _zoneinfo(name, local_sec):
+    zone = ZoneInfo(name)
+    local = EPOCH + timedelta(seconds=local_sec)
+    aware = local.replace(tzinfo=zone)
+    offset = int(aware.utcoffset().total_seconds())
+    if offset == int(local.replace(tzinfo=zone, fold=1).utcoffset().total_seconds()):
+        return offset, "ok"
+    back = aware.astimezone(timezone.utc).astimezone(zone).replace(tzinfo=None)
+    return offset, "ambiguous" if back == local else "nonexistent"
+
+
+@pytest.mark.parametrize("name", ZONES)
+def test_table_matches_zoneinfo(name):
+    rng = random.Random(name)
+    table = tz.zone_table(name)
+    samples = [rng.randint(-6_000_000_000, 4_200_000_000) for _ in range(2000)]
+    for t, before in zip(table.transitions_utc, table.offsets_sec):
+        samples += [t + before + d for d in (-3601, -1, 0, 1, 1799, 3600, 5400)]
+    expected = [_zoneinfo(name, s) for s in samples]
+    assert [tz.resolve_offset(name, s) for s in samples] == expected
+
+    offsets, status = tz.resolve_offsets(name, samples)
+    assert list(zip(offsets.tolist(), [tz.STATUSES[i] for i in status])) == expected
+
+
+def test_compute_time_reports_dst_edges():
+    ok = compute_time("2021-07-01", "12:00", tz_name="Europe/Berlin")
+    assert ok["tz_offset_hours"] == 2.0
+    assert ok["tz_status"] == "ok"
+    zone = {k: ok[k] for k in ("tz_name", "tz_offset_hours", "tz_status")}
+    assert ok == {**compute_time("2021-07-01", "12:00", 2.0), **zone}
+
+    gap = compute_time("2021-03-28", "02:30", tz_name="Europe/Berlin")
+    assert (gap["tz_status"], gap["tz_offset_hours"]) == ("nonexistent", 1.0)
+    overlap = compute_time("2021-10-31", "02:30", tz_name="Europe/Berlin")
+    assert (overlap["tz_status"], overlap["tz_offset_hours"]) == ("ambiguous", 2.0)
+
+    with pytest.raises(InvalidInputError):
+        compute_time("2021-07-01", "12:00")
+    with pytest.raises(InvalidInputError):
+        compute_time("2021-07-01", "12:00", 1.0, "Europe/Berlin")
+    with pytest.raises(InvalidInputError, match="time zone"):
+        compute_time("2021-07-01", "12:00", tz_name="Mars/Olympus_Mons")
+
+
+def test_jd_ut_array_matches_scalar():
+    dates = ["1944-06-06", "1987-08-14", "2021-03-28", "2021-10-31", "2060-01-01"]
+    times = ["06:30", "08:30:15", "02:30", "02:30", "00:00"]
+    jd, status = jd_ut_array(dates, times, "Europe/Berlin")
+    for d, t, j, s in zip(dates, times, jd, status):
+        scalar = compute_time(d, t, tz_name="Europe/Berlin")
+        assert j == pytest.approx(scalar["jd_ut"], abs=1e-8)
+        assert s == scalar["tz_status"]
+    assert isinstance(jd, np.ndarray)
+
+
+def test_payload_accepts_zone_name():
+    payload = {
+        "date": "1987-08-14",
+        "time": "08:30",
+        "latitude_deg": 44.7153132,
+        "longitude_deg": 42.9978716,
+        "settings": {"node_type": "MEAN"},
+    }
+    named = build_base_core({**payload, "tz_name": "Europe/Moscow"})
+    fixed = build_base_core({**payload, "tz_offset_hours": 4.0})
+    assert named["time"]["tz_offset_hours"] == 4.0
+    assert named["time"]["jd_ut"] == fixed["time"]["jd_ut"]
+    assert named["planets"] == fixed["planets"]
@@ -1,8 +1,16 @@
 import math
 
+import numpy as np
 import pytest
 
-from astrocore.utils.dms import dec_to_dms360, format_dms360
+from astrocore.utils.angles import mod360, mod360_array
+from astrocore.utils.dms import (
+    dec_to_dms360,
+    dec_to_dms360_array,
+    format_dms360,
+    format_dms360_array,
+)
+from derived.signs import SIGNS, lon_to_sign_deg, lon_to_sign_index
 
 
 def test_basic_case():
@@ -38,3 +46,47 @@ def test_edge_cases(value, expected_str):
 def test_invalid_values(value):
     with pytest.raises(ValueError):
         dec_to_dms360(value)
+
+
+def _property_samples():
+    rng = np.random.default_rng(2024)
+    edges = [0.0, -0.0, 360.0, -360.0, 359.9999996, -0.0001, 720.5, 29.9999999, 30.0]
+    # values sitting exactly on rounding boundaries of the seconds field
+    steps = rng.integers(0, 360 * 3600 * 1000, 2000) / 3600000.0
+    halves = (rng.integers(0, 360 * 3600 * 1000, 2000) + 0.5) / 3600000.0
+    uniform = rng.uniform(-1080.0, 1080.0, 5000)
+    return np.concatenate([edges, steps, halves, steps - 1e-12, uniform])
+
+
+@pytest.mark.parametrize("sec_precision", [0, 1, 3, 5])
+def test_array_dms_matches_scalar(sec_precision):
+    values = _property_samples()
+    deg, minute, sec = dec_to_dms360_array(values, sec_precision=sec_precision)
+    for i, v in enumerate(values.tolist()):
+        assert (int(deg[i]), int(minute[i]), float(sec[i])) == dec_to_dms360(
+            v, sec_precision=sec_precision
+        )
+
+
+@pytest.mark.parametrize("sec_precision", [0, 2, 3, 4])
+@pytest.mark.parametrize("zero_pad", [True, False])
+def test_array_format_matches_scalar(sec_precision, zero_pad):
+    values = _property_samples()
+    got = format_dms360_array(values, sec_precision=sec_precision, zero_pad=zero_pad)
+    expected = [
+        format_dms360(v, sec_precision=sec_precision, zero_pad=zero_pad) for v in values.tolist()
+    ]
+    assert got == expected
+
+
+def test_array_invalid_values():
+    with pytest.raises(ValueError):
+        dec_to_dms360_array(np.array([1.0, math.nan]))
+
+
+def test_array_angles_and_signs_match_scalar():
+    values = _property_samples()
+    assert mod360_array(values).tolist() == [mod360(v) for v in values.tolist()]
+    idx, deg = lon_to_sign_index(values)
+    for i, v in enumerate(values.tolist()):
+        assert (SIGNS[idx[i]], float(deg[i])) == lon_to_sign_deg(v)